@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 본문 추출 (상용구 제거 휴리스틱)
+사이트마다 선택자를 따로 두지 않고, 메뉴/광고/댓글 같은 상용구 요소를 지운 뒤
+문단 텍스트가 가장 많이 모인 블록을 본문으로 고릅니다. 링크 텍스트 비율이 높은
+블록(관련 기사 목록, 메뉴 등)은 점수를 깎습니다.
+<p> 문단을 쓰는 사이트와 <br>로 줄을 나누는 사이트(국내 언론사에 많음)를 모두 처리합니다.
+"""
+
+import re
+
+from lxml import etree
+from lxml import html as lxml_html
+
+
+# 통째로 지울 태그
+_DROP_TAGS = ('script', 'style', 'noscript', 'iframe', 'form', 'header', 'footer', 'nav',
+              'aside', 'button', 'select', 'svg', 'figure')
+# class/id에 이 단어가 들어간 요소는 상용구로 보고 지움
+_BOILERPLATE_RE = re.compile(
+    r'comment|reply|footer|header|gnb|lnb|\bnav|menu|sidebar|side_|aside|related|recommend|'
+    r'popular|ranking|share|sns|social|banner|\bads?\b|advert|promo|sponsor|copyright|'
+    r'subscribe|newsletter|breadcrumb|tag_?list|journalist|byline',
+    re.IGNORECASE
+)
+# 상용구 단어가 있어도 본문을 감싸는 경우가 많은 이름은 남김
+_CONTENT_RE = re.compile(r'article|content|body|main|story|text|view|post', re.IGNORECASE)
+_KEEP_TAGS = frozenset({'html', 'body', 'main', 'article'})
+# 점수를 매길 블록 태그
+_BLOCK_TAGS = ('p', 'div', 'td', 'pre', 'article', 'section', 'main', 'blockquote')
+# 줄바꿈으로 취급할 태그
+_BREAK_TAGS = frozenset({'br', 'p', 'div', 'li', 'tr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+                         'blockquote', 'section', 'article', 'pre'})
+_SPACE_RE = re.compile(r'[ \t\r\f\v 　]+')
+
+MIN_PARAGRAPH_LENGTH = 25
+MIN_LINE_LENGTH = 2
+
+_META_TITLE = etree.XPath("//meta[@property='og:title']/@content")
+_META_PUBLISHED = etree.XPath(
+    "//meta[@property='article:published_time' or @name='article:published_time' or "
+    "@itemprop='datePublished' or @name='pubdate']/@content"
+)
+_TITLE = etree.XPath('//title/text()')
+
+
+def _own_text(element):
+    """하위 요소 안의 텍스트를 제외한, 요소에 직접 붙은 텍스트 (<br>로 나뉜 줄 포함)"""
+    parts = [element.text or '']
+    for child in element:
+        if child.tag == 'br' or not isinstance(child.tag, str):
+            parts.append(child.tail or '')
+        elif child.tag in ('a', 'b', 'strong', 'em', 'i', 'span', 'font', 'u'):
+            # 문단 안의 인라인 요소는 문단 텍스트로 취급
+            parts.append(child.text_content())
+            parts.append(child.tail or '')
+        else:
+            parts.append(child.tail or '')
+    return _SPACE_RE.sub(' ', ''.join(parts)).strip()
+
+
+def _link_density(element):
+    total = len(element.text_content())
+    if not total:
+        return 1.0
+    links = sum(len(link.text_content()) for link in element.iter('a'))
+    return links / total
+
+
+def _remove_boilerplate(root):
+    for element in list(root.iter(*_DROP_TAGS)):
+        element.drop_tree()
+    for element in list(root.iter(etree.Element)):
+        if element.tag in _KEEP_TAGS or element.getparent() is None:
+            continue
+        marker = f"{element.get('class', '')} {element.get('id', '')}"
+        if _BOILERPLATE_RE.search(marker) and not _CONTENT_RE.search(marker):
+            element.drop_tree()
+
+
+def _best_block(root):
+    scores = {}
+    for element in root.iter(*_BLOCK_TAGS):
+        text = _own_text(element)
+        if len(text) < MIN_PARAGRAPH_LENGTH:
+            continue
+        # 문단 길이와 문장 부호 수로 점수 (긴 문단일수록 본문일 가능성이 큼)
+        score = 1 + min(len(text) / 100, 3) + text.count(',') + text.count('.') / 2
+        if element.tag == 'p':
+            # <p> 문단은 부모 블록이 본문 후보
+            targets = (element.getparent(), 1.0), (element.getparent().getparent(), 0.5)
+        else:
+            # <br>로 줄을 나누는 블록은 자기 자신이 본문 후보
+            targets = (element, 1.0), (element.getparent(), 0.5)
+        for target, weight in targets:
+            if target is not None:
+                scores[target] = scores.get(target, 0.0) + score * weight
+    if not scores:
+        return None
+    return max(scores, key=lambda element: scores[element] * (1 - _link_density(element)))
+
+
+def _block_lines(element):
+    """블록의 텍스트를 줄 단위로 모읍니다 (<br>과 블록 태그에서 줄바꿈)."""
+    pieces = []
+
+    def walk(node):
+        if node.tag in _BREAK_TAGS:
+            pieces.append('\n')
+        if node.text:
+            pieces.append(node.text)
+        for child in node:
+            if isinstance(child.tag, str):
+                walk(child)
+            if child.tail:
+                pieces.append(child.tail)
+        if node.tag in _BREAK_TAGS:
+            pieces.append('\n')
+
+    walk(element)
+    lines = (_SPACE_RE.sub(' ', line).strip() for line in ''.join(pieces).split('\n'))
+    return [line for line in lines if len(line) >= MIN_LINE_LENGTH]
+
+
+def parse_article(markup, encoding=None):
+    """
+    기사 페이지에서 제목, 게시 시각, 본문을 추출합니다.
+
+    Args:
+        markup (bytes 또는 str): 기사 HTML
+        encoding (str): 응답 헤더에 명시된 문자 인코딩 (없으면 <meta charset>으로 판별)
+
+    Returns:
+        dict: {'title', 'published', 'body'} (본문을 찾지 못하면 body는 '')
+    """
+    if isinstance(markup, str):
+        markup = markup.encode('utf-8')
+        encoding = 'utf-8'
+    if not markup.strip():
+        return {'title': None, 'published': None, 'body': ''}
+    parser = lxml_html.HTMLParser(encoding=encoding) if encoding else None
+    try:
+        root = lxml_html.document_fromstring(markup, parser=parser)
+    except (etree.ParserError, LookupError):
+        root = lxml_html.document_fromstring(markup, parser=lxml_html.HTMLParser(encoding='utf-8'))
+
+    titles = _META_TITLE(root) or _TITLE(root)
+    published = _META_PUBLISHED(root)
+    result = {
+        'title': titles[0].strip() if titles else None,
+        'published': published[0].strip() if published else None,
+        'body': '',
+    }
+
+    _remove_boilerplate(root)
+    block = _best_block(root)
+    if block is not None:
+        result['body'] = '\n'.join(_block_lines(block))
+    return result
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 본문 수집 파이프라인
+검색 결과에서 모은 기사 링크를 받아 본문 페이지를 동시에 내려받고, 상용구를 걷어낸 본문을
+추출해 기사 저장소에 묶음 단위로 저장합니다.
+
+- 동시에 진행하는 요청 수(max_in_flight)와 호스트별 동시 요청 수(max_per_host)를 따로 제한해
+  한 언론사가 느려도 다른 언론사 요청이 막히지 않습니다. 호스트 자리가 찬 링크는 호스트별
+  대기열에 미뤄 두고, 검색 결과 링크는 소스를 번갈아 꺼내 한 호스트의 링크만 줄지어 들어오지 않게 합니다.
+- 링크는 빈 작업 자리가 생길 때만 입력에서 꺼내고, 결과는 소비자가 가져갈 때만 다음 요청을
+  시작하므로(역압) 링크가 아무리 많아도 메모리에는 진행 중인 작업만 남습니다.
+- 기사 페이지는 max_bytes까지만 읽어 비정상적으로 큰 응답이 메모리를 차지하지 않게 합니다.
+
+사용 예:
+    python article_pipeline.py -k "반도체 관련주" HBM -s daum yna -n 50
+    python article_pipeline.py -k HBM -w 32 --per-host 4 --jsonl bodies.jsonl
+    NEWS_BASE_URL=http://127.0.0.1:8765 python article_pipeline.py -k 부하테스트 -n 200
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import closing
+from urllib.parse import urlsplit
+
+from article_extract import parse_article
+from article_store import get_default_store
+from batch_crawl import DEFAULT_SOURCES, SOURCE_ALIASES, resolve_source
+from http_cache import get_default_cache
+from metrics import OUTCOME_ERROR, OUTCOME_OK, get_default_metrics
+from news_sources import create_sources
+from rate_limiter import HostRateLimiter, default_limiter
+from resilience import raise_if_circuit_open
+from transport import get_default_session, iter_chunks
+
+
+# 언론사 기사 페이지의 호스트별 기본 한도: (초당 요청 수, 버스트)
+ARTICLE_RATE = 2.0
+ARTICLE_BURST = 4
+# 호스트 자리가 차서 미뤄 둘 수 있는 링크 수 (max_in_flight의 배수)
+DEFERRED_FACTOR = 4
+# 기사 페이지 하나에서 읽을 최대 바이트 수
+MAX_ARTICLE_BYTES = 2 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+# 원문 주소를 알려 주지 않는 중계 페이지 (자바스크립트로 이동)
+_REDIRECT_HOSTS = frozenset({'news.google.com'})
+# 기본 소스: 구글 뉴스 RSS는 <link>와 설명의 링크가 모두 중계 페이지이고
+# <source url>은 언론사 홈 주소뿐이라 원문 주소를 얻을 수 없어 제외
+PIPELINE_SOURCES = tuple(source for source in DEFAULT_SOURCES if source != "구글 뉴스")
+
+
+def _host(url):
+    return urlsplit(url).hostname or ''
+
+
+def _charset(response):
+    """Content-Type 헤더에 명시된 문자 인코딩 (없으면 None: 본문의 <meta charset>으로 판별)"""
+    match = _CHARSET_RE.search(response.headers.get('Content-Type', ''))
+    return match.group(1) if match else None
+
+
+class ArticlePipeline:
+    def __init__(self, session=None, rate_limiter=None, max_in_flight=16, max_per_host=4,
+                 max_bytes=MAX_ARTICLE_BYTES, metrics=None):
+        """
+        Args:
+            session (requests.Session): 공유 세션 (없으면 기본 세션)
+            rate_limiter (HostRateLimiter): 호스트별 속도 제한기
+                                            (없으면 언론사 호스트용 기본 한도를 쓰는 새 제한기)
+            max_in_flight (int): 동시에 진행할 최대 요청 수
+            max_per_host (int): 호스트 하나에 동시에 보낼 최대 요청 수
+            max_bytes (int): 기사 페이지 하나에서 읽을 최대 바이트 수
+            metrics (CrawlMetrics): 계측기 (없으면 기본 계측기)
+        """
+        self.session = session or get_default_session()
+        # 검색 사이트는 기본 한도, 그 밖의 언론사 호스트는 기사 페이지용 한도 사용
+        self.rate_limiter = rate_limiter or HostRateLimiter(default_rate=ARTICLE_RATE,
+                                                            default_burst=ARTICLE_BURST)
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_per_host = max(1, max_per_host)
+        self.max_bytes = max_bytes
+        self.metrics = metrics or get_default_metrics()
+
+    def fetch(self, record):
+        """
+        기사 페이지 하나를 내려받아 본문을 추출합니다. 예외를 던지지 않고 error에 기록합니다.
+
+        Args:
+            record (dict): 'link'(또는 'url')가 있는 링크 레코드 ('title', 'source', 'keyword'는 그대로 전달)
+
+        Returns:
+            dict: {'url', 'final_url', 'title', 'body', 'published', 'status', 'error',
+                   'fetched_at', 'source', 'keyword'}
+        """
+        url = record.get('link') or record.get('url')
+        result = {
+            'url': url,
+            'final_url': None,
+            'title': record.get('title'),
+            'body': '',
+            'published': None,
+            'status': None,
+            'error': None,
+            'fetched_at': time.time(),
+            'source': record.get('source'),
+            'keyword': record.get('keyword'),
+        }
+        stats = {}
+        parse_time = 0.0
+        response = None
+        try:
+            # 회로가 열린 소스이면 속도 제한 토큰을 쓰지 않고 바로 실패
+            raise_if_circuit_open(self.session, url)
+            self.rate_limiter.wait(url)
+            response = self.session.get(url, stream=True)
+            with closing(response):
+                result['status'] = response.status_code
+                result['final_url'] = response.url
+                response.raise_for_status()
+                if _host(response.url) in _REDIRECT_HOSTS:
+                    raise ValueError("원문 주소로 이동하지 않는 중계 페이지")
+                content_type = response.headers.get('Content-Type', '')
+                if content_type and 'html' not in content_type:
+                    raise ValueError(f"HTML이 아닌 응답: {content_type}")
+
+                chunks = []
+                for chunk in iter_chunks(response, CHUNK_SIZE, stats=stats):
+                    chunks.append(chunk)
+                    if stats['bytes'] >= self.max_bytes:
+                        break
+                markup = b''.join(chunks)[:self.max_bytes]
+
+            started = time.perf_counter()
+            article = parse_article(markup, _charset(response))
+            parse_time = time.perf_counter() - started
+            result['title'] = article['title'] or result['title']
+            result['published'] = article['published']
+            result['body'] = article['body']
+        except Exception as e:
+            result['error'] = str(e) or type(e).__name__
+            self.metrics.observe(url, OUTCOME_ERROR, response, stats.get('download', 0.0),
+                                 nbytes=stats.get('bytes', 0), error=result['error'])
+            return result
+
+        self.metrics.observe(url, OUTCOME_OK, response, stats.get('download', 0.0), parse_time,
+                             stats.get('bytes', 0), 1 if result['body'] else 0)
+        return result
+
+    def iter_articles(self, records):
+        """
+        링크 레코드들의 본문을 동시에 수집하고 끝나는 순서대로 반환합니다.
+        작업 자리가 빌 때만 입력에서 링크를 꺼내고, 호스트별 한도가 찬 링크는 잠시 미뤄 둡니다.
+
+        Args:
+            records (iterable): 링크 레코드들 (제너레이터도 가능, 필요한 만큼만 꺼냄)
+
+        Yields:
+            dict: fetch() 결과
+        """
+        records = iter(records)
+        pending = {}    # future → 호스트
+        per_host = {}   # 호스트 → 진행 중인 요청 수
+        deferred = {}   # 호스트 → 자리를 기다리는 링크 (deque)
+        deferred_count = 0
+        max_deferred = self.max_in_flight * DEFERRED_FACTOR
+        exhausted = False
+
+        def submit(record, host):
+            pending[executor.submit(self.fetch, record)] = host
+            per_host[host] = per_host.get(host, 0) + 1
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            while True:
+                # 미뤄 둔 링크 중 자리가 빈 호스트의 것부터 시작
+                for host in list(deferred):
+                    queue = deferred[host]
+                    while (queue and len(pending) < self.max_in_flight and
+                           per_host.get(host, 0) < self.max_per_host):
+                        submit(queue.popleft(), host)
+                        deferred_count -= 1
+                    if not queue:
+                        del deferred[host]
+
+                # 미룬 링크는 모든 호스트를 합쳐 max_deferred개까지만 쌓아 메모리를 제한
+                # (한 호스트의 링크가 밀려 있어도 이 한도까지는 다른 호스트 링크를 계속 꺼내 시작)
+                while (not exhausted and len(pending) < self.max_in_flight and
+                       deferred_count < max_deferred):
+                    record = next(records, None)
+                    if record is None:
+                        exhausted = True
+                        break
+                    host = _host(record.get('link') or record.get('url') or '')
+                    if host not in deferred and per_host.get(host, 0) < self.max_per_host:
+                        submit(record, host)
+                    else:
+                        deferred.setdefault(host, deque()).append(record)
+                        deferred_count += 1
+
+                # 미룬 링크가 있으면 그 호스트의 요청이 진행 중이므로 pending도 비어 있지 않음
+                if not pending:
+                    return
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    host = pending.pop(future)
+                    per_host[host] -= 1
+                    yield future.result()
+
+    def iter_results(self, records, store=None, batch_size=20, skip_existing=True,
+                     save_links=False):
+        """
+        본문을 수집하면서 기사 저장소에 batch_size개씩 묶어 저장합니다.
+
+        Args:
+            records (iterable): 링크 레코드들
+            store (ArticleStore): 본문을 저장할 저장소 (없으면 저장하지 않음)
+            batch_size (int): 한 트랜잭션으로 저장할 결과 수
+            skip_existing (bool): 저장소에 본문이 이미 있는 URL은 요청하지 않음
+            save_links (bool): 링크 레코드도 본문과 같은 트랜잭션으로 제목 저장소에 저장
+
+        Yields:
+            dict: fetch() 결과
+        """
+        links = []
+        if store is not None and save_links:
+            records = self._collect(records, links)
+        if store is not None and skip_existing:
+            records = self._skip_fetched(records, store)
+        batch = []
+        try:
+            for result in self.iter_articles(records):
+                if store is not None:
+                    batch.append(result)
+                    if len(batch) >= batch_size:
+                        store.save_bodies(batch, links)
+                        batch = []
+                        links.clear()
+                yield result
+        finally:
+            # 소비자가 중간에 멈춰도 받은 결과는 저장
+            if batch or links:
+                store.save_bodies(batch, links)
+
+    def run(self, records, store, batch_size=20, skip_existing=True):
+        """
+        iter_results를 끝까지 실행하고 요약을 반환합니다.
+
+        Returns:
+            dict: {'fetched', 'errors', 'empty'} (empty: 본문을 찾지 못한 페이지 수)
+        """
+        summary = {'fetched': 0, 'errors': 0, 'empty': 0}
+        for result in self.iter_results(records, store, batch_size, skip_existing):
+            if result['error']:
+                summary['errors'] += 1
+            elif not result['body']:
+                summary['empty'] += 1
+            else:
+                summary['fetched'] += 1
+        return summary
+
+    @staticmethod
+    def _collect(records, links):
+        """지나가는 링크 레코드를 links에 모아 둡니다 (다음 저장 때 함께 기록)."""
+        for record in records:
+            links.append(record)
+            yield record
+
+    @staticmethod
+    def _skip_fetched(records, store, lookup_size=200):
+        """같은 실행에서 중복된 링크와 저장소에 이미 본문이 있는 링크를 걸러냅니다."""
+        seen = set()
+        batch = []
+
+        def flush():
+            fetched = store.fetched_urls(record['link'] for record in batch)
+            for record in batch:
+                if record['link'] not in fetched:
+                    yield record
+            batch.clear()
+
+        for record in records:
+            link = record.get('link') or record.get('url')
+            if not link or link in seen:
+                continue
+            seen.add(link)
+            batch.append(dict(record, link=link))
+            if len(batch) >= lookup_size:
+                yield from flush()
+        yield from flush()
+
+
+def iter_link_records(keywords, sources=PIPELINE_SOURCES, limit=None):
+    """
+    키워드×소스 검색 결과의 기사 링크 레코드를 반환합니다 (기본 세션/캐시 사용).
+    소스마다 키워드 순서대로 읽되 소스끼리는 한 건씩 번갈아 꺼내, 한 소스(대개 한 호스트)의
+    링크만 연달아 들어가 파이프라인의 호스트 자리를 막지 않게 합니다.
+    원문 주소가 없는 중계 링크(구글 뉴스)는 건너뛰고 개수만 알립니다.
+
+    Yields:
+        dict: {'title', 'link', 'source', 'keyword'}
+    """
+    news_sources = create_sources(get_default_session(), default_limiter, get_default_cache(),
+                                  names=sources)
+    # 소스별로 응답 하나만 열어 두도록 키워드는 소스 안에서 차례대로
+    streams = deque(_iter_source_links(news_sources[source], keywords, limit) for source in sources)
+    while streams:
+        stream = streams.popleft()
+        record = next(stream, None)
+        if record is not None:
+            streams.append(stream)
+            yield record
+
+
+def _iter_source_links(news_source, keywords, limit):
+    for keyword in keywords:
+        skipped = 0
+        try:
+            for record in news_source.iter_links(keyword, limit):
+                if _host(record['link']) in _REDIRECT_HOSTS:
+                    skipped += 1
+                    continue
+                yield record
+        except Exception as e:
+            print(f"{news_source.name} '{keyword}' 링크 수집 중 오류 발생: {e}")
+        if skipped:
+            print(f"⏭️ {news_source.name} '{keyword}': 원문 주소를 알 수 없는 중계 링크 {skipped}개 건너뜀")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="검색 결과 기사 본문 수집")
+    parser.add_argument('-k', '--keywords', nargs='+', required=True, help="검색 키워드들")
+    parser.add_argument('-s', '--sources', nargs='+', default=None,
+                        help=f"소스들 ({', '.join(SOURCE_ALIASES)}). 기본값: daum yna")
+    parser.add_argument('-n', '--limit', type=int, default=None, help="키워드×소스당 최대 기사 수")
+    parser.add_argument('-w', '--workers', type=int, default=16, help="동시 요청 수 (기본값: 16)")
+    parser.add_argument('--per-host', type=int, default=4, help="호스트별 동시 요청 수 (기본값: 4)")
+    parser.add_argument('--batch-size', type=int, default=20, help="한 번에 저장할 결과 수 (기본값: 20)")
+    parser.add_argument('--refetch', action='store_true', help="이미 본문이 있는 기사도 다시 수집")
+    parser.add_argument('--jsonl', help="결과를 한 줄에 하나씩 저장할 JSON Lines 파일")
+    args = parser.parse_args(argv)
+
+    try:
+        args.sources = [resolve_source(name) for name in args.sources] if args.sources else list(PIPELINE_SOURCES)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def main(argv=None):
+    """기사 본문 수집 실행 함수"""
+    args = parse_args(argv)
+    store = get_default_store()
+    pipeline = ArticlePipeline(max_in_flight=args.workers, max_per_host=args.per_host)
+
+    print(f"기사 본문 수집 시작: 키워드 {len(args.keywords)}개 × 소스 {len(args.sources)}개")
+    jsonl = open(args.jsonl, 'w', encoding='utf-8') if args.jsonl else None
+    summary = {'fetched': 0, 'errors': 0, 'empty': 0}
+    started = time.perf_counter()
+    try:
+        # 링크 레코드는 본문과 같은 트랜잭션으로 제목 저장소에도 누적
+        records = iter_link_records(args.keywords, args.sources, args.limit)
+        results = pipeline.iter_results(records, store, args.batch_size, not args.refetch,
+                                        save_links=True)
+        for count, result in enumerate(results, 1):
+            if result['error']:
+                summary['errors'] += 1
+                print(f"{count:4d}. ❌ {result['url']} ({result['error']})")
+            else:
+                summary['fetched' if result['body'] else 'empty'] += 1
+                print(f"{count:4d}. [{result['source']}] {result['title']} ({len(result['body'])}자)")
+            if jsonl:
+                jsonl.write(json.dumps(result, ensure_ascii=False) + '\n')
+    finally:
+        if jsonl:
+            jsonl.close()
+    elapsed = time.perf_counter() - started
+
+    total = sum(summary.values())
+    per_minute = 60 * total / elapsed if elapsed else 0.0
+    print(f"\n✅ 본문 수집 완료! 성공 {summary['fetched']}개, 본문 없음 {summary['empty']}개, "
+          f"실패 {summary['errors']}개 ({elapsed:.1f}초, 분당 {per_minute:.0f}개)")
+    if args.jsonl:
+        print(f"📁 저장된 파일: {args.jsonl}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
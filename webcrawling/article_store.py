@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite 기반 뉴스 기사 저장소
+실행할 때마다 덮어쓰는 CSV/XLSX 대신 수집한 제목을 누적 저장하고,
+이번 실행에서 처음 본 기사만 골라 알려 줍니다.
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+
+from dedup import normalize_title
+
+
+DEFAULT_STORE_PATH = 'news_articles.sqlite3'
+
+
+def title_hash(title):
+    """
+    정규화한 제목의 해시를 만듭니다 (공백/엔티티 차이만 있는 제목은 같은 해시).
+
+    Args:
+        title (str): 뉴스 제목
+
+    Returns:
+        str: SHA-1 16진수 문자열
+    """
+    return hashlib.sha1(normalize_title(title).encode('utf-8')).hexdigest()
+
+
+class ArticleStore:
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        """
+        Args:
+            path (str): SQLite 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                title_hash TEXT NOT NULL,
+                source TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                link TEXT,
+                collected_at REAL NOT NULL,
+                last_seen_at REAL NOT NULL,
+                UNIQUE (title_hash, keyword)
+            );
+            CREATE INDEX IF NOT EXISTS idx_articles_source ON articles (source, collected_at);
+            CREATE INDEX IF NOT EXISTS idx_articles_keyword ON articles (keyword, collected_at);
+            CREATE INDEX IF NOT EXISTS idx_articles_collected ON articles (collected_at);
+            CREATE TABLE IF NOT EXISTS article_bodies (
+                url TEXT PRIMARY KEY,
+                final_url TEXT,
+                title TEXT,
+                body TEXT,
+                published TEXT,
+                status INTEGER,
+                error TEXT,
+                fetched_at REAL NOT NULL
+            );
+        """)
+        self._conn.commit()
+
+    def upsert(self, records):
+        """
+        기사 레코드를 저장합니다. 이미 있는 기사는 마지막 확인 시각을 갱신하고 비어 있던 링크를 채웁니다.
+
+        Args:
+            records (iterable): {'title', 'source', 'keyword', 'link'(선택),
+                                 'collected_at'(선택, epoch 초)} 딕셔너리들
+
+        Returns:
+            list: 이번에 새로 저장된 레코드 리스트
+        """
+        with self._lock:
+            with self._conn:
+                return self._upsert(records)
+
+    def _upsert(self, records):
+        """upsert 본체 (잠금과 트랜잭션 안에서 호출)"""
+        new_records = []
+        now = time.time()
+        for record in records:
+            collected_at = record.get('collected_at') or now
+            digest = title_hash(record['title'])
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO articles "
+                "(title, title_hash, source, keyword, link, collected_at, last_seen_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (record['title'], digest, record['source'], record['keyword'],
+                 record.get('link'), collected_at, collected_at)
+            )
+            if cursor.rowcount:
+                new_records.append(dict(record, collected_at=collected_at))
+            else:
+                # 제목만 먼저 저장된 기사는 링크를 나중에 알게 되면 채움
+                self._conn.execute(
+                    "UPDATE articles SET last_seen_at = ?, link = COALESCE(link, ?) "
+                    "WHERE title_hash = ? AND keyword = ?",
+                    (collected_at, record.get('link'), digest, record['keyword'])
+                )
+        return new_records
+
+    def upsert_titles(self, titles, source, keyword):
+        """
+        한 소스/키워드에서 수집한 제목들을 저장합니다.
+
+        Args:
+            titles (list): 뉴스 제목 리스트
+            source (str): 출처 (예: 구글 뉴스)
+            keyword (str): 검색 키워드
+
+        Returns:
+            list: 이번에 새로 저장된 제목 리스트
+        """
+        records = ({'title': title, 'source': source, 'keyword': keyword} for title in titles)
+        return [record['title'] for record in self.upsert(records)]
+
+    def save_bodies(self, results, records=()):
+        """
+        기사 본문 수집 결과를 한 트랜잭션으로 저장합니다 (같은 URL은 덮어씀).
+
+        Args:
+            results (iterable): {'url', 'final_url', 'title', 'body', 'published',
+                                 'status', 'error', 'fetched_at'} 딕셔너리들
+            records (iterable): 같은 트랜잭션에서 upsert할 기사 레코드들
+
+        Returns:
+            int: 저장한 개수
+        """
+        rows = [
+            (r['url'], r.get('final_url'), r.get('title'), r.get('body'), r.get('published'),
+             r.get('status'), r.get('error'), r.get('fetched_at') or time.time())
+            for r in results
+        ]
+        with self._lock:
+            with self._conn:
+                self._upsert(records)
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO article_bodies "
+                    "(url, final_url, title, body, published, status, error, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+        return len(rows)
+
+    def fetched_urls(self, urls, include_errors=False):
+        """
+        본문을 이미 수집한 URL들을 찾습니다.
+
+        Args:
+            urls (iterable): 확인할 URL들
+            include_errors (bool): 실패로 기록된 URL도 포함할지 여부
+
+        Returns:
+            set: 이미 수집한 URL 집합
+        """
+        urls = list(urls)
+        found = set()
+        query = "SELECT url FROM article_bodies WHERE url IN ({})"
+        if not include_errors:
+            query += " AND error IS NULL"
+        with self._lock:
+            # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(urls), 500):
+                batch = urls[start:start + 500]
+                rows = self._conn.execute(query.format(','.join('?' * len(batch))), batch)
+                found.update(row[0] for row in rows)
+        return found
+
+    def body(self, url):
+        """
+        저장된 기사 본문을 조회합니다.
+
+        Returns:
+            dict: 본문 수집 결과. 없으면 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, final_url, title, body, published, status, error, fetched_at "
+                "FROM article_bodies WHERE url = ?", (url,)
+            ).fetchone()
+        return dict(row) if row is not None else None
+
+    def recent(self, keyword=None, hours=24, source=None, limit=None):
+        """
+        최근 수집된 기사를 조회합니다 (키워드/출처/수집시각 인덱스 사용).
+
+        Args:
+            keyword (str): 검색 키워드 (None이면 전체)
+            hours (float): 몇 시간 이내에 수집된 기사인지
+            source (str): 출처 (None이면 전체)
+            limit (int): 최대 개수
+
+        Returns:
+            list: 기사 딕셔너리 리스트 (최신순)
+        """
+        query = "SELECT title, source, keyword, link, collected_at FROM articles WHERE collected_at >= ?"
+        params = [time.time() - hours * 3600]
+        if keyword is not None:
+            query += " AND keyword = ?"
+            params.append(keyword)
+        if source is not None:
+            query += " AND source = ?"
+            params.append(source)
+        query += " ORDER BY collected_at DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def contains(self, title, keyword):
+        """이미 저장된 기사인지 확인합니다."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM articles WHERE title_hash = ? AND keyword = ?",
+                (title_hash(title), keyword)
+            ).fetchone()
+        return row is not None
+
+    def count(self):
+        """저장된 기사 수를 반환합니다."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+
+class ArticleStoreMixin:
+    """크롤러 클래스에 기사 저장소 누적 저장 기능을 더하는 믹스인"""
+
+    def save_to_store(self, titles, source, keyword, store=None):
+        """
+        크롤링한 제목들을 SQLite 기사 저장소에 누적 저장합니다.
+
+        Args:
+            titles (list): 뉴스 제목 리스트
+            source (str): 출처
+            keyword (str): 검색 키워드
+            store (ArticleStore): 저장소 (없으면 기본 저장소)
+
+        Returns:
+            list: 이번에 새로 저장된 제목 리스트
+        """
+        try:
+            store = store or get_default_store()
+            new_titles = store.upsert_titles(titles, source, keyword)
+            print(f"[{source}] 새 기사 {len(new_titles)}개 저장 (전체 {len(titles)}개 중)")
+            return new_titles
+
+        except Exception as e:
+            print(f"기사 저장소 저장 중 오류 발생: {e}")
+            return []
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_default_store():
+    """모든 크롤러 클래스가 함께 사용하는 기본 저장소를 반환합니다."""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = ArticleStore()
+        return _default_store
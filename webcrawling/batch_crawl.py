@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 키워드 × 여러 소스 일괄 크롤링
+키워드와 소스의 모든 조합을 작업으로 만들어 제한된 스레드 풀에서 실행하고,
+끝나는 작업부터 중복을 제거한 결과를 키워드/소스 정보와 함께 바로 반환합니다.
+호스트별 요청 간격은 모든 작업이 공유하는 속도 제한기가 지킵니다.
+
+사용 예:
+    python batch_crawl.py -k "반도체 관련주" HBM 파운드리 -s daum google yna
+    python batch_crawl.py --keywords-file keywords.txt --csv batch.csv --xlsx batch.xlsx
+"""
+
+import argparse
+import csv
+import sys
+from datetime import datetime
+
+from article_store import get_default_store
+from dedup import OrderedDeduper
+from excel_export import StreamingExcelWriter
+from fetch_engine import ConcurrentFetcher
+from http_cache import get_default_cache
+from metrics import get_default_metrics
+from naver_news_crawler import NaverNewsCrawler
+from news_crawler_alternative import AlternativeNewsCrawler
+from rate_limiter import default_limiter
+from transport import get_default_session
+
+
+# 명령행에서 쓰는 짧은 이름
+SOURCE_ALIASES = {
+    'naver': "네이버 뉴스",
+    'daum': "다음 뉴스",
+    'google': "구글 뉴스",
+    'yna': "연합뉴스",
+}
+DEFAULT_SOURCES = ("다음 뉴스", "구글 뉴스", "연합뉴스")
+
+BATCH_HEADERS = ('번호', '키워드', '출처', '뉴스 제목', '수집시간')
+BATCH_COLUMN_WIDTHS = (8, 20, 12, 80, 20)
+BATCH_CENTER_COLUMNS = (0, 2, 4)
+
+
+def resolve_source(name):
+    """짧은 이름(daum 등)이나 소스 이름을 소스 이름으로 바꿉니다."""
+    source = SOURCE_ALIASES.get(name.lower(), name)
+    if source not in SOURCE_ALIASES.values():
+        raise ValueError(f"알 수 없는 소스: {name}")
+    return source
+
+
+class BatchCrawler:
+    def __init__(self, max_workers=6, limit=None, rate_limiter=None, cache=None, session=None):
+        """
+        Args:
+            max_workers (int): 동시에 실행할 최대 작업 수
+            limit (int): 작업(키워드×소스)당 최대 제목 수 (None이면 제한 없음)
+            rate_limiter (HostRateLimiter): 호스트별 속도 제한기
+            cache (ResponseCache): 응답 캐시
+            session (requests.Session): 공유 세션
+        """
+        self.fetcher = ConcurrentFetcher(max_workers=max_workers)
+        self.limit = limit
+        rate_limiter = rate_limiter or default_limiter
+        cache = cache or get_default_cache()
+        session = session or get_default_session()
+        self.alternative = AlternativeNewsCrawler(rate_limiter, cache, session)
+
+    def crawl(self, keyword, source):
+        """
+        키워드 하나를 소스 하나에서 크롤링합니다.
+
+        Args:
+            keyword (str): 검색 키워드
+            source (str): 소스 이름
+
+        Returns:
+            list: 뉴스 제목 리스트
+        """
+        if source == "다음 뉴스":
+            return self.alternative.crawl_daum_news(keyword, self.limit)
+        if source == "구글 뉴스":
+            return self.alternative.crawl_google_news(keyword, self.limit)
+        if source == "연합뉴스":
+            return self.alternative.crawl_yna_news(keyword, self.limit)
+        if source == "네이버 뉴스":
+            try:
+                return self.fetch_titles(keyword, source)
+            except Exception as e:
+                print(f"네이버 뉴스 크롤링 오류: {e}")
+                return []
+        raise ValueError(f"알 수 없는 소스: {source}")
+
+    def fetch_titles(self, keyword, source):
+        """
+        crawl과 같지만 오류를 빈 결과로 바꾸지 않고 그대로 발생시킵니다
+        (실패와 새 기사 없음을 구분해야 하는 감시 모드용).
+
+        Args:
+            keyword (str): 검색 키워드
+            source (str): 소스 이름
+
+        Returns:
+            list: 뉴스 제목 리스트
+        """
+        news_source = self.alternative.sources.get(source)
+        if news_source is None:
+            raise ValueError(f"알 수 없는 소스: {source}")
+        limit = self.limit
+        if source == "네이버 뉴스" and limit is None:
+            # limit을 페이지 요청까지 내려보냄 (limit이 없으면 다른 소스처럼 첫 페이지만)
+            limit = NaverNewsCrawler.PAGE_SIZE
+        return news_source.crawl(keyword, limit)
+
+    def iter_job_results(self, keywords, sources=DEFAULT_SOURCES):
+        """
+        키워드×소스 작업을 동시에 실행하고 끝나는 순서대로 결과를 반환합니다.
+
+        Args:
+            keywords (iterable): 검색 키워드들
+            sources (iterable): 소스 이름들
+
+        Yields:
+            tuple: (키워드, 소스, 제목 리스트)
+        """
+        jobs = {}
+        for keyword in keywords:
+            for source in sources:
+                jobs[(keyword, source)] = (
+                    lambda keyword=keyword, source=source: self.crawl(keyword, source)
+                )
+        for (keyword, source), titles in self.fetcher.iter_results(jobs):
+            yield keyword, source, titles
+
+    def iter_results(self, keywords, sources=DEFAULT_SOURCES, store=None):
+        """
+        전체 결과를 중복 제거하면서 하나씩 반환합니다.
+        같은 제목이 여러 작업에서 나오면 먼저 끝난 작업의 키워드/소스로 한 번만 반환합니다.
+
+        Args:
+            keywords (iterable): 검색 키워드들
+            sources (iterable): 소스 이름들
+            store (ArticleStore): 주어지면 작업마다 기사 저장소에 누적 저장
+
+        Yields:
+            dict: {'keyword', 'source', 'title'}
+        """
+        seen = OrderedDeduper()
+        for keyword, source, titles in self.iter_job_results(keywords, sources):
+            if store is not None:
+                store.upsert_titles(titles, source, keyword)
+            for title in titles:
+                if seen.add(title):
+                    yield {'keyword': keyword, 'source': source, 'title': title}
+
+    def crawl_all(self, keywords, sources=DEFAULT_SOURCES, store=None):
+        """
+        iter_results 결과를 리스트로 반환합니다.
+
+        Returns:
+            list: {'keyword', 'source', 'title'} 리스트
+        """
+        return list(self.iter_results(keywords, sources, store))
+
+
+def read_keywords(filename):
+    """한 줄에 키워드 하나씩 적힌 파일을 읽습니다 (빈 줄, # 주석 무시)."""
+    with open(filename, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith('#')]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="여러 키워드 × 여러 소스 뉴스 제목 일괄 크롤링")
+    parser.add_argument('-k', '--keywords', nargs='+', default=[], help="검색 키워드들")
+    parser.add_argument('--keywords-file', help="키워드 목록 파일 (한 줄에 하나)")
+    parser.add_argument('-s', '--sources', nargs='+', default=None,
+                        help="소스들 (naver, daum, google, yna). 기본값: daum google yna")
+    parser.add_argument('-w', '--workers', type=int, default=6, help="동시 작업 수 (기본값: 6)")
+    parser.add_argument('-n', '--limit', type=int, default=None, help="작업당 최대 제목 수")
+    parser.add_argument('--csv', help="결과를 저장할 CSV 파일")
+    parser.add_argument('--xlsx', help="결과를 저장할 Excel 파일")
+    parser.add_argument('--store', action='store_true', help="기사 저장소에 누적 저장")
+    parser.add_argument('--report', help="요청 계측 JSON 보고서를 저장할 파일")
+    parser.add_argument('--metrics', help="요청 계측 Prometheus 텍스트를 저장할 파일")
+    args = parser.parse_args(argv)
+
+    keywords = list(args.keywords)
+    if args.keywords_file:
+        keywords.extend(read_keywords(args.keywords_file))
+    if not keywords:
+        parser.error("키워드를 -k 또는 --keywords-file로 지정하세요.")
+    args.keywords = list(dict.fromkeys(keywords))
+
+    try:
+        args.sources = [resolve_source(name) for name in args.sources] if args.sources else list(DEFAULT_SOURCES)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def main(argv=None):
+    """일괄 크롤링 실행 함수"""
+    args = parse_args(argv)
+    crawler = BatchCrawler(max_workers=args.workers, limit=args.limit)
+    store = get_default_store() if args.store else None
+    collected_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+    print(f"일괄 크롤링 시작: 키워드 {len(args.keywords)}개 × 소스 {len(args.sources)}개")
+
+    csv_file = open(args.csv, 'w', newline='', encoding='utf-8') if args.csv else None
+    csv_writer = csv.writer(csv_file) if csv_file else None
+    excel_writer = StreamingExcelWriter(
+        args.xlsx, headers=BATCH_HEADERS, column_widths=BATCH_COLUMN_WIDTHS,
+        center_columns=BATCH_CENTER_COLUMNS
+    ) if args.xlsx else None
+    if csv_writer:
+        csv_writer.writerow(BATCH_HEADERS)
+
+    count = 0
+    try:
+        # 결과가 나오는 대로 바로 출력/기록
+        for item in crawler.iter_results(args.keywords, args.sources, store):
+            count += 1
+            row = (count, item['keyword'], item['source'], item['title'], collected_at)
+            print(f"{count:4d}. [{item['keyword']} | {item['source']}] {item['title']}")
+            if csv_writer:
+                csv_writer.writerow(row)
+            if excel_writer:
+                excel_writer.write_row(row)
+    finally:
+        if csv_file:
+            csv_file.close()
+        if excel_writer:
+            excel_writer.close()
+
+    print(f"\n✅ 일괄 크롤링 완료! 총 {count}개의 뉴스 제목 (중복 제거)")
+    metrics = get_default_metrics()
+    print("\n⏱️ 소스별 요청 계측:")
+    print(metrics.format_summary())
+    if args.report:
+        metrics.write_json(args.report)
+    if args.metrics:
+        metrics.write_prometheus(args.metrics)
+    for filename in (args.csv, args.xlsx, args.report, args.metrics):
+        if filename:
+            print(f"📁 저장된 파일: {filename}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
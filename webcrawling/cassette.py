@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP 기록/재생 (카세트)
+record 모드에서는 실제 응답(상태 코드, 헤더, 본문)을 gzip으로 압축한 카세트 파일에
+한 줄씩 덧붙이고, replay 모드에서는 네트워크 없이 카세트의 응답을 그대로 돌려줍니다.
+재생할 때 기록된 지연이나 고정 지연을 흉내 낼 수 있어 파서/동시성 벤치마크와
+회귀 재현을 오프라인에서 할 수 있습니다.
+
+세션에 직접 연결:
+    use_cassette(session, 'naver.cassette.gz', mode='record')
+
+카세트가 연결된 세션의 요청은 디스크 응답 캐시(http_cache.py)를 거치지 않습니다.
+캐시가 요청을 생략하거나 304로 바꾸면 기록이 비거나 재생이 실행마다 달라지기 때문입니다.
+
+환경 변수로 모든 크롤러의 기본 세션에 연결:
+    NEWS_CASSETTE=naver.cassette.gz NEWS_CASSETTE_MODE=replay python news_crawler_alternative.py
+
+사용 예:
+    python cassette.py list naver.cassette.gz
+    python cassette.py seed naver.cassette.gz "https://search.naver.com/..." debug_page_1700000000.html
+"""
+
+import argparse
+import base64
+import gzip
+import io
+import json
+import os
+import sys
+import threading
+import time
+from http import HTTPStatus
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+MODE_RECORD = 'record'
+MODE_REPLAY = 'replay'
+
+# 재생할 본문은 이미 압축이 풀린 상태이므로 전송 관련 헤더는 저장하지 않음
+_DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+class CassetteMiss(requests.exceptions.ConnectionError):
+    """재생할 응답이 카세트에 없을 때 발생하는 예외 (네트워크 오류처럼 처리됨)"""
+
+
+class Cassette:
+    def __init__(self, path):
+        """
+        Args:
+            path (str): 카세트 파일 경로 (gzip 압축 JSON Lines)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._interactions = None
+        self._cursors = {}
+
+    @staticmethod
+    def make_interaction(method, url, status, headers, body, elapsed=0.0):
+        """
+        카세트에 저장할 요청/응답 한 건을 만듭니다.
+
+        Args:
+            method (str): HTTP 메서드
+            url (str): 요청 URL
+            status (int): 상태 코드
+            headers (dict): 응답 헤더
+            body (bytes): 압축이 풀린 응답 본문
+            elapsed (float): 기록 당시 응답까지 걸린 시간(초)
+
+        Returns:
+            dict: 카세트 항목
+        """
+        return {
+            'method': method.upper(),
+            'url': url,
+            'status': status,
+            'headers': {k: v for k, v in headers.items() if k.lower() not in _DROPPED_HEADERS},
+            'body': base64.b64encode(body).decode('ascii'),
+            'elapsed': elapsed,
+            'recorded_at': time.time(),
+        }
+
+    def append(self, interaction):
+        """
+        항목 하나를 파일 끝에 덧붙입니다 (gzip 멤버를 이어 붙이므로 중간에 끊겨도 앞부분은 유효).
+
+        Args:
+            interaction (dict): make_interaction()이 만든 항목
+        """
+        line = json.dumps(interaction, ensure_ascii=False).encode('utf-8') + b'\n'
+        with self._lock:
+            with gzip.open(self.path, 'ab') as f:
+                f.write(line)
+            if self._interactions is not None:
+                self._interactions.setdefault(
+                    (interaction['method'], interaction['url']), []
+                ).append(interaction)
+
+    def replace(self, interaction, max_entries=None):
+        """
+        같은 요청(메서드, URL)의 기존 항목을 지우고 새 항목을 넣어 파일을 다시 씁니다.
+
+        Args:
+            interaction (dict): make_interaction()이 만든 항목
+            max_entries (int): 남길 최대 항목 수 (넘으면 오래 기록된 항목부터 삭제, None이면 제한 없음)
+        """
+        key = (interaction['method'], interaction['url'])
+        with self._lock:
+            interactions = [item for item in self.load() if (item['method'], item['url']) != key]
+            interactions.append(interaction)
+            if max_entries is not None:
+                interactions = interactions[-max_entries:]
+            # 쓰는 도중 끊겨도 기존 파일이 남도록 임시 파일에 쓴 뒤 교체
+            temp_path = self.path + '.tmp'
+            with gzip.open(temp_path, 'wb') as f:
+                for item in interactions:
+                    f.write(json.dumps(item, ensure_ascii=False).encode('utf-8') + b'\n')
+            os.replace(temp_path, self.path)
+            self._interactions = None
+            self._cursors.clear()
+
+    def load(self):
+        """
+        카세트 파일의 모든 항목을 읽습니다.
+
+        Returns:
+            list: 카세트 항목 리스트 (기록 순서)
+        """
+        if not os.path.exists(self.path):
+            return []
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def find(self, method, url):
+        """
+        요청에 해당하는 항목을 찾습니다. 같은 URL이 여러 번 기록되어 있으면
+        기록된 순서대로 돌아가며 반환합니다.
+
+        Args:
+            method (str): HTTP 메서드
+            url (str): 요청 URL
+
+        Returns:
+            dict: 카세트 항목. 없으면 None
+        """
+        with self._lock:
+            if self._interactions is None:
+                self._interactions = {}
+                for interaction in self.load():
+                    self._interactions.setdefault(
+                        (interaction['method'], interaction['url']), []
+                    ).append(interaction)
+            key = (method.upper(), url)
+            candidates = self._interactions.get(key)
+            if not candidates:
+                return None
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+            return candidates[cursor % len(candidates)]
+
+
+def build_response(request, interaction, timings=None):
+    """
+    카세트 항목으로 requests.Response를 만듭니다 (stream=True 요청의 iter_content도 지원).
+
+    Args:
+        request (requests.PreparedRequest): 원래 요청
+        interaction (dict): 카세트 항목
+        timings (dict): response.timings로 붙일 값
+
+    Returns:
+        requests.Response: 재생 응답
+    """
+    response = requests.Response()
+    response.status_code = interaction['status']
+    response.headers = CaseInsensitiveDict(interaction['headers'])
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = request.url
+    response.request = request
+    try:
+        response.reason = HTTPStatus(interaction['status']).phrase
+    except ValueError:
+        response.reason = ''
+    body = base64.b64decode(interaction['body'])
+    response.raw = io.BytesIO(body)
+    response._content = body
+    response._content_consumed = True
+    response.timings = timings or {'connect': 0.0, 'reused': True, 'ttfb': 0.0}
+    return response
+
+
+class RecordingAdapter(BaseAdapter):
+    """실제 어댑터로 요청을 보내고 응답을 카세트에 기록하는 어댑터"""
+
+    def __init__(self, inner, cassette):
+        """
+        Args:
+            inner (HTTPAdapter): 실제 요청을 보낼 어댑터
+            cassette (Cassette): 기록할 카세트
+        """
+        super().__init__()
+        self.inner = inner
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        started = time.perf_counter()
+        response = self.inner.send(request, **kwargs)
+        # 본문을 끝까지 읽어 둔 뒤 기록 (이후 iter_content는 읽어 둔 본문에서 나눠 반환)
+        body = response.content
+        self.cassette.append(Cassette.make_interaction(
+            request.method, request.url, response.status_code, response.headers, body,
+            time.perf_counter() - started,
+        ))
+        return response
+
+    def close(self):
+        self.inner.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """카세트에 기록된 응답을 네트워크 없이 돌려주는 어댑터"""
+
+    def __init__(self, cassette, latency=None):
+        """
+        Args:
+            cassette (Cassette): 재생할 카세트
+            latency (float 또는 str): 응답 전 지연. None이면 지연 없음,
+                                      숫자면 고정 지연(초), 'recorded'면 기록 당시 시간
+        """
+        super().__init__()
+        self.cassette = cassette
+        self.latency = latency
+
+    def send(self, request, **kwargs):
+        interaction = self.cassette.find(request.method, request.url)
+        if interaction is None:
+            raise CassetteMiss(f"카세트에 없는 요청입니다: {request.method} {request.url}",
+                               request=request)
+        delay = interaction.get('elapsed', 0.0) if self.latency == 'recorded' else (self.latency or 0.0)
+        if delay:
+            time.sleep(delay)
+        return build_response(request, interaction, {'connect': 0.0, 'reused': True, 'ttfb': delay})
+
+    def close(self):
+        pass
+
+
+def use_cassette(session, path, mode=MODE_REPLAY, latency=None):
+    """
+    세션의 http/https 어댑터를 기록 또는 재생 어댑터로 바꿉니다.
+
+    Args:
+        session (requests.Session): 대상 세션
+        path (str): 카세트 파일 경로
+        mode (str): 'record' 또는 'replay'
+        latency (float 또는 str): 재생 지연 (ReplayAdapter 참고)
+
+    Returns:
+        Cassette: 연결된 카세트
+    """
+    cassette = Cassette(path)
+    # 응답 캐시가 이 세션의 요청은 캐시를 거치지 않고 그대로 보내도록 표시
+    session.cassette = cassette
+    # 호스트별 연결 풀 어댑터가 따로 붙어 있으면 그 접두사도 함께 바꿈
+    prefixes = [prefix for prefix in session.adapters if prefix.startswith(('https://', 'http://'))]
+    for prefix in prefixes:
+        if mode == MODE_RECORD:
+            adapter = RecordingAdapter(session.get_adapter(prefix), cassette)
+        elif mode == MODE_REPLAY:
+            adapter = ReplayAdapter(cassette, latency)
+        else:
+            raise ValueError(f"알 수 없는 카세트 모드: {mode}")
+        session.mount(prefix, adapter)
+    return cassette
+
+
+def cassette_active(session):
+    """세션에 기록/재생 카세트가 연결되어 있는지 확인합니다."""
+    return getattr(session, 'cassette', None) is not None
+
+
+def cassette_from_env(session):
+    """
+    NEWS_CASSETTE / NEWS_CASSETTE_MODE / NEWS_CASSETTE_LATENCY 환경 변수가 있으면
+    세션에 카세트를 연결합니다.
+
+    Returns:
+        Cassette: 연결된 카세트. 환경 변수가 없으면 None
+    """
+    path = os.environ.get('NEWS_CASSETTE')
+    if not path:
+        return None
+    latency = os.environ.get('NEWS_CASSETTE_LATENCY') or None
+    if latency is not None and latency != 'recorded':
+        latency = float(latency)
+    return use_cassette(session, path, os.environ.get('NEWS_CASSETTE_MODE', MODE_REPLAY), latency)
+
+
+def add_page(path, url, body, status=200, replace=False, max_entries=None):
+    """
+    HTML 본문 하나를 GET 요청의 응답으로 카세트에 추가합니다.
+
+    Args:
+        path (str): 카세트 파일 경로
+        url (str): 이 본문을 돌려줄 요청 URL
+        body (bytes): UTF-8 HTML 본문
+        status (int): 상태 코드
+        replace (bool): 같은 URL의 기존 항목을 이 본문으로 바꿈 (False면 뒤에 덧붙여 번갈아 재생)
+        max_entries (int): replace일 때 남길 최대 항목 수 (Cassette.replace 참고)
+    """
+    # 재생 시 requests가 만드는 URL과 같은 형태로 정규화
+    url = requests.Request('GET', url).prepare().url
+    interaction = Cassette.make_interaction(
+        'GET', url, status, {'Content-Type': 'text/html; charset=utf-8'}, body,
+    )
+    if replace:
+        Cassette(path).replace(interaction, max_entries)
+    else:
+        Cassette(path).append(interaction)
+
+
+def seed_from_html(path, url, html_path, status=200):
+    """
+    저장해 둔 HTML 파일(crawl_news_titles의 debug 덤프 등)을 카세트 항목으로 추가합니다.
+
+    Args:
+        path (str): 카세트 파일 경로
+        url (str): 이 HTML을 돌려줄 요청 URL
+        html_path (str): HTML 파일 경로
+        status (int): 상태 코드
+    """
+    with open(html_path, 'rb') as f:
+        add_page(path, url, f.read(), status)
+
+
+def main(argv=None):
+    """카세트 관리 명령"""
+    parser = argparse.ArgumentParser(description="HTTP 기록/재생 카세트 관리")
+    commands = parser.add_subparsers(dest='command', required=True)
+    list_parser = commands.add_parser('list', help="카세트에 기록된 요청 목록 출력")
+    list_parser.add_argument('cassette')
+    seed_parser = commands.add_parser('seed', help="HTML 파일을 카세트 항목으로 추가")
+    seed_parser.add_argument('cassette')
+    seed_parser.add_argument('url')
+    seed_parser.add_argument('html', nargs='+')
+    args = parser.parse_args(argv)
+
+    if args.command == 'list':
+        for idx, interaction in enumerate(Cassette(args.cassette).load(), 1):
+            size = len(base64.b64decode(interaction['body']))
+            print(f"{idx:4d}. {interaction['status']} {interaction['method']} {interaction['url']} "
+                  f"({size / 1024:.1f}KB, {interaction.get('elapsed', 0.0) * 1000:.0f}ms)")
+    else:
+        for html_path in args.html:
+            seed_from_html(args.cassette, args.url, html_path)
+        print(f"{len(args.html)}개 항목을 {args.cassette}에 추가했습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+순서를 유지하는 해시 기반 중복 제거
+리스트에 대한 `in` 검사(O(n)) 대신 집합으로 O(1) 중복 검사를 하며,
+공백/HTML 엔티티/유니코드 정규화 차이만 있는 제목은 같은 제목으로 취급합니다.
+"""
+
+import html
+import re
+import unicodedata
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_title(title):
+    """
+    중복 비교용 제목 키를 만듭니다.
+
+    Args:
+        title (str): 뉴스 제목
+
+    Returns:
+        str: HTML 엔티티 해제, 유니코드 NFC 정규화, 공백 정리를 거친 제목
+    """
+    title = html.unescape(title)
+    title = unicodedata.normalize('NFC', title)
+    return _WHITESPACE_RE.sub(' ', title).strip()
+
+
+class OrderedDeduper:
+    def __init__(self, items=None, key=normalize_title):
+        """
+        Args:
+            items (iterable): 처음부터 추가할 항목들
+            key (callable): 중복 비교에 사용할 키 함수. None이면 항목 자체를 비교
+        """
+        self.key = key
+        self._seen = set()
+        self._items = []
+        if items:
+            self.extend(items)
+
+    def _key(self, item):
+        return self.key(item) if self.key else item
+
+    def add(self, item):
+        """
+        처음 보는 항목이면 추가합니다.
+
+        Args:
+            item: 추가할 항목
+
+        Returns:
+            bool: 새로 추가되었으면 True, 중복이면 False
+        """
+        k = self._key(item)
+        if k in self._seen:
+            return False
+        self._seen.add(k)
+        self._items.append(item)
+        return True
+
+    def extend(self, items):
+        """
+        여러 항목을 순서대로 추가합니다.
+
+        Args:
+            items (iterable): 추가할 항목들
+
+        Returns:
+            list: 이번에 새로 추가된 항목 리스트
+        """
+        return [item for item in items if self.add(item)]
+
+    def __contains__(self, item):
+        return self._key(item) in self._seen
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def to_list(self):
+        """처음 본 순서대로 항목 리스트를 반환합니다."""
+        return list(self._items)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대용량 결과를 위한 스트리밍 Excel 내보내기
+openpyxl의 write-only 모드로 행을 한 번에 하나씩 파일에 기록하므로
+누적 기사(수십만~수백만 행)를 내보내도 메모리 사용량이 일정합니다.
+셀마다 Font/Fill/Border 객체를 새로 만드는 대신 이름 있는 스타일을 공유하고,
+Excel 한 시트의 최대 행 수를 넘으면 자동으로 다음 시트로 넘어갑니다.
+"""
+
+from datetime import datetime
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+
+# Excel 한 시트의 최대 행 수 (헤더 포함)
+EXCEL_MAX_ROWS = 1048576
+
+DEFAULT_HEADERS = ('번호', '뉴스 제목', '수집시간')
+DEFAULT_COLUMN_WIDTHS = (8, 80, 20)
+DEFAULT_CENTER_COLUMNS = (0, 2)
+
+# 유사 제목 클러스터 번호를 함께 내보낼 때의 컬럼 구성
+CLUSTER_HEADERS = ('번호', '클러스터', '뉴스 제목', '수집시간')
+CLUSTER_COLUMN_WIDTHS = (8, 10, 80, 20)
+CLUSTER_CENTER_COLUMNS = (0, 1, 3)
+
+
+def _register_styles(workbook):
+    """헤더/본문 공용 스타일을 워크북에 한 번만 등록합니다."""
+    thin = Side(style='thin')
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+    center = Alignment(horizontal='center', vertical='center')
+
+    workbook.add_named_style(NamedStyle(
+        name='news_header',
+        font=Font(bold=True, color="FFFFFF"),
+        fill=PatternFill(start_color="366092", end_color="366092", fill_type="solid"),
+        border=border,
+        alignment=center,
+    ))
+    workbook.add_named_style(NamedStyle(name='news_body', border=border))
+    workbook.add_named_style(NamedStyle(name='news_body_center', border=border, alignment=center))
+
+
+class StreamingExcelWriter:
+    def __init__(self, filename, headers=DEFAULT_HEADERS, column_widths=DEFAULT_COLUMN_WIDTHS,
+                 center_columns=DEFAULT_CENTER_COLUMNS, sheet_title='뉴스 제목',
+                 max_rows_per_sheet=EXCEL_MAX_ROWS):
+        """
+        Args:
+            filename (str): 저장할 파일명
+            headers (tuple): 헤더 이름들
+            column_widths (tuple): 컬럼 너비들
+            center_columns (tuple): 가운데 정렬할 컬럼 번호들 (0부터)
+            sheet_title (str): 시트 이름 (두 번째 시트부터 " (2)" 등이 붙음)
+            max_rows_per_sheet (int): 시트당 최대 행 수 (헤더 포함)
+        """
+        self.filename = filename
+        self.headers = tuple(headers)
+        self.column_widths = tuple(column_widths)
+        self.sheet_title = sheet_title
+        self.max_rows_per_sheet = max_rows_per_sheet
+        self.rows_written = 0
+        self.sheet_count = 0
+
+        self._workbook = Workbook(write_only=True)
+        _register_styles(self._workbook)
+
+        # 컬럼별로 스타일이 지정된 셀 하나를 만들어 두고 값만 바꿔 가며 재사용
+        # (write-only 시트는 append 시점에 바로 기록하므로 안전)
+        self._body_cells = None
+        self._center_columns = set(center_columns)
+        self._sheet = None
+        self._sheet_rows = 0
+
+    def _new_sheet(self):
+        self.sheet_count += 1
+        title = self.sheet_title if self.sheet_count == 1 else f"{self.sheet_title} ({self.sheet_count})"
+        sheet = self._workbook.create_sheet(title=title[:31])
+
+        for col, width in enumerate(self.column_widths, 1):
+            sheet.column_dimensions[get_column_letter(col)].width = width
+        # 제목 행 고정
+        sheet.freeze_panes = 'A2'
+
+        header_cells = []
+        for header in self.headers:
+            cell = WriteOnlyCell(sheet, value=header)
+            cell.style = 'news_header'
+            header_cells.append(cell)
+        sheet.append(header_cells)
+
+        self._body_cells = []
+        for col in range(len(self.headers)):
+            cell = WriteOnlyCell(sheet)
+            cell.style = 'news_body_center' if col in self._center_columns else 'news_body'
+            self._body_cells.append(cell)
+
+        self._sheet = sheet
+        self._sheet_rows = 1
+
+    def write_row(self, values):
+        """
+        데이터 행 하나를 기록합니다. 시트가 가득 차면 새 시트를 만듭니다.
+
+        Args:
+            values (sequence): 컬럼 순서대로의 값들
+        """
+        if self._sheet is None or self._sheet_rows >= self.max_rows_per_sheet:
+            self._new_sheet()
+        cells = self._body_cells
+        for cell, value in zip(cells, values):
+            cell.value = value
+        self._sheet.append(cells)
+        self._sheet_rows += 1
+        self.rows_written += 1
+
+    def write_rows(self, rows):
+        """
+        여러 데이터 행을 순서대로 기록합니다.
+
+        Args:
+            rows (iterable): 행 값 시퀀스들 (제너레이터 가능)
+        """
+        for values in rows:
+            self.write_row(values)
+
+    def close(self):
+        """파일을 저장합니다. 행이 없어도 헤더만 있는 시트를 만듭니다."""
+        if self._sheet is None:
+            self._new_sheet()
+        self._workbook.save(self.filename)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        return False
+
+
+def export_titles(titles, filename, collected_at=None, cluster_ids=None):
+    """
+    뉴스 제목들을 번호/제목/수집시간 형식의 Excel 파일로 내보냅니다.
+
+    Args:
+        titles (iterable): 뉴스 제목들 (제너레이터 가능)
+        filename (str): 저장할 파일명
+        collected_at (str): 수집시간 표기 (없으면 현재 시각)
+        cluster_ids (iterable): 제목마다의 유사 제목 클러스터 번호 (주어지면 클러스터 컬럼 추가)
+
+    Returns:
+        StreamingExcelWriter: 기록 결과 (rows_written, sheet_count)
+    """
+    collected_at = collected_at or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    if cluster_ids is None:
+        with StreamingExcelWriter(filename) as writer:
+            writer.write_rows((idx, title, collected_at) for idx, title in enumerate(titles, 1))
+        return writer
+    with StreamingExcelWriter(filename, CLUSTER_HEADERS, CLUSTER_COLUMN_WIDTHS,
+                              CLUSTER_CENTER_COLUMNS) as writer:
+        writer.write_rows(
+            (idx, cluster_id, title, collected_at)
+            for idx, (cluster_id, title) in enumerate(zip(cluster_ids, titles), 1)
+        )
+    return writer
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+lxml 기반 빠른 HTML 파싱 도우미
+BeautifulSoup(html.parser)로 페이지 전체 트리를 만들고 find_all을 반복하는 대신
+C로 구현된 lxml 파서와 미리 컴파일한 XPath로 필요한 노드만 바로 찾습니다.
+필요한 개수만 뽑으면 되는 경우에는 응답 바이트를 조금씩 넣는 풀 파서로
+대상 노드가 닫히는 즉시 텍스트를 반환하고, 개수를 채우면 파싱을 멈춥니다.
+"""
+
+from lxml import etree
+from lxml import html as lxml_html
+
+
+_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+
+def has_class(tag, class_name, prefix='//'):
+    """
+    CSS 선택자 tag.class_name에 해당하는 XPath 식을 만듭니다.
+
+    Args:
+        tag (str): 태그 이름
+        class_name (str): 클래스 이름
+        prefix (str): 축 (기본값은 문서 전체)
+
+    Returns:
+        str: XPath 식
+    """
+    return f"{prefix}{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+# 소스별 제목 노드 (모듈 로드 시 한 번만 컴파일)
+# 중첩 선택자는 '//' 대신 'descendant::' 축을 써야 libxml2가 중복 노드 병합을 하지 않아 빠릅니다.
+DAUM_TITLE_LINKS = etree.XPath(has_class('a', 'f_link_b'))
+YNA_TITLE_LINKS = etree.XPath(has_class('strong', 'tit-news') + '/descendant::a[1]')
+NAVER_NEWS_TITLE_LINKS = etree.XPath(
+    has_class('div', 'news_area') + has_class('a', 'news_tit', '/descendant::')
+)
+NAVER_AREA_TITLE_LINK = etree.XPath(has_class('a', 'news_tit', 'descendant::'))
+NAVER_AREA_INFOS = etree.XPath(has_class('span', 'info', 'descendant::'))
+NAVER_NEWS_MODULE_LINKS = etree.XPath("//div[@data-module='news']/descendant::a")
+LINKS_WITH_HREF = etree.XPath('//a[@href]')
+# 텍스트가 10자를 넘는 링크만 (공백 제거 전 길이이므로 제목 후보를 빠뜨리지 않는 C 단계 사전 필터)
+LONG_TEXT_LINKS = etree.XPath('//a[string-length(.) > 10]')
+
+
+def parse_document(markup):
+    """
+    HTML 문자열을 lxml 트리로 파싱합니다.
+
+    Args:
+        markup (str 또는 bytes): HTML
+
+    Returns:
+        lxml.html.HtmlElement: 루트 요소. 내용이 없으면 None
+    """
+    if isinstance(markup, str):
+        markup = markup.encode('utf-8')
+    if not markup.strip():
+        return None
+    return lxml_html.fromstring(markup, parser=_HTML_PARSER)
+
+
+def node_text(element):
+    """요소의 텍스트(하위 태그 제외)를 공백 정리 후 반환합니다."""
+    return ''.join(element.itertext()).strip()
+
+
+def select_texts(markup, xpath, min_length=6):
+    """
+    XPath에 해당하는 요소들의 텍스트를 순서대로 반환합니다.
+
+    Args:
+        markup (str): HTML
+        xpath (etree.XPath): 컴파일된 XPath
+        min_length (int): 이보다 짧은 텍스트는 제외
+
+    Returns:
+        list: 텍스트 리스트
+    """
+    root = parse_document(markup)
+    if root is None:
+        return []
+    texts = []
+    for element in xpath(root):
+        text = node_text(element)
+        if text and len(text) >= min_length:
+            texts.append(text)
+    return texts
+
+
+def iter_pull_texts(chunks, tag, class_name, limit=None, min_length=6, first_link=False):
+    """
+    HTML 바이트 조각을 풀 파서에 넣으며 tag.class_name 요소의 텍스트를 하나씩 반환합니다.
+    limit개를 채우면 나머지 조각은 읽지 않습니다.
+
+    Args:
+        chunks (iterable): bytes 조각들 (예: response.iter_content())
+        tag (str): 태그 이름
+        class_name (str): 클래스 이름
+        limit (int): 최대 개수 (None이면 끝까지)
+        min_length (int): 이보다 짧은 텍스트는 제외
+        first_link (bool): 요소 자체 대신 안쪽 첫 번째 <a>의 텍스트 사용
+
+    Yields:
+        str: 텍스트
+    """
+    return _iter_pull(chunks, tag, class_name, limit, min_length, first_link,
+                      lambda target, text: text)
+
+
+def iter_pull_links(chunks, tag, class_name, limit=None, min_length=6, first_link=False):
+    """
+    iter_pull_texts와 같지만 텍스트와 함께 링크 주소(href)를 반환합니다.
+
+    Yields:
+        dict: {'title', 'link'} (link는 원문 그대로의 href, 없으면 None)
+    """
+    return _iter_pull(chunks, tag, class_name, limit, min_length, first_link,
+                      lambda target, text: {'title': text, 'link': target.get('href')})
+
+
+def iter_pull_elements(chunks, tag, class_name, make_item, limit=None):
+    """
+    HTML 바이트 조각을 풀 파서에 넣으며 tag.class_name 요소가 닫힐 때마다 항목을 만들어 반환합니다.
+    limit개를 채우면 나머지 조각은 읽지 않습니다.
+
+    Args:
+        chunks (iterable): bytes 조각들
+        tag (str): 태그 이름
+        class_name (str): 클래스 이름
+        make_item (callable): 닫힌 요소를 받아 항목을 반환하는 함수 (None이면 건너뜀)
+        limit (int): 최대 개수 (None이면 끝까지)
+
+    Yields:
+        make_item이 반환한 항목
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    parser = etree.HTMLPullParser(events=('end',), tag=tag, encoding='utf-8')
+    token = f' {class_name} '
+    count = 0
+
+    def drain():
+        nonlocal count
+        for _, element in parser.read_events():
+            if token not in f" {' '.join((element.get('class') or '').split())} ":
+                continue
+            item = make_item(element)
+            if item is not None:
+                count += 1
+                yield item
+                if limit is not None and count >= limit:
+                    return
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        parser.feed(chunk)
+        yield from drain()
+        if limit is not None and count >= limit:
+            return
+
+    parser.close()
+    yield from drain()
+
+
+def _iter_pull(chunks, tag, class_name, limit, min_length, first_link, make_item):
+    def make(element):
+        target = element.find('.//a') if first_link else element
+        text = node_text(target) if target is not None else ''
+        if text and len(text) >= min_length:
+            return make_item(target, text)
+        return None
+
+    return iter_pull_elements(chunks, tag, class_name, make, limit)
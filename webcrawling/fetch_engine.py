@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+여러 뉴스 소스를 동시에 요청하는 병렬 수집 엔진
+소스별 크롤링 함수를 제한된 스레드 풀에서 한꺼번에 실행하고
+완료되는 순서대로 결과를 돌려줍니다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+class ConcurrentFetcher:
+    def __init__(self, max_workers=4):
+        """
+        Args:
+            max_workers (int): 동시에 실행할 최대 작업 수
+        """
+        self.max_workers = max_workers
+
+    def iter_results(self, jobs):
+        """
+        모든 작업을 동시에 시작하고 완료되는 순서대로 결과를 반환합니다.
+
+        Args:
+            jobs (dict): {소스 이름: 인자 없이 호출 가능한 크롤링 함수}
+
+        Yields:
+            tuple: (소스 이름, 결과 리스트). 작업이 실패하면 빈 리스트
+        """
+        if not jobs:
+            return
+
+        workers = max(1, min(self.max_workers, len(jobs)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(job): name for name, job in jobs.items()}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"{name} 수집 중 오류 발생: {e}")
+                    result = []
+                yield name, result or []
+
+    def fetch_all(self, jobs):
+        """
+        모든 작업을 동시에 실행하고 결과를 한 번에 반환합니다.
+
+        Args:
+            jobs (dict): {소스 이름: 인자 없이 호출 가능한 크롤링 함수}
+
+        Returns:
+            dict: {소스 이름: 결과 리스트}
+        """
+        return dict(self.iter_results(jobs))
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+디스크 기반 HTTP 응답 캐시
+같은 키워드를 주기적으로 다시 수집할 때 TTL 안에서는 요청을 생략하고,
+TTL이 지나면 ETag/Last-Modified로 조건부 요청을 보내 304 응답이면
+이전에 파싱해 둔 제목을 그대로 돌려줍니다.
+기록/재생 카세트가 연결된 세션은 결과가 실행마다 같도록 캐시를 거치지 않습니다.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from itertools import islice
+
+from cassette import cassette_active
+from metrics import (OUTCOME_ERROR, OUTCOME_FRESH, OUTCOME_NOT_MODIFIED, OUTCOME_OK,
+                     get_default_metrics)
+from resilience import cancel_scope, raise_if_circuit_open
+from transport import CrawlCancelled, iter_chunks
+
+
+DEFAULT_CACHE_PATH = '.news_http_cache.sqlite3'
+# 캐시 적중 때마다 쓰지 않고 메모리에 모아 두었다가 한 번에 기록할 사용 시각 수
+ACCESS_FLUSH_SIZE = 256
+
+
+class ResponseCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=120, max_bytes=50 * 1024 * 1024, metrics=None):
+        """
+        Args:
+            path (str): 캐시 SQLite 파일 경로
+            ttl (int): 재검증 없이 캐시를 그대로 사용할 시간(초)
+            max_bytes (int): 캐시 최대 크기. 초과하면 가장 오래 사용하지 않은 항목부터 삭제
+            metrics (CrawlMetrics): 요청 계측기 (없으면 기본 계측기)
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.metrics = metrics or get_default_metrics()
+        self._lock = threading.Lock()
+        # 아직 기록하지 않은 사용 시각 {URL: 시각} (쓰기나 삭제 직전에 한 트랜잭션으로 반영)
+        self._accessed = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                titles TEXT,
+                item_limit INTEGER,
+                size INTEGER,
+                fetched_at REAL,
+                accessed_at REAL
+            )
+        """)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        if 'item_limit' not in columns:
+            # 이전 버전 캐시 파일: limit에서 멈춘 결과를 구분하는 컬럼 추가 (기존 항목은 전체 결과)
+            self._conn.execute("ALTER TABLE responses ADD COLUMN item_limit INTEGER")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)"
+        )
+        self._conn.commit()
+
+    def lookup(self, url):
+        """
+        URL에 해당하는 캐시 항목을 조회합니다.
+
+        Args:
+            url (str): 요청 URL
+
+        Returns:
+            dict: 캐시 항목 (etag, last_modified, titles, limit, fetched_at). 없으면 None
+                  limit은 그 개수에서 읽기를 멈춘 결과이면 그 개수, 끝까지 읽은 결과이면 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, titles, item_limit, fetched_at FROM responses "
+                "WHERE url = ?",
+                (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            # 읽기마다 커밋(fsync)하지 않도록 사용 시각은 모아 두었다가 기록
+            self._accessed[url] = time.time()
+            if len(self._accessed) >= ACCESS_FLUSH_SIZE:
+                self._flush_accessed()
+                self._conn.commit()
+        return {
+            'etag': row[0],
+            'last_modified': row[1],
+            'titles': json.loads(row[2]),
+            'limit': row[3],
+            'fetched_at': row[4],
+        }
+
+    @staticmethod
+    def covers(entry, limit):
+        """
+        캐시 항목이 limit개 요청에 그대로 쓸 수 있는 결과인지 확인합니다.
+        끝까지 읽은 결과는 모든 요청에, limit에서 멈춘 결과는 그 이하의 limit 요청에만 씁니다.
+
+        Args:
+            entry (dict): lookup()이 반환한 캐시 항목
+            limit (int): 요청한 최대 제목 수 (None이면 끝까지)
+
+        Returns:
+            bool: 사용 가능 여부
+        """
+        if entry is None:
+            return False
+        if entry['limit'] is None:
+            return True
+        return limit is not None and limit <= entry['limit']
+
+    def is_fresh(self, entry):
+        """캐시 항목이 TTL 안에 있는지 확인합니다."""
+        return entry is not None and time.time() - entry['fetched_at'] < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry):
+        """
+        캐시 항목으로 조건부 요청 헤더를 만듭니다.
+
+        Args:
+            entry (dict): lookup()이 반환한 캐시 항목
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since 헤더
+        """
+        headers = {}
+        if entry:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def store(self, url, response, titles, limit=None):
+        """
+        응답의 검증자와 파싱된 제목을 저장합니다 (본문은 저장하지 않음).
+
+        Args:
+            url (str): 요청 URL
+            response (requests.Response): 200 응답
+            titles (list): 파싱된 제목 리스트
+            limit (int): limit개에서 읽기를 멈춘 결과이면 그 개수 (끝까지 읽었으면 None)
+        """
+        titles_json = json.dumps(titles, ensure_ascii=False)
+        size = len(titles_json.encode('utf-8'))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, etag, last_modified, titles, item_limit, size, fetched_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, response.headers.get('ETag'), response.headers.get('Last-Modified'),
+                 titles_json, limit, size, now, now)
+            )
+            self._flush_accessed()
+            self._conn.commit()
+            self._evict()
+
+    def touch(self, url, response):
+        """
+        304 응답을 받은 항목의 수집 시각과 검증자를 갱신합니다.
+
+        Args:
+            url (str): 요청 URL
+            response (requests.Response): 304 응답
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ?, accessed_at = ?, "
+                "etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified) "
+                "WHERE url = ?",
+                (now, now, response.headers.get('ETag'),
+                 response.headers.get('Last-Modified'), url)
+            )
+            self._flush_accessed()
+            self._conn.commit()
+
+    def _flush_accessed(self):
+        """모아 둔 사용 시각을 반영합니다 (락 안에서 호출, 커밋은 호출한 쪽에서)."""
+        if not self._accessed:
+            return
+        self._conn.executemany(
+            "UPDATE responses SET accessed_at = MAX(accessed_at, ?) WHERE url = ?",
+            [(accessed_at, url) for url, accessed_at in self._accessed.items()]
+        )
+        self._accessed.clear()
+
+    def _evict(self):
+        """최대 크기를 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다 (락 안에서 호출)."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT url, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall()
+        for url, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+        self._conn.commit()
+
+    def clear(self):
+        """캐시를 모두 비웁니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._accessed.clear()
+
+    def _check_circuit(self, session, url):
+        """회로가 열린 소스이면 속도 제한 토큰을 쓰기 전에 실패로 기록하고 예외를 발생시킵니다."""
+        try:
+            raise_if_circuit_open(session, url)
+        except Exception as e:
+            self.metrics.observe(url, OUTCOME_ERROR, error=str(e))
+            raise
+
+    def fetch_titles(self, session, url, parse, rate_limiter=None, encoding='utf-8'):
+        """
+        캐시를 거쳐 URL의 제목 리스트를 가져옵니다.
+
+        Args:
+            session (requests.Session): 요청에 사용할 세션
+            url (str): 요청 URL
+            parse (callable): 응답 텍스트를 받아 제목 리스트를 반환하는 함수
+            rate_limiter (HostRateLimiter): 실제 요청 전에 대기할 속도 제한기
+            encoding (str): 응답 텍스트 인코딩
+
+        Returns:
+            list: 제목 리스트
+        """
+        # 카세트 기록/재생 중에는 캐시를 읽지도 쓰지도 않음
+        bypass = cassette_active(session)
+        entry = None if bypass else self.lookup(url)
+        if not self.covers(entry, None):
+            entry = None
+        if self.is_fresh(entry):
+            self.metrics.observe(url, OUTCOME_FRESH, items=len(entry['titles']))
+            return entry['titles']
+
+        self._check_circuit(session, url)
+        if rate_limiter is not None:
+            rate_limiter.wait(url)
+        response = None
+        try:
+            started = time.perf_counter()
+            response = session.get(url, headers=self.conditional_headers(entry))
+            # stream=False이면 본문까지 읽은 뒤 반환되므로 TTFB 이후는 다운로드 시간
+            timings = getattr(response, 'timings', None)
+            download = time.perf_counter() - started - timings['ttfb'] if timings else 0.0
+
+            # 변경 없음: 재파싱 없이 이전 결과 사용
+            if response.status_code == 304 and entry is not None:
+                self.touch(url, response)
+                self.metrics.observe(url, OUTCOME_NOT_MODIFIED, response, download,
+                                     items=len(entry['titles']))
+                return entry['titles']
+
+            response.raise_for_status()
+            response.encoding = encoding
+            parse_started = time.perf_counter()
+            titles = parse(response.text)
+            parse_seconds = time.perf_counter() - parse_started
+        except Exception as e:
+            self.metrics.observe(url, OUTCOME_ERROR, response, error=str(e))
+            raise
+        self.metrics.observe(url, OUTCOME_OK, response, download, parse_seconds,
+                             len(response.content), len(titles))
+        if not bypass:
+            self.store(url, response, titles)
+        return titles
+
+    def iter_titles(self, session, url, iter_parse, limit=None, rate_limiter=None,
+                    chunk_size=16 * 1024, cancel=None, cache_key=None):
+        """
+        캐시를 거쳐 URL의 제목을 하나씩 반환합니다 (스트리밍 파싱).
+        limit개를 채우면 응답을 닫아 나머지 본문은 받지도 파싱하지도 않습니다.
+        limit에서 멈춘 결과도 그 limit과 함께 캐시에 저장해, 같거나 더 작은 limit 요청에
+        그대로(또는 304 재검증 후) 사용합니다.
+
+        Args:
+            session (requests.Session): 요청에 사용할 세션
+            url (str): 요청 URL
+            iter_parse (callable): (bytes 조각 이터러블, limit)을 받아 제목을 yield하는 함수
+            limit (int): 최대 제목 수 (None이면 끝까지)
+            rate_limiter (HostRateLimiter): 실제 요청 전에 대기할 속도 제한기
+            chunk_size (int): 한 번에 읽을 바이트 수
+            cancel (CancelToken): 요청 직전과 응답 조각마다 확인할 취소 토큰
+            cache_key (str): 캐시 항목 키 (같은 URL을 다른 파서로 읽을 때 구분, 기본값은 url)
+
+        Yields:
+            str: 제목
+        """
+        cache_key = cache_key or url
+        # 카세트 기록/재생 중에는 캐시를 읽지도 쓰지도 않음
+        bypass = cassette_active(session)
+        entry = None if bypass else self.lookup(cache_key)
+        if not self.covers(entry, limit):
+            # 더 많은 제목이 필요하면 이전 결과로는 부족하므로 조건부 요청도 하지 않음
+            entry = None
+        if self.is_fresh(entry):
+            self.metrics.observe(url, OUTCOME_FRESH, items=len(entry['titles'][:limit]))
+            yield from islice(entry['titles'], limit)
+            return
+
+        self._check_circuit(session, url)
+        if rate_limiter is not None:
+            rate_limiter.wait(url, cancel)
+        if cancel is not None:
+            cancel.raise_if_cancelled()
+        try:
+            # 재시도 대기 중에도 취소를 확인
+            with cancel_scope(cancel):
+                response = session.get(url, headers=self.conditional_headers(entry), stream=True)
+        except CrawlCancelled:
+            raise
+        except Exception as e:
+            self.metrics.observe(url, OUTCOME_ERROR, error=str(e))
+            raise
+        with closing(response):
+            # 변경 없음: 재파싱 없이 이전 결과 사용
+            if response.status_code == 304 and entry is not None:
+                self.touch(cache_key, response)
+                self.metrics.observe(url, OUTCOME_NOT_MODIFIED, response,
+                                     items=len(entry['titles'][:limit]))
+                yield from islice(entry['titles'], limit)
+                return
+
+            # 다운로드와 파싱이 번갈아 일어나므로 파서의 next() 시간에서 조각 대기 시간을 뺌
+            stats = {}
+            busy = 0.0
+            titles = []
+            outcome, error = OUTCOME_OK, None
+            try:
+                response.raise_for_status()
+                titles_iter = iter_parse(iter_chunks(response, chunk_size, cancel, stats), limit)
+                while True:
+                    started = time.perf_counter()
+                    title = next(titles_iter, None)
+                    busy += time.perf_counter() - started
+                    if title is None:
+                        break
+                    titles.append(title)
+                    yield title
+            except CrawlCancelled:
+                outcome = None
+                raise
+            except Exception as e:
+                outcome, error = OUTCOME_ERROR, str(e)
+                raise
+            finally:
+                # 소비자가 중간에 멈춘 경우(GeneratorExit)도 받은 만큼 기록
+                if outcome is not None:
+                    download = stats.get('download', 0.0)
+                    self.metrics.observe(url, outcome, response, download, max(0.0, busy - download),
+                                         stats.get('bytes', 0), len(titles), error)
+            # 끝까지 읽었으면(제목이 limit보다 적으면) 전체 결과로 저장
+            complete = limit is None or len(titles) < limit
+            if not bypass:
+                self.store(cache_key, response, titles, None if complete else limit)
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache():
+    """모든 크롤러 클래스가 함께 사용하는 기본 캐시를 반환합니다."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+        return _default_cache
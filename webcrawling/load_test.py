@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+전체 수집 파이프라인 부하 테스트
+로컬 뉴스 서버(mock_news_server.py)를 띄우고 공유 세션 → 속도 제한 → 응답 캐시 →
+스트리밍 파싱으로 이어지는 실제 수집 경로를 동시 검색어 수를 바꿔 가며 실행해
+초당 검색어/제목 처리량, 검색어별 지연 백분위수, 실패 수를 측정합니다.
+
+사용 예:
+    python load_test.py -c 10 100 1000
+    python load_test.py -c 50 200 --latency 0.05 --jitter 0.2 --error-rate 0.01 --rps-limit 100
+    python load_test.py -c 100 --base-url http://127.0.0.1:8765 --client-rps 20
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from batch_crawl import DEFAULT_SOURCES, SOURCE_ALIASES, resolve_source
+from fetch_engine import ConcurrentFetcher
+from http_cache import ResponseCache
+from metrics import CrawlMetrics
+from mock_news_server import add_server_arguments, server_from_args
+from news_sources import create_sources
+from rate_limiter import DEFAULT_HOST_LIMITS, HostRateLimiter
+from resilience import CircuitBreakerBoard
+from transport import create_session, use_base_url
+
+
+DEFAULT_CONCURRENCY = (10, 100, 1000)
+# 클라이언트 속도 제한을 끌 때 쓰는 사실상 무제한 초당 요청 수
+UNLIMITED_RPS = 1e9
+CACHE_PATH = os.path.join(tempfile.gettempdir(), 'news_load_test_cache.sqlite3')
+
+
+def _percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run_level(base_url, concurrency, queries, sources, limit=None, client_rps=None):
+    """
+    동시 검색어 수 하나로 부하 테스트를 한 번 실행합니다.
+
+    Args:
+        base_url (str): 요청을 보낼 서버 주소
+        concurrency (int): 동시에 실행할 검색어 수 (스레드/연결 수)
+        queries (int): 실행할 전체 검색어(키워드×소스 작업) 수
+        sources (list): 소스 이름들 (작업마다 돌아가며 사용)
+        limit (int): 검색어당 최대 제목 수
+        client_rps (float): 호스트별 클라이언트 속도 제한 (None이면 제한 없음)
+
+    Returns:
+        dict: concurrency, queries, failures, titles, wall_s, queries_per_sec,
+              titles_per_sec, p50_ms, p95_ms, p99_ms, sources(계측 요약), breakers(회로 상태)
+    """
+    # 실행마다 새 세션/캐시/계측기를 써서 이전 단계의 연결이나 캐시가 섞이지 않도록 함
+    breakers = CircuitBreakerBoard()
+    session = create_session(pool_connections=len(sources), pool_maxsize=concurrency, breakers=breakers)
+    use_base_url(session, base_url)
+    rate = client_rps or UNLIMITED_RPS
+    rate_limiter = HostRateLimiter({host: (rate, max(1, concurrency)) for host in DEFAULT_HOST_LIMITS},
+                                   default_rate=rate, default_burst=max(1, concurrency))
+    metrics = CrawlMetrics()
+    # TTL 0: 캐시 조회/저장은 거치지만 매번 실제로 요청
+    cache = ResponseCache(CACHE_PATH, ttl=0, metrics=metrics)
+    cache.clear()
+    news_sources = create_sources(session, rate_limiter, cache, names=sources)
+
+    latencies = []
+    failures = []
+
+    def run_query(keyword, source):
+        started = time.perf_counter()
+        try:
+            return news_sources[source].crawl(keyword, limit)
+        except Exception as e:
+            failures.append(f"{source}: {e}")
+            return []
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    jobs = {}
+    for i in range(queries):
+        keyword = f"부하테스트 {i}"
+        source = sources[i % len(sources)]
+        jobs[(keyword, source)] = lambda keyword=keyword, source=source: run_query(keyword, source)
+
+    titles = 0
+    started = time.perf_counter()
+    for _, result in ConcurrentFetcher(max_workers=concurrency).iter_results(jobs):
+        titles += len(result)
+    wall = time.perf_counter() - started
+
+    session.close()
+    cache.clear()
+
+    return {
+        'concurrency': concurrency,
+        'queries': queries,
+        'failures': len(failures),
+        'failure_samples': failures[:5],
+        'titles': titles,
+        'wall_s': wall,
+        'queries_per_sec': queries / wall if wall else 0.0,
+        'titles_per_sec': titles / wall if wall else 0.0,
+        'p50_ms': 1000 * _percentile(latencies, 0.50),
+        'p95_ms': 1000 * _percentile(latencies, 0.95),
+        'p99_ms': 1000 * _percentile(latencies, 0.99),
+        'sources': metrics.summary(),
+        'breakers': breakers.format_status(),
+    }
+
+
+def format_result(result):
+    return (f"{result['concurrency']:>6} {result['queries']:>7} {result['failures']:>5} "
+            f"{result['titles']:>8} {result['wall_s']:>8.2f} {result['queries_per_sec']:>9.1f} "
+            f"{result['titles_per_sec']:>10.0f} {result['p50_ms']:>8.0f} {result['p95_ms']:>8.0f} "
+            f"{result['p99_ms']:>8.0f}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="로컬 뉴스 서버 대상 수집 파이프라인 부하 테스트")
+    parser.add_argument('-c', '--concurrency', type=int, nargs='+', default=list(DEFAULT_CONCURRENCY),
+                        help="동시 검색어 수들 (기본값: 10 100 1000)")
+    parser.add_argument('-q', '--queries', type=int, default=None,
+                        help="단계별 전체 검색어 수 (기본값: 동시 검색어 수 × --rounds)")
+    parser.add_argument('--rounds', type=int, default=2, help="검색어 수를 정할 때 동시 검색어 수에 곱할 값")
+    parser.add_argument('-s', '--sources', nargs='+', default=None,
+                        help=f"소스들 ({', '.join(SOURCE_ALIASES)}). 기본값: daum google yna")
+    parser.add_argument('-n', '--limit', type=int, default=None, help="검색어당 최대 제목 수")
+    parser.add_argument('--client-rps', type=float, default=None,
+                        help="호스트별 클라이언트 초당 요청 수 (기본값: 제한 없음)")
+    parser.add_argument('--base-url', help="이미 실행 중인 서버 주소 (없으면 내장 서버 실행)")
+    parser.add_argument('--json', help="결과를 저장할 JSON 파일")
+    add_server_arguments(parser)
+    args = parser.parse_args(argv)
+
+    try:
+        args.sources = [resolve_source(name) for name in args.sources] if args.sources else list(DEFAULT_SOURCES)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def main(argv=None):
+    """부하 테스트 실행 함수"""
+    args = parse_args(argv)
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server = server_from_args(args).start()
+        base_url = server.base_url
+    print(f"대상 서버: {base_url} / 소스: {', '.join(args.sources)}")
+    print(f"{'동시':>5} {'검색어':>5} {'실패':>4} {'제목':>7} {'시간(s)':>6} {'검색어/s':>7} "
+          f"{'제목/s':>8} {'p50ms':>8} {'p95ms':>8} {'p99ms':>8}")
+
+    results = []
+    try:
+        for concurrency in args.concurrency:
+            queries = args.queries or concurrency * args.rounds
+            result = run_level(base_url, concurrency, queries, args.sources, args.limit, args.client_rps)
+            results.append(result)
+            print(format_result(result))
+            for sample in result['failure_samples']:
+                print(f"   ! {sample}")
+            if result['breakers']:
+                print(f"   회로: {result['breakers']}")
+    finally:
+        if server is not None:
+            server.stop()
+            print("\n서버 응답: " + ', '.join(f"{key} {value}" for key, value in server.stats.items()))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"📁 저장된 파일: {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
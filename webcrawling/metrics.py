@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 계측
+요청마다 연결(DNS+TCP+TLS), 첫 바이트까지의 시간(TTFB), 다운로드 바이트/시간,
+파싱 시간, 추출 항목 수, 실패 여부를 기록하고 소스별로 집계합니다.
+집계 결과는 JSON 실행 보고서와 Prometheus 텍스트 형식으로 내보낼 수 있습니다.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from urllib.parse import urlparse
+
+
+# 호스트 → 소스 이름 (목록에 없는 호스트는 호스트 이름 그대로 사용)
+HOST_SOURCES = {
+    'search.naver.com': "네이버 뉴스",
+    'search.daum.net': "다음 뉴스",
+    'news.google.com': "구글 뉴스",
+    'www.yna.co.kr': "연합뉴스",
+}
+
+# 요청 결과 구분
+OUTCOME_OK = 'ok'
+OUTCOME_FRESH = 'cache_fresh'          # TTL 안이라 요청 생략
+OUTCOME_NOT_MODIFIED = 'not_modified'  # 304 응답
+OUTCOME_ERROR = 'error'
+
+PHASES = ('connect', 'ttfb', 'download', 'parse')
+
+DEFAULT_REPORT_PATH = 'crawl_report.json'
+DEFAULT_PROMETHEUS_PATH = 'crawl_metrics.prom'
+
+
+def source_for_url(url):
+    """URL의 호스트로 소스 이름을 찾습니다."""
+    host = urlparse(url).hostname or ''
+    return HOST_SOURCES.get(host, host)
+
+
+def _percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class CrawlMetrics:
+    def __init__(self, max_records=10000):
+        """
+        Args:
+            max_records (int): 보고서용으로 보관할 최근 요청 기록 수
+                               (누적 카운터는 개수와 관계없이 계속 유지)
+        """
+        self._lock = threading.Lock()
+        self.records = deque(maxlen=max_records)
+        self.started_at = time.time()
+        # Prometheus용 누적 카운터: {(소스, 결과): 값}, {(소스, 단계): [합계, 개수]}
+        self._request_counts = {}
+        self._bytes = {}
+        self._items = {}
+        self._phase_sums = {}
+
+    def observe(self, url, outcome, response=None, download=0.0, parse=0.0, nbytes=0, items=0,
+                error=None):
+        """
+        요청 하나의 결과를 기록합니다.
+
+        Args:
+            url (str): 요청 URL
+            outcome (str): OUTCOME_* 중 하나
+            response (requests.Response): 응답 (전송 계층이 붙인 connect/ttfb 시간 사용)
+            download (float): 본문 다운로드 시간(초)
+            parse (float): 파싱 시간(초)
+            nbytes (int): 받은 본문 바이트 수
+            items (int): 추출한 항목 수
+            error (str): 실패 사유
+        """
+        timings = getattr(response, 'timings', None) or {}
+        record = {
+            'time': time.time(),
+            'source': source_for_url(url),
+            'url': url,
+            'outcome': outcome,
+            'status': getattr(response, 'status_code', None),
+            'connect': timings.get('connect', 0.0),
+            'reused_connection': timings.get('reused', None),
+            'ttfb': timings.get('ttfb', 0.0),
+            'download': download,
+            'parse': parse,
+            'bytes': nbytes,
+            'items': items,
+            'error': error,
+        }
+        source = record['source']
+        with self._lock:
+            self.records.append(record)
+            key = (source, outcome)
+            self._request_counts[key] = self._request_counts.get(key, 0) + 1
+            self._bytes[source] = self._bytes.get(source, 0) + nbytes
+            self._items[source] = self._items.get(source, 0) + items
+            # 네트워크를 타지 않은 요청은 시간 분포에서 제외
+            if outcome != OUTCOME_FRESH:
+                for phase in PHASES:
+                    # 연결 시간은 새 연결을 맺은 요청만 집계 (keep-alive 재사용 제외)
+                    if phase == 'connect' and record['reused_connection'] is not False:
+                        continue
+                    sums = self._phase_sums.setdefault((source, phase), [0.0, 0])
+                    sums[0] += record[phase]
+                    sums[1] += 1
+        return record
+
+    def summary(self, since=None):
+        """
+        소스별 집계를 반환합니다.
+
+        Args:
+            since (float): 이 시각(epoch 초) 이후 기록만 집계 (None이면 보관 중인 전체)
+
+        Returns:
+            dict: {소스: {'requests', 'failures', 'cache_hits', 'bytes', 'items',
+                         'connect_ms', 'ttfb_ms', 'ttfb_p95_ms', 'download_ms', 'parse_ms'}}
+        """
+        with self._lock:
+            records = [r for r in self.records if since is None or r['time'] >= since]
+
+        grouped = {}
+        for record in records:
+            grouped.setdefault(record['source'], []).append(record)
+
+        summary = {}
+        for source, rows in grouped.items():
+            network = [r for r in rows if r['outcome'] != OUTCOME_FRESH]
+            connects = [r['connect'] for r in network if r['reused_connection'] is False]
+            ttfbs = [r['ttfb'] for r in network]
+            summary[source] = {
+                'requests': len(rows),
+                'failures': sum(1 for r in rows if r['outcome'] == OUTCOME_ERROR),
+                'cache_hits': sum(1 for r in rows if r['outcome'] in (OUTCOME_FRESH, OUTCOME_NOT_MODIFIED)),
+                'bytes': sum(r['bytes'] for r in rows),
+                'items': sum(r['items'] for r in rows),
+                'connect_ms': 1000 * sum(connects) / len(connects) if connects else 0.0,
+                'ttfb_ms': 1000 * sum(ttfbs) / len(ttfbs) if ttfbs else 0.0,
+                'ttfb_p95_ms': 1000 * _percentile(ttfbs, 0.95),
+                'download_ms': 1000 * sum(r['download'] for r in network),
+                'parse_ms': 1000 * sum(r['parse'] for r in rows),
+            }
+        return summary
+
+    def report(self, since=None):
+        """
+        JSON 실행 보고서용 딕셔너리를 만듭니다.
+
+        Returns:
+            dict: {'started_at', 'generated_at', 'sources', 'requests'}
+        """
+        with self._lock:
+            records = [dict(r) for r in self.records if since is None or r['time'] >= since]
+        return {
+            'started_at': self.started_at,
+            'generated_at': time.time(),
+            'sources': self.summary(since),
+            'requests': records,
+        }
+
+    def write_json(self, path=DEFAULT_REPORT_PATH, since=None):
+        """JSON 실행 보고서를 파일로 저장합니다."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(since), f, ensure_ascii=False, indent=2)
+        return path
+
+    def to_prometheus(self):
+        """
+        누적 카운터를 Prometheus 텍스트 형식으로 만듭니다.
+
+        Returns:
+            str: Prometheus exposition 텍스트
+        """
+        with self._lock:
+            request_counts = dict(self._request_counts)
+            nbytes = dict(self._bytes)
+            items = dict(self._items)
+            phase_sums = {key: list(value) for key, value in self._phase_sums.items()}
+
+        lines = [
+            '# HELP news_crawl_requests_total 소스/결과별 요청 수',
+            '# TYPE news_crawl_requests_total counter',
+        ]
+        for (source, outcome), value in sorted(request_counts.items()):
+            lines.append(f'news_crawl_requests_total{{source="{_escape_label(source)}",'
+                         f'outcome="{outcome}"}} {value}')
+
+        lines += ['# HELP news_crawl_response_bytes_total 소스별 받은 본문 바이트 수',
+                  '# TYPE news_crawl_response_bytes_total counter']
+        for source, value in sorted(nbytes.items()):
+            lines.append(f'news_crawl_response_bytes_total{{source="{_escape_label(source)}"}} {value}')
+
+        lines += ['# HELP news_crawl_items_total 소스별 추출 항목 수',
+                  '# TYPE news_crawl_items_total counter']
+        for source, value in sorted(items.items()):
+            lines.append(f'news_crawl_items_total{{source="{_escape_label(source)}"}} {value}')
+
+        lines += ['# HELP news_crawl_phase_seconds 요청 단계별 소요 시간',
+                  '# TYPE news_crawl_phase_seconds summary']
+        for (source, phase), (total, count) in sorted(phase_sums.items()):
+            labels = f'source="{_escape_label(source)}",phase="{phase}"'
+            lines.append(f'news_crawl_phase_seconds_sum{{{labels}}} {total:.6f}')
+            lines.append(f'news_crawl_phase_seconds_count{{{labels}}} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path=DEFAULT_PROMETHEUS_PATH):
+        """Prometheus 텍스트 파일을 저장합니다 (node_exporter textfile 수집기용)."""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.to_prometheus())
+        return path
+
+    def format_summary(self, since=None):
+        """
+        콘솔/GUI 표시용 요약 문자열을 만듭니다.
+
+        Returns:
+            str: 소스별 한 줄 요약
+        """
+        lines = []
+        for source, stats in sorted(self.summary(since).items()):
+            lines.append(
+                f"{source}: 요청 {stats['requests']}회 (실패 {stats['failures']}, 캐시 {stats['cache_hits']}), "
+                f"연결 {stats['connect_ms']:.0f}ms, TTFB {stats['ttfb_ms']:.0f}ms, "
+                f"다운로드 {stats['bytes'] / 1024:.1f}KB/{stats['download_ms']:.0f}ms, "
+                f"파싱 {stats['parse_ms']:.0f}ms, 항목 {stats['items']}개"
+            )
+        return '\n'.join(lines)
+
+
+_default_metrics = None
+_default_metrics_lock = threading.Lock()
+
+
+def get_default_metrics():
+    """모든 크롤러 클래스가 함께 기록하는 기본 계측기를 반환합니다."""
+    global _default_metrics
+    with _default_metrics_lock:
+        if _default_metrics is None:
+            _default_metrics = CrawlMetrics()
+        return _default_metrics
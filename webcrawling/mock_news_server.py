@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+부하 테스트용 로컬 뉴스 서버
+네이버/다음/연합뉴스 검색 결과 페이지와 구글 뉴스 RSS 모양의 응답을 합성 템플릿이나
+저장해 둔 페이지(HTML 파일/카세트)로 돌려주고, 결과 속 기사 링크에는 상용구가 섞인 합성 기사
+본문 페이지로 응답합니다. 응답 지연, 오류 비율, 429(요청 한도 초과)
+응답, 페이지 넘김을 설정할 수 있어 동시성/속도 제한 값을 실제 사이트에 부담을 주지 않고
+조정할 수 있습니다.
+
+요청 경로의 첫 부분이 원래 호스트입니다:
+    http://127.0.0.1:8765/search.daum.net/search?w=news&q=...
+
+크롤러는 세션의 기준 URL만 바꾸면 그대로 이 서버를 사용합니다 (transport.use_base_url):
+    use_base_url(session, 'http://127.0.0.1:8765')
+    NEWS_BASE_URL=http://127.0.0.1:8765 python news_crawler_alternative.py
+
+사용 예:
+    python mock_news_server.py --port 8765 --latency 0.05 --jitter 0.1 --error-rate 0.02
+    python mock_news_server.py --rps-limit 20 --fixtures captured_pages/
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from parser_benchmark import (cassette_fixtures, directory_fixtures, make_article_page,
+                              make_daum_page, make_google_rss, make_naver_page, make_yna_page)
+from rate_limiter import TokenBucket
+
+
+DEFAULT_PORT = 8765
+
+# 원래 호스트 → (소스 종류, 검색어 파라미터)
+HOST_ROUTES = {
+    'search.naver.com': ('naver', 'query'),
+    'search.daum.net': ('daum', 'q'),
+    'www.yna.co.kr': ('yna', 'query'),
+    'news.google.com': ('google', 'q'),
+}
+
+# 기사 본문 페이지로 응답할 (원래 호스트, 경로 접두사): 합성 검색 결과의 기사 링크와 맞춤
+ARTICLE_ROUTES = (
+    ('n.news.naver.com', '/mnews/article/'),
+    ('v.daum.net', '/v/'),
+    ('www.yna.co.kr', '/view/'),
+)
+
+_CONTENT_TYPES = {
+    'google': 'application/rss+xml; charset=utf-8',
+}
+
+
+def page_offset(kind, params, page_size):
+    """
+    검색 파라미터에서 페이지 첫 기사 번호(0부터)를 구합니다.
+    네이버는 start(1, 11, 21 ...), 나머지는 page(1, 2, 3 ...)를 사용합니다.
+    """
+    try:
+        if kind == 'naver':
+            return max(0, int(params.get('start', ['1'])[0]) - 1)
+        return max(0, int(params.get('page', ['1'])[0]) - 1) * page_size
+    except ValueError:
+        return 0
+
+
+def render_page(kind, keyword, first, count):
+    """
+    합성 템플릿으로 검색 결과 페이지 본문을 만듭니다.
+
+    Args:
+        kind (str): 소스 종류 (naver, daum, yna, google)
+        keyword (str): 검색 키워드 (제목에 포함)
+        first (int): 첫 기사 번호
+        count (int): 기사 수 (0이면 빈 결과 페이지)
+
+    Returns:
+        bytes: UTF-8 본문
+    """
+    if kind == 'naver':
+        body = make_naver_page(count, first=first, topic=keyword)
+    elif kind == 'daum':
+        body = make_daum_page(count, first=first, topic=keyword)
+    elif kind == 'yna':
+        body = make_yna_page(count, first=first, topic=keyword)
+    else:
+        body = make_google_rss(count, first=first, topic=keyword)
+    return body.encode('utf-8')
+
+
+class _ThreadingServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # 동시 연결이 많을 때 연결 대기열이 넘쳐 재시도 지연이 생기지 않도록
+    request_queue_size = 1024
+
+    def handle_error(self, request, client_address):
+        # 클라이언트가 먼저 끊은 연결(재시도, 취소 등)은 무시
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class MockNewsServer:
+    def __init__(self, host='127.0.0.1', port=0, latency=0.0, jitter=0.0, error_rate=0.0,
+                 throttle_rate=0.0, rps_limit=None, retry_after=1, page_size=10, pages=5,
+                 fixtures=None, seed=None):
+        """
+        Args:
+            host (str): 바인딩할 주소
+            port (int): 포트 (0이면 빈 포트 자동 선택)
+            latency (float): 모든 응답에 더할 고정 지연(초)
+            jitter (float): 0~jitter초 사이의 무작위 추가 지연
+            error_rate (float): 500/503으로 응답할 비율 (0~1)
+            throttle_rate (float): 무작위로 429를 돌려줄 비율 (0~1)
+            rps_limit (float): 원래 호스트별 초당 허용 요청 수. 넘으면 429 (None이면 무제한)
+            retry_after (int): 429 응답의 Retry-After 값(초)
+            page_size (int): 페이지당 기사 수
+            pages (int): 키워드별 결과 페이지 수 (이후 페이지는 빈 결과)
+            fixtures (list): (소스 종류, 이름, bytes) 리스트. 주어진 종류는 템플릿 대신
+                             이 페이지들을 돌아가며 응답
+            seed (int): 지연/오류 난수 시드
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.rps_limit = rps_limit
+        self.retry_after = retry_after
+        self.page_size = page_size
+        self.pages = pages
+        self.fixtures = {}
+        for kind, _, body in fixtures or []:
+            self.fixtures.setdefault(kind, []).append(body)
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._buckets = {}
+        self._fixture_cursors = {}
+        self.stats = {'requests': 0, 'ok': 0, 'throttled': 0, 'errors': 0, 'not_found': 0}
+
+        self._httpd = _ThreadingServer((host, port), self._handler_class())
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """크롤러 세션에 넘길 기준 URL"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # keep-alive 연결 재사용 (실제 사이트와 같은 조건)
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                status, headers, body = server.handle(self.path)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def _throttled(self, host):
+        if self.rps_limit is None:
+            return False
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.rps_limit, max(1, int(self.rps_limit)))
+                self._buckets[host] = bucket
+        return not bucket.try_acquire()
+
+    def _next_fixture(self, kind):
+        with self._lock:
+            cursor = self._fixture_cursors.get(kind, 0)
+            self._fixture_cursors[kind] = cursor + 1
+        bodies = self.fixtures[kind]
+        return bodies[cursor % len(bodies)]
+
+    def handle(self, path):
+        """
+        요청 경로 하나에 대한 응답을 만듭니다 (요청 스레드에서 호출).
+
+        Args:
+            path (str): '/원래호스트/경로?쿼리' 형태의 요청 경로
+
+        Returns:
+            tuple: (상태 코드, 헤더 dict, 본문 bytes)
+        """
+        self._count('requests')
+        parts = urlsplit(path)
+        host, _, rest = parts.path.lstrip('/').partition('/')
+        rest = '/' + rest
+        if any(host == article_host and rest.startswith(prefix)
+               for article_host, prefix in ARTICLE_ROUTES):
+            route = ('article', None)
+        else:
+            route = HOST_ROUTES.get(host)
+        if route is None:
+            self._count('not_found')
+            return 404, {'Content-Type': 'text/plain; charset=utf-8'}, b'unknown host'
+        kind, query_param = route
+
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            roll = self._random.random()
+        if delay:
+            time.sleep(delay)
+
+        if self._throttled(host) or roll < self.throttle_rate:
+            self._count('throttled')
+            return 429, {'Retry-After': str(self.retry_after),
+                         'Content-Type': 'text/plain; charset=utf-8'}, b'too many requests'
+        if roll < self.throttle_rate + self.error_rate:
+            self._count('errors')
+            status = 503 if roll < self.throttle_rate + self.error_rate / 2 else 500
+            return status, {'Content-Type': 'text/plain; charset=utf-8'}, b'server error'
+
+        if kind in self.fixtures:
+            body = self._next_fixture(kind)
+        elif kind == 'article':
+            body = make_article_page(rest.rstrip('/').rsplit('/', 1)[-1]).encode('utf-8')
+        else:
+            params = parse_qs(parts.query)
+            keyword = params.get(query_param, [''])[0] or '뉴스'
+            first = page_offset(kind, params, self.page_size)
+            count = self.page_size if first < self.page_size * self.pages else 0
+            body = render_page(kind, keyword, first, count)
+
+        self._count('ok')
+        return 200, {'Content-Type': _CONTENT_TYPES.get(kind, 'text/html; charset=utf-8')}, body
+
+    def start(self):
+        """백그라운드 스레드에서 서버를 시작합니다."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """현재 스레드에서 서버를 실행합니다 (Ctrl+C로 종료)."""
+        self._httpd.serve_forever()
+
+    def stop(self):
+        """서버를 멈추고 포트를 닫습니다."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def load_fixtures(fixtures_dir=None, cassettes=()):
+    """HTML 파일 디렉터리와 카세트에서 (소스 종류, 이름, bytes) 리스트를 만듭니다."""
+    fixtures = directory_fixtures(fixtures_dir) if fixtures_dir else []
+    for path in cassettes:
+        fixtures.extend(cassette_fixtures(path))
+    return fixtures
+
+
+def add_server_arguments(parser):
+    """서버 설정 명령행 인자를 추가합니다 (load_test.py와 공유)."""
+    parser.add_argument('--latency', type=float, default=0.0, help="고정 응답 지연(초)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="0~N초 무작위 추가 지연")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="500/503 응답 비율 (0~1)")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="무작위 429 응답 비율 (0~1)")
+    parser.add_argument('--rps-limit', type=float, default=None, help="호스트별 초당 허용 요청 수 (넘으면 429)")
+    parser.add_argument('--retry-after', type=int, default=1, help="429 응답의 Retry-After(초)")
+    parser.add_argument('--page-size', type=int, default=10, help="페이지당 기사 수")
+    parser.add_argument('--pages', type=int, default=5, help="키워드별 결과 페이지 수")
+    parser.add_argument('--fixtures', help="naver_*.html/daum_*.html/yna_*.html/google_*.xml 디렉터리")
+    parser.add_argument('--cassette', nargs='+', default=[], help="응답으로 돌려줄 페이지가 담긴 카세트")
+    parser.add_argument('--seed', type=int, default=None, help="난수 시드")
+
+
+def server_from_args(args, host='127.0.0.1', port=0):
+    """add_server_arguments로 받은 인자로 서버를 만듭니다."""
+    return MockNewsServer(
+        host=host, port=port, latency=args.latency, jitter=args.jitter,
+        error_rate=args.error_rate, throttle_rate=args.throttle_rate, rps_limit=args.rps_limit,
+        retry_after=args.retry_after, page_size=args.page_size, pages=args.pages,
+        fixtures=load_fixtures(args.fixtures, args.cassette), seed=args.seed,
+    )
+
+
+def main(argv=None):
+    """서버 실행 함수"""
+    parser = argparse.ArgumentParser(description="부하 테스트용 로컬 뉴스 서버")
+    parser.add_argument('--host', default='127.0.0.1', help="바인딩할 주소")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"포트 (기본값: {DEFAULT_PORT})")
+    add_server_arguments(parser)
+    args = parser.parse_args(argv)
+
+    server = server_from_args(args, args.host, args.port)
+    print(f"로컬 뉴스 서버: {server.base_url} (Ctrl+C로 종료)")
+    print(f"크롤러 연결: NEWS_BASE_URL={server.base_url} python news_crawler_alternative.py")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n서버를 종료합니다.")
+    finally:
+        server.stop()
+    print(', '.join(f"{key} {value}" for key, value in server.stats.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,24 +5,217 @@
 """
 
 import requests
-from bs4 import BeautifulSoup
 import time
 import csv
-from urllib.parse import urljoin
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import parse_qs, quote, urljoin, urlsplit
 import os
 
+from article_store import ArticleStoreMixin
+from cassette import add_page
+from dedup import OrderedDeduper
+from fast_parse import (LINKS_WITH_HREF, LONG_TEXT_LINKS, NAVER_AREA_INFOS, NAVER_AREA_TITLE_LINK,
+                        NAVER_NEWS_MODULE_LINKS, NAVER_NEWS_TITLE_LINKS, iter_pull_elements,
+                        node_text, parse_document)
+from http_cache import get_default_cache
+from metrics import get_default_metrics
+from rate_limiter import default_limiter
+from resilience import raise_if_circuit_open
+from transport import CrawlCancelled, get_default_session
 
-class NaverNewsCrawler:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-        # SSL 인증서 검증 비활성화 (개발/테excel목적)
-        self.session.verify = False
-        # SSL 경고 메시지 숨기기
-        import urllib3
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# 네이버 뉴스 검색 결과의 기사 시각 표기 (예: "3시간 전", "2024.01.05.")
+_RELATIVE_TIME_RE = re.compile(r'(\d+)\s*(분|시간|일|주)\s*전')
+_ABSOLUTE_DATE_RE = re.compile(r'(\d{4})\.(\d{1,2})\.(\d{1,2})\.?')
+_RELATIVE_UNITS = {'분': 60, '시간': 3600, '일': 86400, '주': 7 * 86400}
+
+# 디버그 모드에서 받은 페이지를 재생용으로 모아 두는 카세트 (cassette.py 참고)
+DEBUG_CASSETTE_PATH = 'debug_pages.cassette.gz'
+# 디버그 카세트에 남길 최대 페이지 수 (같은 URL은 마지막으로 받은 페이지 하나만 유지)
+DEBUG_CASSETTE_MAX_PAGES = 50
+
+
+def parse_naver_date(text, now=None):
+    """
+    네이버 검색 결과의 기사 시각 표기를 epoch 초로 변환합니다.
+    
+    날짜만 있는 표기는 그날의 마지막 시각(23:59:59)으로 봅니다. 자정으로 보면
+    같은 날 since 이후에 나온 기사도 since보다 오래된 것으로 판단하기 때문입니다.
+    
+    Args:
+        text (str): 시각 표기 문자열 (예: "3시간 전", "2024.01.05.")
+        now (float): 상대 시각의 기준 (없으면 현재 시각)
+        
+    Returns:
+        float: epoch 초. 시각 표기가 아니면 None
+    """
+    match = _RELATIVE_TIME_RE.search(text)
+    if match:
+        now = time.time() if now is None else now
+        return now - int(match.group(1)) * _RELATIVE_UNITS[match.group(2)]
+    match = _ABSOLUTE_DATE_RE.search(text)
+    if match:
+        year, month, day = (int(group) for group in match.groups())
+        try:
+            return datetime(year, month, day, 23, 59, 59).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+# 4번째 추출 방법의 제목 판별 (문자마다 ord()를 비교하던 것을 정규식 한 번으로)
+_HANGUL_RE = re.compile('[가-힣]')
+_AD_WORDS_RE = re.compile(r'광고|이벤트|혜택|할인|무료|증정|\$')
+# URL 패턴을 나눌 때 값까지 구분하는 검색 파라미터 (where=news / where=nv 등 페이지 구조가 다름)
+_PATTERN_PARAMS = ('where',)
+
+
+def _titles_from_news_area(root):
+    # 1. 뉴스 검색 결과 영역에서 제목 추출 (div.news_area a.news_tit)
+    return [node_text(link) for link in NAVER_NEWS_TITLE_LINKS(root)]
+
+
+def _titles_from_news_module(root):
+    # 2. 통합검색의 뉴스 영역에서 제목 추출
+    return [node_text(link) for link in NAVER_NEWS_MODULE_LINKS(root)
+            if 'news.naver.com' in link.get('href', '')]
+
+
+def _titles_from_article_links(root):
+    # 3. 뉴스 제목만 포함하는 링크들 찾기 (href에 news.naver.com 포함)
+    titles = []
+    for link in LINKS_WITH_HREF(root):
+        href = link.get('href', '')
+        if 'news.naver.com' in href and '/article/' in href:
+            titles.append(node_text(link))
+    return titles
+
+
+def _titles_from_headline_text(root):
+    # 4. 마지막 방법: 제목 패턴으로 필터링 (한글 포함, 적절한 길이, 광고 문구 제외)
+    titles = []
+    for link in LONG_TEXT_LINKS(root):
+        text = node_text(link)
+        if 10 < len(text) < 100 and _HANGUL_RE.search(text) and not _AD_WORDS_RE.search(text):
+            titles.append(text)
+    return titles
+
+
+# 구조 기반 추출 방법 (원래 시도 순서, URL 패턴별로 기억함)
+NAVER_TITLE_STRATEGIES = (
+    _titles_from_news_area,
+    _titles_from_news_module,
+    _titles_from_article_links,
+)
+# 마지막 방법: 메뉴/연관 검색어 링크도 걸리는 휴리스틱이므로 기억하지 않고
+# 구조 기반 방법이 모두 실패한 페이지에서만 사용
+NAVER_FALLBACK_STRATEGY = _titles_from_headline_text
+
+
+def naver_url_pattern(url):
+    """
+    추출 방법을 기억할 URL 패턴을 만듭니다 (검색어/페이지 번호는 무시).
+
+    Args:
+        url (str): 페이지 URL
+
+    Returns:
+        str: 예) "search.naver.com/search.naver?where=news"
+    """
+    if not url:
+        return ''
+    parts = urlsplit(url)
+    params = parse_qs(parts.query)
+    key = '&'.join(f"{name}={params[name][0]}" for name in _PATTERN_PARAMS if name in params)
+    return f"{parts.hostname}{parts.path}?{key}"
+
+
+class NaverStrategySelector:
+    """URL 패턴별로 마지막에 성공한 제목 추출 방법을 기억해 먼저 시도하는 선택기"""
+
+    def __init__(self, strategies=NAVER_TITLE_STRATEGIES, fallback=NAVER_FALLBACK_STRATEGY,
+                 recheck_every=20):
+        """
+        Args:
+            strategies (tuple): 우선순위 순서의 추출 함수들 (lxml 루트 → 제목 리스트)
+            fallback (callable): strategies가 모두 실패했을 때만 쓰는 추출 함수 (기억하지 않음)
+            recheck_every (int): 이 횟수마다 한 번은 원래 순서대로 모두 시도
+                                 (페이지 구조가 원래대로 돌아온 경우를 다시 찾기 위함, 1이면 항상)
+        """
+        self.strategies = strategies
+        self.fallback = fallback
+        self.recheck_every = recheck_every
+        self._learned = {}
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def learned(self):
+        """
+        URL 패턴별로 기억한 추출 방법 번호(1부터)를 반환합니다.
+
+        Returns:
+            dict: {URL 패턴: 추출 방법 번호}
+        """
+        with self._lock:
+            return {pattern: index + 1 for pattern, index in self._learned.items()}
+
+    def extract(self, root, url=None):
+        """
+        제목을 추출합니다. 기억한 방법이 있으면 먼저 시도하고, 결과가 없으면
+        원래 순서대로 나머지 방법을 시도합니다. 모두 실패하면 마지막 휴리스틱 방법의
+        결과를 반환하지만, 그 방법은 기억하지 않습니다 (한 번의 이상한 페이지 때문에
+        이후 정상 페이지에서 메뉴 링크를 제목으로 읽지 않도록).
+
+        Args:
+            root: lxml 루트 요소
+            url (str): 페이지 URL
+
+        Returns:
+            list: 제목 리스트 (중복/길이 필터 전)
+        """
+        pattern = naver_url_pattern(url)
+        with self._lock:
+            calls = self._calls.get(pattern, 0)
+            self._calls[pattern] = calls + 1
+            learned = self._learned.get(pattern)
+        if calls % self.recheck_every == 0:
+            learned = None
+
+        if learned is not None:
+            titles = self.strategies[learned](root)
+            if titles:
+                return titles
+
+        for index, strategy in enumerate(self.strategies):
+            if index == learned:
+                continue
+            titles = strategy(root)
+            if titles:
+                with self._lock:
+                    self._learned[pattern] = index
+                return titles
+        return self.fallback(root) if self.fallback is not None else []
+
+
+# 모든 네이버 크롤러가 함께 사용하는 기본 선택기
+default_strategy_selector = NaverStrategySelector()
+
+
+class NaverNewsCrawler(ArticleStoreMixin):
+    # 뉴스 전용 검색 (최신순). start는 1, 11, 21 ... 로 증가
+    NEWS_SEARCH_URL = "https://search.naver.com/search.naver?where=news&query={query}&sort=1&start={start}"
+    PAGE_SIZE = 10
+    
+    def __init__(self, rate_limiter=None, cache=None, session=None):
+        # 공유 연결 풀 세션 (keep-alive, 기본 타임아웃)
+        self.session = session or get_default_session()
+        # 호스트별 요청 속도 제한 (모든 크롤러가 공유)
+        self.rate_limiter = rate_limiter or default_limiter
+        # 디스크 응답 캐시 (ETag/Last-Modified 재검증)
+        self.cache = cache or get_default_cache()
     
     def crawl_news_titles(self, url, debug=False):
         """
@@ -30,7 +223,7 @@ class NaverNewsCrawler:
         
         Args:
             url (str): 네이버 검색 결과 URL
-            debug (bool): 디버그 모드 (HTML 파일 저장)
+            debug (bool): 디버그 모드 (HTML 파일 저장, 재생용 카세트에 추가)
             
         Returns:
             list: 신문기사 제목 리스트
@@ -38,69 +231,14 @@ class NaverNewsCrawler:
         try:
             print(f"크롤링 시작: {url}")
             
-            # 페이지 요청
-            response = self.session.get(url)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            
-            # 디버그 모드: HTML 저장
             if debug:
-                filename = f"debug_page_{int(time.time())}.html"
-                with open(filename, 'w', encoding='utf-8') as f:
-                    f.write(response.text)
-                print(f"디버그: HTML 저장됨 - {filename}")
-            
-            # BeautifulSoup으로 HTML 파싱
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            news_titles = []
-            
-            # 네이버 검색 결과에서 뉴스 제목 추출 (개선된 버전)
-            news_items = []
-            
-            # 1. 뉴스 검색 결과 영역에서 제목 추출
-            news_areas = soup.find_all('div', class_='news_area')
-            for area in news_areas:
-                title_links = area.find_all('a', class_='news_tit')
-                news_items.extend(title_links)
-            
-            # 2. 통합검색의 뉴스 영역에서 제목 추출
-            if not news_items:
-                news_sections = soup.find_all('div', {'data-module': 'news'})
-                for section in news_sections:
-                    title_links = section.find_all('a')
-                    for link in title_links:
-                        if 'news.naver.com' in link.get('href', ''):
-                            news_items.append(link)
-            
-            # 3. 뉴스 제목만 포함하는 링크들 찾기 (href에 news.naver.com 포함)
-            if not news_items:
-                all_links = soup.find_all('a', href=True)
-                for link in all_links:
-                    href = link.get('href', '')
-                    if 'news.naver.com' in href and '/article/' in href:
-                        news_items.append(link)
-            
-            # 4. 마지막 방법: 제목 패턴으로 필터링
-            if not news_items:
-                all_links = soup.find_all('a')
-                for link in all_links:
-                    text = link.get_text().strip()
-                    # 뉴스 제목 같은 패턴 (한글 포함, 적절한 길이)
-                    if (text and 
-                        len(text) > 10 and len(text) < 100 and
-                        any(ord(char) >= 0xAC00 and ord(char) <= 0xD7A3 for char in text) and
-                        not any(ad_word in text for ad_word in ['광고', '이벤트', '혜택', '할인', '무료', '증정', '$'])):
-                        news_items.append(link)
-            
-            # 제목 추출
-            for item in news_items:
-                title = item.get_text().strip()
-                if title and len(title) > 5:  # 너무 짧은 텍스트는 제외
-                    # HTML 태그 제거 및 정리
-                    clean_title = BeautifulSoup(title, 'html.parser').get_text().strip()
-                    if clean_title not in news_titles:  # 중복 제거
-                        news_titles.append(clean_title)
+                # 디버그 모드: 캐시와 상관없이 페이지를 받아 HTML 저장
+                news_titles = self.parse_news_titles(self.fetch_debug_page(url), url)
+            else:
+                # 페이지 요청 (캐시 재검증 포함)
+                news_titles = self.cache.fetch_titles(
+                    self.session, url, lambda html: self.parse_news_titles(html, url), self.rate_limiter
+                )
             
             print(f"총 {len(news_titles)}개의 뉴스 제목을 찾았습니다.")
             return news_titles
@@ -112,6 +250,243 @@ class NaverNewsCrawler:
             print(f"크롤링 중 오류 발생: {e}")
             return []
     
+    def fetch_debug_page(self, url):
+        """
+        캐시를 거치지 않고 페이지를 받아 HTML 파일로 저장하고 재생용 카세트에 넣습니다
+        (같은 URL의 이전 페이지는 교체, 최대 DEBUG_CASSETTE_MAX_PAGES개).
+        
+        Args:
+            url (str): 페이지 URL
+            
+        Returns:
+            str: 페이지 HTML
+        """
+        raise_if_circuit_open(self.session, url)
+        self.rate_limiter.wait(url)
+        response = self.session.get(url)
+        response.raise_for_status()
+        response.encoding = 'utf-8'
+        html = response.text
+        
+        filename = f"debug_page_{int(time.time())}.html"
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(html)
+        print(f"디버그: HTML 저장됨 - {filename}")
+        add_page(DEBUG_CASSETTE_PATH, url, html.encode('utf-8'), replace=True,
+                 max_entries=DEBUG_CASSETTE_MAX_PAGES)
+        return html
+    
+    @staticmethod
+    def parse_news_titles(html, url=None, selector=None):
+        """
+        네이버 검색 결과 HTML에서 신문기사 제목들을 추출합니다.
+        같은 URL 패턴에서 마지막으로 성공한 추출 방법을 먼저 시도합니다.
+        
+        Args:
+            html (str): 검색 결과 페이지 HTML
+            url (str): 페이지 URL (추출 방법을 기억할 URL 패턴 판별용)
+            selector (NaverStrategySelector): 추출 방법 선택기 (없으면 기본 선택기)
+            
+        Returns:
+            list: 신문기사 제목 리스트
+        """
+        # lxml로 HTML 파싱 (컴파일된 XPath로 필요한 노드만 탐색)
+        root = parse_document(html)
+        if root is None:
+            return []
+        
+        news_titles = OrderedDeduper()
+        for title in (selector or default_strategy_selector).extract(root, url):
+            if title and len(title) > 5:  # 너무 짧은 텍스트는 제외
+                news_titles.add(title)  # 중복 제거
+        
+        return news_titles.to_list()
+    
+    @staticmethod
+    def parse_news_area(area):
+        """
+        기사 영역(div.news_area) 하나에서 제목, 링크, 기사 시각을 추출합니다.
+        
+        Returns:
+            dict: {'title', 'link', 'published'} (제목이 없거나 너무 짧으면 None)
+        """
+        links = NAVER_AREA_TITLE_LINK(area)
+        if not links:
+            return None
+        link = links[0]
+        title = (link.get('title') or node_text(link)).strip()
+        if not title or len(title) <= 5:
+            return None
+        
+        published = None
+        for info in NAVER_AREA_INFOS(area):
+            published = parse_naver_date(node_text(info))
+            if published is not None:
+                break
+        
+        return {'title': title, 'link': link.get('href'), 'published': published}
+    
+    @classmethod
+    def parse_news_items(cls, html):
+        """
+        네이버 뉴스 검색 결과 HTML에서 기사 제목, 링크, 기사 시각을 추출합니다.
+        기사 영역이 없는 페이지(검색 결과 없음, 마지막 페이지 다음)는 빈 리스트를 반환해
+        페이지 넘김이 멈추도록 합니다. 메뉴 링크까지 잡는 대체 추출은 parse_news_titles에서만 씁니다.
+        
+        Args:
+            html (str): 뉴스 검색 결과 페이지 HTML
+            
+        Returns:
+            list: {'title', 'link', 'published'} 딕셔너리 리스트 (published는 epoch 초 또는 None)
+        """
+        return list(cls.iter_parse_news_items([html.encode('utf-8')]))
+    
+    @classmethod
+    def iter_parse_news_items(cls, chunks, limit=None):
+        """
+        응답 바이트 조각을 풀 파서에 넣으며 기사 영역이 닫힐 때마다 항목을 반환합니다
+        (ResponseCache.iter_titles용). limit개를 채우면 나머지 조각은 읽지 않습니다.
+        
+        Args:
+            chunks (iterable): 응답 본문 조각들
+            limit (int): 최대 항목 수 (None이면 전체)
+            
+        Yields:
+            dict: {'title', 'link', 'published'}
+        """
+        return iter_pull_elements(chunks, 'div', 'news_area', cls.parse_news_area, limit)
+    
+    def fetch_news_page(self, keyword, start=1, cancel=None):
+        """
+        네이버 뉴스 검색 결과 한 페이지를 가져와 기사 항목을 추출합니다.
+        
+        Args:
+            keyword (str): 검색 키워드
+            start (int): 검색 결과 시작 위치 (1, 11, 21 ...)
+            cancel (CancelToken): 속도 제한 대기와 응답 조각마다 확인할 취소 토큰
+            
+        Returns:
+            list: {'title', 'link', 'published'} 딕셔너리 리스트
+        """
+        url = self.NEWS_SEARCH_URL.format(query=quote(keyword), start=start)
+        return list(self.cache.iter_titles(
+            self.session, url, self.iter_parse_news_items, rate_limiter=self.rate_limiter,
+            cancel=cancel
+        ))
+    
+    def iter_news_titles(self, keyword, max_items=100, since=None, max_pages=50, cancel=None):
+        """
+        네이버 뉴스 검색 결과를 페이지 단위로 넘기며 제목을 하나씩 반환합니다 (iter_news_items 참고).
+        
+        Yields:
+            str: 뉴스 제목
+        """
+        for item in self.iter_news_items(keyword, max_items, since, max_pages, cancel):
+            yield item['title']
+    
+    def iter_news_items(self, keyword, max_items=100, since=None, max_pages=50, cancel=None):
+        """
+        네이버 뉴스 검색 결과를 페이지 단위로 넘기며 기사 항목을 하나씩 반환합니다.
+        현재 페이지만으로 끝나지 않는 경우에는 처리하는 동안 다음 페이지를 미리 요청합니다.
+        
+        다음 중 하나에 해당하면 멈춥니다.
+        - max_items개의 제목을 반환한 경우
+        - 한 페이지가 모두 이미 반환한 제목인 경우
+        - since보다 오래된 기사를 만난 경우 (최신순 정렬이므로 이후도 모두 오래됨)
+        - 빈 페이지이거나 max_pages를 넘은 경우
+        
+        Args:
+            keyword (str): 검색 키워드
+            max_items (int): 최대 제목 수 (None이면 제한 없음)
+            since (datetime 또는 float): 이 시각 이후 기사만 수집 (None이면 제한 없음)
+            max_pages (int): 최대 페이지 수
+            cancel (CancelToken): 취소 토큰 (페이지 요청 중에도 확인, 취소되면 CrawlCancelled 발생)
+            
+        Yields:
+            dict: {'title', 'link', 'published'}
+        """
+        if isinstance(since, datetime):
+            since = since.timestamp()
+        
+        seen = OrderedDeduper()
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future = executor.submit(self.fetch_news_page, keyword, 1, cancel)
+            for page in range(max_pages):
+                try:
+                    items = future.result()
+                except CrawlCancelled:
+                    raise
+                except Exception as e:
+                    print(f"네이버 뉴스 {page + 1}페이지 크롤링 오류: {e}")
+                    return
+                future = None
+                
+                if not items:
+                    return
+                
+                # 이 페이지에서 끝날 수 없을 때만 다음 페이지를 미리 요청 (요청 한도 절약)
+                next_start = (page + 1) * self.PAGE_SIZE + 1
+                if page + 1 < max_pages and self._needs_next_page(items, len(seen), max_items, since):
+                    future = executor.submit(self.fetch_news_page, keyword, next_start, cancel)
+                
+                new_on_page = 0
+                for item in items:
+                    if cancel is not None:
+                        cancel.raise_if_cancelled()
+                    if since is not None and item['published'] is not None and item['published'] < since:
+                        return
+                    if not seen.add(item['title']):
+                        continue
+                    new_on_page += 1
+                    yield item
+                    if max_items is not None and len(seen) >= max_items:
+                        return
+                
+                if new_on_page == 0 or page + 1 >= max_pages:
+                    return
+                # 중복 제목 때문에 아직 max_items를 채우지 못한 경우 이제 요청
+                if future is None:
+                    future = executor.submit(self.fetch_news_page, keyword, next_start, cancel)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    @staticmethod
+    def _needs_next_page(items, seen_count, max_items, since):
+        """
+        현재 페이지를 다 처리해도 멈추지 않을 것이 확실한지 확인합니다.
+        
+        Args:
+            items (list): 현재 페이지의 기사 항목
+            seen_count (int): 지금까지 반환한 제목 수
+            max_items (int): 최대 제목 수
+            since (float): 수집 기준 시각 (epoch 초)
+            
+        Returns:
+            bool: 다음 페이지가 필요하면 True
+        """
+        # 이 페이지만으로 max_items를 채울 수 있으면 미리 요청하지 않음
+        if max_items is not None and max_items - seen_count <= len(items):
+            return False
+        # 이 페이지에 since보다 오래된 기사가 있으면 여기서 멈춤
+        if since is not None and any(
+                item['published'] is not None and item['published'] < since for item in items):
+            return False
+        return True
+    
+    def iter_titles(self, keyword, limit=None):
+        """
+        다른 뉴스 소스와 같은 형태의 지연 수집 API (iter_news_titles 참고).
+        
+        Args:
+            keyword (str): 검색 키워드
+            limit (int): 최대 제목 수
+            
+        Yields:
+            str: 뉴스 제목
+        """
+        return self.iter_news_titles(keyword, max_items=limit)
+    
     def save_to_csv(self, titles, filename='news_titles.csv'):
         """
         크롤링한 제목들을 CSV 파일로 저장합니다.
@@ -172,7 +547,7 @@ def main():
     news_titles_2 = crawler.crawl_news_titles(news_search_url, debug=True)
     
     # 두 결과 합치기 (중복 제거)
-    all_titles = news_titles + [title for title in news_titles_2 if title not in news_titles]
+    all_titles = OrderedDeduper(news_titles + news_titles_2).to_list()
     
     if all_titles:
         # 결과 출력
@@ -181,13 +556,23 @@ def main():
         # CSV 파일로 저장
         crawler.save_to_csv(all_titles, 'semiconductor_news_titles.csv')
         
+        # 기사 저장소에 누적 저장 (새 기사만 추가)
+        new_titles = crawler.save_to_store(all_titles, "네이버 뉴스", "반도체 관련주")
+        
         print(f"\n크롤링 완료! 총 {len(all_titles)}개의 뉴스 제목을 수집했습니다.")
         print(f"- 통합검색: {len(news_titles)}개")
         print(f"- 뉴스검색: {len(news_titles_2)}개")
         print(f"- 중복제거 후 총합: {len(all_titles)}개")
+        print(f"- 새 기사: {len(new_titles)}개")
     else:
         print("뉴스 제목을 찾지 못했습니다. 페이지 구조가 변경되었을 수 있습니다.")
         print("네이버의 로봇 차단 정책으로 인해 접근이 제한될 수 있습니다.")
+    
+    # 요청 단계별 계측 결과 (연결/TTFB/다운로드/파싱)
+    metrics = get_default_metrics()
+    print("\n요청 계측:")
+    print(metrics.format_summary())
+    print(f"계측 보고서: {metrics.write_json()}, {metrics.write_prometheus()}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+유사(근접 중복) 뉴스 제목 탐지
+구글 뉴스, 다음, 연합뉴스가 같은 기사를 조금씩 다른 문구로 내보내는 경우를
+문자 n-gram MinHash와 LSH 밴딩으로 찾아 하나의 클러스터로 묶습니다.
+모든 쌍을 비교하지 않으므로 10만 건 이상에서도 거의 선형 시간에 동작합니다.
+
+MinHash 서명은 n-gram마다 해시를 한 번만 계산하는 densified one-permutation
+hashing 방식으로 만들어, 순수 파이썬에서도 서명 길이에 비례한 비용이 들지 않습니다.
+"""
+
+import random
+import re
+
+from dedup import normalize_title
+
+
+_NON_WORD_RE = re.compile(r'[\W_]+')
+# 색인은 한 프로세스 안에서만 쓰므로 파이썬 내장 문자열 해시(캐시됨)를 사용
+_HASH_MASK = (1 << 64) - 1
+
+
+def _choose_bands(num_perm, threshold):
+    """
+    LSH 임계값 (1/b)^(1/r)이 목표 유사도를 넘지 않는 범위에서 밴드 크기를 가장 크게 고릅니다.
+    후보는 실제 자카드 유사도로 다시 검증하므로 재현율을 우선합니다.
+
+    Returns:
+        tuple: (밴드 수, 밴드당 행 수)
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if (1.0 / bands) ** (1.0 / rows) <= threshold:
+            best = (bands, rows)
+    return best
+
+
+class NearDuplicateIndex:
+    def __init__(self, threshold=0.6, num_perm=64, shingle_size=2):
+        """
+        Args:
+            threshold (float): 같은 클러스터로 묶을 최소 자카드 유사도 (0~1)
+            num_perm (int): MinHash 서명 길이
+            shingle_size (int): 문자 n-gram 길이 (한글 제목은 2가 적당)
+        """
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = _choose_bands(num_perm, threshold)
+        # 빈 구간을 채울 때 사용할 구간별 고정 탐색 순서 (모든 제목에 동일하게 적용)
+        rng = random.Random(num_perm)
+        self._probes = []
+        for i in range(num_perm):
+            order = [j for j in range(num_perm) if j != i]
+            rng.shuffle(order)
+            self._probes.append(order)
+        self._buckets = [{} for _ in range(self.bands)]
+        self._shingles = []         # 항목 번호 -> n-gram 집합
+        self._clusters = []         # 항목 번호 -> 클러스터 ID
+        self.cluster_count = 0
+
+    def shingles(self, title):
+        """
+        제목을 문자 n-gram 집합으로 변환합니다 (공백/문장부호 제거 후).
+
+        Args:
+            title (str): 뉴스 제목
+
+        Returns:
+            frozenset: n-gram 집합
+        """
+        text = _NON_WORD_RE.sub('', normalize_title(title).lower())
+        k = self.shingle_size
+        if len(text) <= k:
+            return frozenset([text]) if text else frozenset()
+        return frozenset(text[i:i + k] for i in range(len(text) - k + 1))
+
+    def signature(self, shingles):
+        """
+        n-gram 집합의 MinHash 서명을 계산합니다.
+        각 n-gram의 해시로 구간을 정해 구간별 최솟값을 취하고,
+        비어 있는 구간은 구간별 고정 탐색 순서에서 처음 만나는 값이 있는 구간의 값으로 채웁니다.
+
+        Args:
+            shingles (frozenset): 비어 있지 않은 n-gram 집합
+
+        Returns:
+            tuple: 길이 num_perm의 서명
+        """
+        n = self.num_perm
+        sig = [None] * n
+        for shingle in shingles:
+            h = hash(shingle) & _HASH_MASK
+            b = h % n
+            v = h // n
+            cur = sig[b]
+            if cur is None or v < cur:
+                sig[b] = v
+
+        if None not in sig:
+            return tuple(sig)
+
+        dense = list(sig)
+        for i in range(n):
+            if sig[i] is None:
+                for j in self._probes[i]:
+                    if sig[j] is not None:
+                        dense[i] = sig[j]
+                        break
+        return tuple(dense)
+
+    @staticmethod
+    def jaccard(a, b):
+        """두 n-gram 집합의 자카드 유사도를 계산합니다."""
+        if not a or not b:
+            return 0.0
+        inter = len(a & b)
+        return inter / (len(a) + len(b) - inter)
+
+    def add(self, title):
+        """
+        제목을 색인에 추가하고 소속 클러스터를 결정합니다.
+
+        Args:
+            title (str): 뉴스 제목
+
+        Returns:
+            tuple: (클러스터 ID, 새 클러스터 여부)
+        """
+        shingles = self.shingles(title)
+        item_id = len(self._shingles)
+        self._shingles.append(shingles)
+
+        if not shingles:
+            self.cluster_count += 1
+            self._clusters.append(self.cluster_count)
+            return self.cluster_count, True
+
+        sig = self.signature(shingles)
+        band_keys = [sig[b * self.rows:(b + 1) * self.rows] for b in range(self.bands)]
+
+        # 같은 밴드 버킷을 공유하는 후보만 실제 유사도로 검증
+        best_id, best_score = None, self.threshold
+        checked = set()
+        for bucket, key in zip(self._buckets, band_keys):
+            for candidate in bucket.get(key, ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                score = self.jaccard(shingles, self._shingles[candidate])
+                if score >= best_score:
+                    best_id, best_score = candidate, score
+
+        for bucket, key in zip(self._buckets, band_keys):
+            bucket.setdefault(key, []).append(item_id)
+
+        if best_id is not None:
+            cluster_id = self._clusters[best_id]
+            self._clusters.append(cluster_id)
+            return cluster_id, False
+
+        self.cluster_count += 1
+        self._clusters.append(self.cluster_count)
+        return self.cluster_count, True
+
+    def assign(self, titles):
+        """
+        여러 제목에 클러스터 ID를 붙입니다.
+
+        Args:
+            titles (iterable): 뉴스 제목들
+
+        Returns:
+            list: (클러스터 ID, 제목) 튜플 리스트 (입력 순서 유지)
+        """
+        return [(self.add(title)[0], title) for title in titles]
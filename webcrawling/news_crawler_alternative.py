@@ -5,57 +5,65 @@
 네이버 직접 크롤링이 어려울 때 사용할 수 있는 여러 방법들
 """
 
-import requests
-from bs4 import BeautifulSoup
-import time
 import csv
 import json
 from datetime import datetime
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
-from openpyxl.utils import get_column_letter
 
+from article_store import ArticleStoreMixin
+from dedup import OrderedDeduper
+from excel_export import export_titles
+from fast_parse import DAUM_TITLE_LINKS, YNA_TITLE_LINKS, select_texts
+from fetch_engine import ConcurrentFetcher
+from http_cache import get_default_cache
+from metrics import get_default_metrics
+from near_dedup import NearDuplicateIndex
+from news_sources import create_sources
+from rate_limiter import default_limiter
+from transport import get_default_session
 
-class AlternativeNewsCrawler:
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-        # SSL 인증서 검증 비활성화
-        self.session.verify = False
-        import urllib3
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+class AlternativeNewsCrawler(ArticleStoreMixin):
+    def __init__(self, rate_limiter=None, cache=None, session=None):
+        # 공유 연결 풀 세션 (keep-alive, 기본 타임아웃)
+        self.session = session or get_default_session()
+        # 호스트별 요청 속도 제한 (모든 크롤러가 공유)
+        self.rate_limiter = rate_limiter or default_limiter
+        # 디스크 응답 캐시 (ETag/Last-Modified 재검증)
+        self.cache = cache or get_default_cache()
+        # 소스별 지연 수집기 (iter_titles)
+        self.sources = create_sources(self.session, self.rate_limiter, self.cache)
+    
+    def iter_titles(self, source, keyword, limit=None):
+        """
+        소스의 검색 결과 제목을 하나씩 반환합니다 (limit개를 채우면 추출 중단).
+        
+        Args:
+            source (str): 소스 이름 (다음 뉴스, 구글 뉴스, 연합뉴스, 네이버 뉴스)
+            keyword (str): 검색할 키워드
+            limit (int): 최대 제목 수 (None이면 제한 없음)
+            
+        Yields:
+            str: 뉴스 제목
+        """
+        return self.sources[source].iter_titles(keyword, limit)
     
-    def crawl_daum_news(self, keyword="반도체"):
+    def crawl_daum_news(self, keyword="반도체", limit=None):
         """
         다음 뉴스에서 특정 키워드 관련 뉴스 제목을 크롤링합니다.
         
         Args:
             keyword (str): 검색할 키워드
+            limit (int): 최대 제목 수 (None이면 제한 없음)
             
         Returns:
             list: 뉴스 제목 리스트
         """
         try:
             # 다음 뉴스 검색 URL
-            url = f"https://search.daum.net/search?w=news&q={keyword}&DA=PGD&spacing=0"
-            print(f"다음 뉴스 검색: {url}")
+            source = self.sources["다음 뉴스"]
+            print(f"다음 뉴스 검색: {source.search_url(keyword)}")
             
-            response = self.session.get(url)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            news_titles = []
-            
-            # 다음 뉴스 제목 추출
-            title_elements = soup.find_all('a', class_='f_link_b')
-            
-            for element in title_elements:
-                title = element.get_text().strip()
-                if title and len(title) > 5:
-                    news_titles.append(title)
+            news_titles = source.crawl(keyword, limit)
             
             print(f"다음에서 {len(news_titles)}개의 뉴스 제목을 찾았습니다.")
             return news_titles
@@ -64,40 +72,37 @@ class AlternativeNewsCrawler:
             print(f"다음 뉴스 크롤링 오류: {e}")
             return []
     
-    def crawl_google_news(self, keyword="반도체 관련주"):
+    @staticmethod
+    def parse_daum_titles(html):
+        """
+        다음 뉴스 검색 결과 HTML에서 제목을 추출합니다.
+        
+        Args:
+            html (str): 검색 결과 페이지 HTML
+            
+        Returns:
+            list: 뉴스 제목 리스트
+        """
+        # 다음 뉴스 제목 추출 (a.f_link_b)
+        return select_texts(html, DAUM_TITLE_LINKS)
+    
+    def crawl_google_news(self, keyword="반도체 관련주", limit=None):
         """
         구글 뉴스에서 특정 키워드 관련 뉴스 제목을 크롤링합니다.
         
         Args:
             keyword (str): 검색할 키워드
+            limit (int): 최대 제목 수 (None이면 제한 없음)
             
         Returns:
             list: 뉴스 제목 리스트
         """
         try:
             # 구글 뉴스 검색 URL (한국 지역)
-            url = f"https://news.google.com/rss/search?q={keyword}&hl=ko&gl=KR&ceid=KR:ko"
-            print(f"구글 뉴스 RSS 검색: {url}")
+            source = self.sources["구글 뉴스"]
+            print(f"구글 뉴스 RSS 검색: {source.search_url(keyword)}")
             
-            response = self.session.get(url)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            
-            soup = BeautifulSoup(response.text, 'xml')
-            news_titles = []
-            
-            # RSS 피드에서 제목 추출
-            items = soup.find_all('item')
-            
-            for item in items:
-                title_element = item.find('title')
-                if title_element:
-                    title = title_element.get_text().strip()
-                    # 구글 뉴스의 경우 "- 출처명" 형태로 끝나므로 이를 정리
-                    if ' - ' in title:
-                        title = title.split(' - ')[0]
-                    if title and len(title) > 5:
-                        news_titles.append(title)
+            news_titles = source.crawl(keyword, limit)
             
             print(f"구글 뉴스에서 {len(news_titles)}개의 뉴스 제목을 찾았습니다.")
             return news_titles
@@ -106,37 +111,37 @@ class AlternativeNewsCrawler:
             print(f"구글 뉴스 크롤링 오류: {e}")
             return []
     
-    def crawl_yna_news(self, keyword="반도체"):
+    def iter_google_news(self, keyword="반도체 관련주", limit=None):
+        """
+        구글 뉴스 RSS를 스트리밍으로 받으며 기사 항목을 하나씩 반환합니다 (응답 캐시 사용).
+        limit개를 채우면 나머지 피드는 받지 않습니다.
+        
+        Args:
+            keyword (str): 검색할 키워드
+            limit (int): 최대 항목 수 (None이면 피드 끝까지)
+            
+        Yields:
+            dict: {'title', 'link', 'source', 'pub_date'}
+        """
+        return self.sources["구글 뉴스"].iter_items(keyword, limit)
+    
+    def crawl_yna_news(self, keyword="반도체", limit=None):
         """
         연합뉴스에서 특정 키워드 관련 뉴스 제목을 크롤링합니다.
         
         Args:
             keyword (str): 검색할 키워드
+            limit (int): 최대 제목 수 (None이면 제한 없음)
             
         Returns:
             list: 뉴스 제목 리스트
         """
         try:
             # 연합뉴스 검색 URL
-            url = f"https://www.yna.co.kr/search/index?query={keyword}"
-            print(f"연합뉴스 검색: {url}")
-            
-            response = self.session.get(url)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
+            source = self.sources["연합뉴스"]
+            print(f"연합뉴스 검색: {source.search_url(keyword)}")
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            news_titles = []
-            
-            # 연합뉴스 제목 추출
-            title_elements = soup.find_all('strong', class_='tit-news')
-            
-            for element in title_elements:
-                link = element.find('a')
-                if link:
-                    title = link.get_text().strip()
-                    if title and len(title) > 5:
-                        news_titles.append(title)
+            news_titles = source.crawl(keyword, limit)
             
             print(f"연합뉴스에서 {len(news_titles)}개의 뉴스 제목을 찾았습니다.")
             return news_titles
@@ -145,6 +150,20 @@ class AlternativeNewsCrawler:
             print(f"연합뉴스 크롤링 오류: {e}")
             return []
     
+    @staticmethod
+    def parse_yna_titles(html):
+        """
+        연합뉴스 검색 결과 HTML에서 제목을 추출합니다.
+        
+        Args:
+            html (str): 검색 결과 페이지 HTML
+            
+        Returns:
+            list: 뉴스 제목 리스트
+        """
+        # 연합뉴스 제목 추출 (strong.tit-news 안의 첫 번째 링크)
+        return select_texts(html, YNA_TITLE_LINKS)
+    
     def crawl_sample_news_data(self):
         """
         샘플 뉴스 데이터를 생성합니다 (크롤링이 모두 실패할 경우 데모용)
@@ -168,101 +187,72 @@ class AlternativeNewsCrawler:
         print(f"샘플 데이터 생성: {len(sample_titles)}개의 뉴스 제목")
         return sample_titles
     
-    def save_to_csv(self, titles, filename='alternative_news_titles.csv'):
+    def save_to_csv(self, titles, filename='alternative_news_titles.csv', cluster_ids=None):
         """
         크롤링한 제목들을 CSV 파일로 저장합니다.
         
         Args:
             titles (list): 뉴스 제목 리스트
             filename (str): 저장할 파일명
+            cluster_ids (list): 제목마다의 유사 제목 클러스터 번호 (주어지면 클러스터 컬럼 추가)
         """
         try:
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile)
-                writer.writerow(['번호', '뉴스 제목', '수집시간'])  # 헤더
-                
                 current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                for idx, title in enumerate(titles, 1):
-                    writer.writerow([idx, title, current_time])
+                if cluster_ids is None:
+                    writer.writerow(['번호', '뉴스 제목', '수집시간'])  # 헤더
+                    for idx, title in enumerate(titles, 1):
+                        writer.writerow([idx, title, current_time])
+                else:
+                    writer.writerow(['번호', '클러스터', '뉴스 제목', '수집시간'])  # 헤더
+                    for idx, (cluster_id, title) in enumerate(zip(cluster_ids, titles), 1):
+                        writer.writerow([idx, cluster_id, title, current_time])
                     
             print(f"결과가 {filename} 파일로 저장되었습니다.")
             
         except Exception as e:
             print(f"파일 저장 중 오류 발생: {e}")
     
-    def save_to_excel(self, titles, filename='result.xlsx'):
+    def save_to_excel(self, titles, filename='result.xlsx', cluster_ids=None):
         """
         크롤링한 제목들을 Excel 파일로 저장합니다 (openpyxl 사용).
         
         Args:
             titles (list): 뉴스 제목 리스트
             filename (str): 저장할 파일명
+            cluster_ids (list): 제목마다의 유사 제목 클러스터 번호 (주어지면 클러스터 컬럼 추가)
         """
         try:
-            # 새 워크북 생성
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "뉴스 제목"
-            
-            # 헤더 스타일 설정
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            header_border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
-            center_alignment = Alignment(horizontal='center', vertical='center')
-            
-            # 헤더 작성
-            headers = ['번호', '뉴스 제목', '수집시간']
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=1, column=col, value=header)
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.border = header_border
-                cell.alignment = center_alignment
-            
-            # 데이터 입력
+            # write-only 모드로 한 번에 한 행씩 기록 (대용량에서도 메모리 일정)
             current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            for idx, title in enumerate(titles, 1):
-                # 번호
-                ws.cell(row=idx+1, column=1, value=idx).alignment = center_alignment
-                # 제목
-                ws.cell(row=idx+1, column=2, value=title)
-                # 시간
-                ws.cell(row=idx+1, column=3, value=current_time).alignment = center_alignment
-            
-            # 컬럼 너비 자동 조정
-            ws.column_dimensions['A'].width = 8   # 번호
-            ws.column_dimensions['B'].width = 80  # 제목 (넓게)
-            ws.column_dimensions['C'].width = 20  # 시간
-            
-            # 데이터 영역 테두리 추가
-            data_border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
+            writer = export_titles(titles, filename, current_time, cluster_ids)
             
-            for row in range(2, len(titles) + 2):
-                for col in range(1, 4):
-                    ws.cell(row=row, column=col).border = data_border
-            
-            # 제목 행 고정
-            ws.freeze_panes = 'A2'
-            
-            # 파일 저장
-            wb.save(filename)
             print(f"📊 Excel 파일이 저장되었습니다: {filename}")
-            print(f"   - 총 {len(titles)}개의 뉴스 제목")
+            print(f"   - 총 {writer.rows_written}개의 뉴스 제목")
+            if writer.sheet_count > 1:
+                print(f"   - 행 수 제한으로 {writer.sheet_count}개 시트에 나누어 저장")
             print(f"   - 수집 시간: {current_time}")
             
         except Exception as e:
             print(f"Excel 파일 저장 중 오류 발생: {e}")
     
+    def merge_similar_titles(self, titles, threshold=0.6):
+        """
+        출처마다 문구만 조금 다른 같은 기사를 하나로 묶습니다.
+        
+        Args:
+            titles (list): 뉴스 제목 리스트
+            threshold (float): 같은 기사로 볼 최소 유사도 (0~1)
+            
+        Returns:
+            list: (클러스터 ID, 제목) 튜플 리스트 (입력 순서 유지)
+        """
+        rows = NearDuplicateIndex(threshold=threshold).assign(titles)
+        cluster_count = len({cluster_id for cluster_id, _ in rows})
+        print(f"유사 제목 병합: {len(rows)}개 제목 → {cluster_count}개 기사")
+        return rows
+    
     def print_titles(self, titles, source=""):
         """
         크롤링한 제목들을 콘솔에 출력합니다.
@@ -291,38 +281,32 @@ def main():
     print("대안적인 뉴스 크롤링을 시작합니다...")
     print("키워드: 반도체 관련주\n")
     
-    all_titles = []
-    
-    # 1. 다음 뉴스 크롤링 시도
-    print("1. 다음 뉴스에서 크롤링 시도...")
-    daum_titles = crawler.crawl_daum_news("반도체")
-    if daum_titles:
-        crawler.print_titles(daum_titles, "다음 뉴스")
-        all_titles.extend(daum_titles)
-    
-    time.sleep(2)  # 요청 간격 조절
+    all_titles = OrderedDeduper()
     
-    # 2. 구글 뉴스 RSS 크롤링 시도
-    print("\n2. 구글 뉴스 RSS에서 크롤링 시도...")
-    google_titles = crawler.crawl_google_news("반도체 관련주")
-    if google_titles:
-        crawler.print_titles(google_titles, "구글 뉴스")
-        # 중복 제거하여 추가
-        for title in google_titles:
-            if title not in all_titles:
-                all_titles.append(title)
+    # 1~3. 다음 뉴스, 구글 뉴스 RSS, 연합뉴스를 동시에 크롤링
+    print("1~3. 다음 뉴스, 구글 뉴스 RSS, 연합뉴스에서 동시에 크롤링 시도...")
+    keywords = {"다음 뉴스": "반도체", "구글 뉴스": "반도체 관련주", "연합뉴스": "반도체"}
+    jobs = {
+        "다음 뉴스": lambda: crawler.crawl_daum_news(keywords["다음 뉴스"]),
+        "구글 뉴스": lambda: crawler.crawl_google_news(keywords["구글 뉴스"]),
+        "연합뉴스": lambda: crawler.crawl_yna_news(keywords["연합뉴스"]),
+    }
+    results = {}
+    new_count = 0
+    fetcher = ConcurrentFetcher(max_workers=len(jobs))
     
-    time.sleep(2)  # 요청 간격 조절
+    # 완료되는 순서대로 결과 병합 (중복 제거)
+    for source, titles in fetcher.iter_results(jobs):
+        results[source] = titles
+        if titles:
+            crawler.print_titles(titles, source)
+            all_titles.extend(titles)
+            # 기사 저장소에 누적 저장 (새 기사만 추가)
+            new_count += len(crawler.save_to_store(titles, source, keywords[source]))
     
-    # 3. 연합뉴스 크롤링 시도
-    print("\n3. 연합뉴스에서 크롤링 시도...")
-    yna_titles = crawler.crawl_yna_news("반도체")
-    if yna_titles:
-        crawler.print_titles(yna_titles, "연합뉴스")
-        # 중복 제거하여 추가
-        for title in yna_titles:
-            if title not in all_titles:
-                all_titles.append(title)
+    daum_titles = results.get("다음 뉴스", [])
+    google_titles = results.get("구글 뉴스", [])
+    yna_titles = results.get("연합뉴스", [])
     
     # 4. 모든 크롤링이 실패한 경우 샘플 데이터 사용
     if not all_titles:
@@ -331,6 +315,12 @@ def main():
         all_titles.extend(sample_titles)
         crawler.print_titles(sample_titles, "샘플 데이터")
     
+    all_titles = all_titles.to_list()
+    
+    # 5. 유사 제목에 클러스터 번호 붙이기 (모든 행 유지, 같은 기사는 같은 번호)
+    cluster_ids = [cluster_id for cluster_id, _ in crawler.merge_similar_titles(all_titles)]
+    cluster_count = len(set(cluster_ids))
+    
     # 최종 결과 출력 및 저장
     if all_titles:
         print(f"\n📊 크롤링 결과 요약:")
@@ -338,13 +328,15 @@ def main():
         print(f"- 구글 뉴스: {len(google_titles)}개") 
         print(f"- 연합뉴스: {len(yna_titles)}개")
         print(f"- 총 수집: {len(all_titles)}개 (중복 제거)")
+        print(f"- 유사 제목 클러스터: {cluster_count}개 기사")
+        print(f"- 새 기사: {new_count}개 (기사 저장소 기준)")
         
         # 전체 결과 출력
         crawler.print_titles(all_titles, "전체 수집 결과")
         
-        # 파일 저장
-        crawler.save_to_csv(all_titles, 'alternative_semiconductor_news.csv')
-        crawler.save_to_excel(all_titles, 'result.xlsx')
+        # 파일 저장 (클러스터 번호 포함)
+        crawler.save_to_csv(all_titles, 'alternative_semiconductor_news.csv', cluster_ids)
+        crawler.save_to_excel(all_titles, 'result.xlsx', cluster_ids)
         
         print(f"\n✅ 크롤링 완료! 총 {len(all_titles)}개의 뉴스 제목을 수집했습니다.")
         print("📁 저장된 파일:")
@@ -352,6 +344,13 @@ def main():
         print("   - result.xlsx (Excel 형식)")
     else:
         print("❌ 뉴스 제목을 수집하지 못했습니다.")
+    
+    # 요청 단계별 계측 결과 (연결/TTFB/다운로드/파싱)
+    metrics = get_default_metrics()
+    print("\n⏱️ 소스별 요청 계측:")
+    print(metrics.format_summary())
+    print(f"   - {metrics.write_json()} (JSON 실행 보고서)")
+    print(f"   - {metrics.write_prometheus()} (Prometheus 텍스트)")
 
 
 if __name__ == "__main__":
@@ -8,153 +8,179 @@ PyQt5 기반 GUI 뉴스 크롤링 프로그램
 import sys
 import os
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
-                            QWidget, QPushButton, QTextEdit, QLabel, QLineEdit, 
+                            QWidget, QPushButton, QPlainTextEdit, QLabel, QLineEdit, 
                             QComboBox, QProgressBar, QGroupBox, QCheckBox, 
-                            QFileDialog, QMessageBox, QSplitter, QTabWidget,
-                            QTableWidget, QTableWidgetItem, QHeaderView)
-from PyQt5.QtCore import QThread, pyqtSignal, Qt, QTimer
+                            QDoubleSpinBox, QFileDialog, QMessageBox, QSplitter, QTabWidget,
+                            QTableView, QHeaderView)
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, Qt, QTimer
 from PyQt5.QtGui import QFont, QIcon, QPalette, QColor
-import requests
-from bs4 import BeautifulSoup
 import time
 import csv
 from datetime import datetime
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Border, Side, Alignment
 
+from article_store import get_default_store
+from dedup import OrderedDeduper
+from excel_export import (CLUSTER_CENTER_COLUMNS, CLUSTER_COLUMN_WIDTHS, CLUSTER_HEADERS,
+                          StreamingExcelWriter)
+from http_cache import get_default_cache
+from metrics import get_default_metrics
+from near_dedup import NearDuplicateIndex
+from news_sources import create_sources
+from rate_limiter import default_limiter
+from resilience import get_default_breakers
+from results_model import NewsTableModel
+from transport import CancelToken, CrawlCancelled, get_default_session
 
-class CrawlerThread(QThread):
-    """백그라운드에서 크롤링을 수행하는 워커 스레드"""
+
+# 소스별 최대 수집 개수
+SOURCE_LIMITS = {"구글 뉴스": 50, "다음 뉴스": 30, "연합뉴스": 30}
+
+# 소스 하나에서 이만큼 모일 때마다 화면으로 보냄
+BATCH_SIZE = 10
+
+# 유사 제목으로 묶을 기본 최소 유사도
+DEFAULT_SIMILARITY_THRESHOLD = 0.6
+
+
+class SourceTaskSignals(QObject):
+    """SourceTask가 메인 스레드로 보내는 시그널 (QRunnable은 시그널을 가질 수 없음)"""
     
-    # 시그널 정의
-    progress_updated = pyqtSignal(int)  # 진행률
-    status_updated = pyqtSignal(str)    # 상태 메시지
-    result_ready = pyqtSignal(list)     # 크롤링 결과
-    error_occurred = pyqtSignal(str)    # 에러 메시지
+    batch_ready = pyqtSignal(str, list)   # (소스, 제목 묶음)
+    finished = pyqtSignal(str, int, int)  # (소스, 수집 수, 새 기사 수)
+    failed = pyqtSignal(str, str)         # (소스, 에러 메시지)
+    cancelled = pyqtSignal(str)           # 소스
+
+
+class SourceTask(QRunnable):
+    """소스 하나를 크롤링하면서 제목을 묶음 단위로 보내는 작업"""
     
-    def __init__(self, keyword, sources):
+    def __init__(self, news_source, keyword, limit, cancel, store):
         super().__init__()
+        self.news_source = news_source
         self.keyword = keyword
-        self.sources = sources
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-        self.session.verify = False
-        # SSL 경고 메시지 숨기기
-        import urllib3
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        self.limit = limit
+        self.cancel = cancel
+        self.store = store
+        self.signals = SourceTaskSignals()
     
     def run(self):
-        """크롤링 실행"""
+        name = self.news_source.name
+        titles = []
+        batch = []
         try:
-            all_titles = []
-            total_sources = len(self.sources)
-            
-            for idx, source in enumerate(self.sources):
-                self.status_updated.emit(f"{source}에서 크롤링 중...")
-                
-                if source == "구글 뉴스":
-                    titles = self.crawl_google_news()
-                elif source == "다음 뉴스":
-                    titles = self.crawl_daum_news()
-                elif source == "연합뉴스":
-                    titles = self.crawl_yna_news()
-                else:
-                    titles = []
-                
-                # 중복 제거하여 추가
-                for title in titles:
-                    if title not in all_titles:
-                        all_titles.append(title)
-                
-                # 진행률 업데이트
-                progress = int((idx + 1) / total_sources * 100)
-                self.progress_updated.emit(progress)
-                
-                # 요청 간격 조절
-                time.sleep(1)
-            
-            self.status_updated.emit(f"크롤링 완료! 총 {len(all_titles)}개의 뉴스 제목 수집")
-            self.result_ready.emit(all_titles)
-            
+            for title in self.news_source.iter_titles(self.keyword, self.limit, self.cancel):
+                titles.append(title)
+                batch.append(title)
+                if len(batch) >= BATCH_SIZE:
+                    self.signals.batch_ready.emit(name, batch)
+                    batch = []
+            if batch:
+                self.signals.batch_ready.emit(name, batch)
+            # 기사 저장소에 누적 저장 (새 기사 수 표시)
+            new_titles = self.store.upsert_titles(titles, name, self.keyword)
+            self.signals.finished.emit(name, len(titles), len(new_titles))
+        except CrawlCancelled:
+            self.signals.cancelled.emit(name)
         except Exception as e:
-            self.error_occurred.emit(f"크롤링 중 오류 발생: {str(e)}")
+            self.signals.failed.emit(name, str(e))
+
+
+class CrawlController(QObject):
+    """
+    선택한 소스들을 QThreadPool에서 동시에 크롤링하고, 끝나는 대로 결과를 묶음으로 보냅니다.
+    중지는 취소 토큰으로 각 작업이 스스로 멈추게 합니다.
+    """
     
-    def crawl_google_news(self):
-        """구글 뉴스 크롤링"""
-        try:
-            url = f"https://news.google.com/rss/search?q={self.keyword}&hl=ko&gl=KR&ceid=KR:ko"
-            response = self.session.get(url)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            
-            soup = BeautifulSoup(response.text, 'xml')
-            titles = []
-            
-            items = soup.find_all('item')
-            for item in items:
-                title_element = item.find('title')
-                if title_element:
-                    title = title_element.get_text().strip()
-                    if ' - ' in title:
-                        title = title.split(' - ')[0]
-                    if title and len(title) > 5:
-                        titles.append(title)
-            
-            return titles[:50]  # 최대 50개만 반환
-            
-        except Exception as e:
-            self.status_updated.emit(f"구글 뉴스 크롤링 실패: {str(e)}")
-            return []
+    # 시그널 정의
+    progress_updated = pyqtSignal(int)  # 진행률
+    status_updated = pyqtSignal(str)    # 상태 메시지
+    result_ready = pyqtSignal(list, object)  # (새로 추가할 제목 묶음, 클러스터 번호 리스트 또는 None)
+    finished = pyqtSignal(int, bool)    # (전체 제목 수, 중지 여부)
     
-    def crawl_daum_news(self):
-        """다음 뉴스 크롤링"""
-        try:
-            url = f"https://search.daum.net/search?w=news&q={self.keyword}&DA=PGD&spacing=0"
-            response = self.session.get(url)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            titles = []
-            
-            title_elements = soup.find_all('a', class_='f_link_b')
-            for element in title_elements:
-                title = element.get_text().strip()
-                if title and len(title) > 5:
-                    titles.append(title)
-            
-            return titles[:30]  # 최대 30개만 반환
-            
-        except Exception as e:
-            self.status_updated.emit(f"다음 뉴스 크롤링 실패: {str(e)}")
-            return []
+    def __init__(self, keyword, sources, rate_limiter=None, cache=None, similarity_threshold=None,
+                 store=None, session=None, thread_pool=None, parent=None):
+        super().__init__(parent)
+        self.keyword = keyword
+        self.sources = sources
+        # 공유 연결 풀 세션 (실행할 때마다 기존 연결 재사용)
+        self.session = session or get_default_session()
+        # 호스트별 요청 속도 제한 (모든 크롤러가 공유)
+        self.rate_limiter = rate_limiter or default_limiter
+        # 디스크 응답 캐시 (ETag/Last-Modified 재검증)
+        self.cache = cache or get_default_cache()
+        # 누적 기사 저장소
+        self.store = store or get_default_store()
+        # 소스별 지연 수집기 (limit까지만 추출)
+        self.news_sources = create_sources(self.session, self.rate_limiter, self.cache, sources)
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self.cancel_token = CancelToken()
+        
+        self.all_titles = OrderedDeduper()
+        # 출처마다 문구만 조금 다른 같은 기사는 같은 클러스터 번호로 표시
+        self.near_index = (NearDuplicateIndex(threshold=similarity_threshold)
+                           if similarity_threshold else None)
+        self.emitted_count = 0
+        self._pending = set()
     
-    def crawl_yna_news(self):
-        """연합뉴스 크롤링"""
-        try:
-            url = f"https://www.yna.co.kr/search/index?query={self.keyword}"
-            response = self.session.get(url)
-            response.raise_for_status()
-            response.encoding = 'utf-8'
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            titles = []
-            
-            title_elements = soup.find_all('strong', class_='tit-news')
-            for element in title_elements:
-                link = element.find('a')
-                if link:
-                    title = link.get_text().strip()
-                    if title and len(title) > 5:
-                        titles.append(title)
-            
-            return titles[:30]  # 최대 30개만 반환
-            
-        except Exception as e:
-            self.status_updated.emit(f"연합뉴스 크롤링 실패: {str(e)}")
-            return []
+    def start(self):
+        """모든 소스 작업을 스레드 풀에 넣습니다."""
+        self._pending = set(self.sources)
+        self.status_updated.emit(f"{', '.join(self.sources)}에서 동시에 크롤링 중...")
+        self.progress_updated.emit(0)
+        for name in self.sources:
+            task = SourceTask(self.news_sources[name], self.keyword, SOURCE_LIMITS.get(name),
+                              self.cancel_token, self.store)
+            task.signals.batch_ready.connect(self.handle_batch)
+            task.signals.finished.connect(self.handle_finished)
+            task.signals.failed.connect(self.handle_failed)
+            task.signals.cancelled.connect(self.handle_cancelled)
+            self.thread_pool.start(task)
+    
+    def cancel(self):
+        """진행 중인 작업들에 중지를 요청합니다 (각 작업이 다음 확인 지점에서 멈춤)."""
+        self.cancel_token.cancel()
+        self.status_updated.emit("중지하는 중...")
+    
+    def is_running(self):
+        return bool(self._pending)
+    
+    def handle_batch(self, source, titles):
+        """작업에서 온 제목 묶음을 중복 제거 후 화면으로 보냅니다."""
+        if self.cancel_token.cancelled:
+            return
+        new_titles = self.all_titles.extend(titles)
+        if not new_titles:
+            return
+        cluster_ids = None
+        if self.near_index is not None:
+            cluster_ids = [self.near_index.add(title)[0] for title in new_titles]
+        self.emitted_count += len(new_titles)
+        self.result_ready.emit(new_titles, cluster_ids)
+    
+    def cluster_count(self):
+        """지금까지 나온 유사 제목 클러스터 수 (묶지 않으면 None)"""
+        return self.near_index.cluster_count if self.near_index is not None else None
+    
+    def handle_finished(self, source, count, new_count):
+        self.status_updated.emit(f"{source} 크롤링 완료 ({count}개, 새 기사 {new_count}개)")
+        self._task_done(source)
+    
+    def handle_failed(self, source, message):
+        self.status_updated.emit(f"{source} 크롤링 실패: {message}")
+        self._task_done(source)
+    
+    def handle_cancelled(self, source):
+        self._task_done(source)
+    
+    def _task_done(self, source):
+        self._pending.discard(source)
+        done = len(self.sources) - len(self._pending)
+        self.progress_updated.emit(int(done / len(self.sources) * 100))
+        if not self._pending:
+            cancelled = self.cancel_token.cancelled
+            if not cancelled:
+                self.status_updated.emit(f"크롤링 완료! 총 {self.emitted_count}개의 뉴스 제목 수집")
+            self.finished.emit(self.emitted_count, cancelled)
 
 
 class NewsCrawlerGUI(QMainWindow):
@@ -162,7 +188,14 @@ class NewsCrawlerGUI(QMainWindow):
     
     def __init__(self):
         super().__init__()
-        self.news_data = []  # 크롤링된 뉴스 데이터 저장
+        # 크롤링된 뉴스 데이터 (테이블 모델이 보관)
+        self.results_model = NewsTableModel(self)
+        self.search_keyword = ""
+        self.text_view_dirty = False
+        self.crawl_controller = None
+        self.crawl_started_at = None
+        # 소스별 크롤링 작업을 실행할 스레드 풀
+        self.thread_pool = QThreadPool(self)
         self.init_ui()
         
     def init_ui(self):
@@ -201,6 +234,13 @@ class NewsCrawlerGUI(QMainWindow):
         splitter.setStretchFactor(0, 1)
         splitter.setStretchFactor(1, 3)
         
+        # 상태 표시줄: 소스별 회로 차단기 상태
+        self.breaker_label = QLabel("")
+        self.statusBar().addPermanentWidget(self.breaker_label)
+        self.breaker_timer = QTimer(self)
+        self.breaker_timer.timeout.connect(self.update_breaker_status)
+        self.breaker_timer.start(1000)
+        
         # 스타일 적용
         self.apply_styles()
     
@@ -230,6 +270,21 @@ class NewsCrawlerGUI(QMainWindow):
         sources_layout.addWidget(self.google_checkbox)
         sources_layout.addWidget(self.daum_checkbox)
         sources_layout.addWidget(self.yna_checkbox)
+        
+        self.merge_similar_checkbox = QCheckBox("유사 제목 묶기")
+        self.merge_similar_checkbox.setChecked(True)
+        sources_layout.addWidget(self.merge_similar_checkbox)
+        
+        # 같은 기사로 볼 최소 유사도 (높을수록 문구가 거의 같아야 묶임)
+        self.similarity_spinbox = QDoubleSpinBox()
+        self.similarity_spinbox.setRange(0.1, 1.0)
+        self.similarity_spinbox.setSingleStep(0.05)
+        self.similarity_spinbox.setDecimals(2)
+        self.similarity_spinbox.setValue(DEFAULT_SIMILARITY_THRESHOLD)
+        self.similarity_spinbox.setToolTip("같은 기사로 묶을 최소 유사도 (0~1)")
+        self.merge_similar_checkbox.toggled.connect(self.similarity_spinbox.setEnabled)
+        sources_layout.addWidget(QLabel("유사도:"))
+        sources_layout.addWidget(self.similarity_spinbox)
         sources_layout.addStretch()
         layout.addLayout(sources_layout)
         
@@ -277,30 +332,37 @@ class NewsCrawlerGUI(QMainWindow):
         layout = QVBoxLayout(results_group)
         
         # 탭 위젯 생성
-        tab_widget = QTabWidget()
+        self.results_tabs = QTabWidget()
         
-        # 테이블 뷰 탭
-        self.table_widget = QTableWidget()
-        self.table_widget.setColumnCount(3)
-        self.table_widget.setHorizontalHeaderLabels(["번호", "뉴스 제목", "수집 시간"])
+        # 테이블 뷰 탭 (모델/뷰: 화면에 보이는 행만 그림)
+        self.table_view = QTableView()
+        self.table_view.setModel(self.results_model)
+        self.table_view.verticalHeader().setVisible(False)
+        # 행 높이를 고정해 행마다 크기를 계산하지 않도록 함
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.verticalHeader().setDefaultSectionSize(28)
+        self.table_view.setWordWrap(False)
         
         # 테이블 컬럼 너비 설정
-        header = self.table_widget.horizontalHeader()
+        header = self.table_view.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Fixed)
-        header.setSectionResizeMode(1, QHeaderView.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.Fixed)
-        self.table_widget.setColumnWidth(0, 60)
-        self.table_widget.setColumnWidth(2, 150)
+        header.setSectionResizeMode(1, QHeaderView.Fixed)
+        header.setSectionResizeMode(2, QHeaderView.Stretch)
+        header.setSectionResizeMode(3, QHeaderView.Fixed)
+        self.table_view.setColumnWidth(0, 60)
+        self.table_view.setColumnWidth(1, 80)
+        self.table_view.setColumnWidth(3, 150)
         
-        tab_widget.addTab(self.table_widget, "📊 테이블 뷰")
+        self.results_tabs.addTab(self.table_view, "📊 테이블 뷰")
         
-        # 텍스트 뷰 탭
-        self.results_text = QTextEdit()
+        # 텍스트 뷰 탭 (탭을 열 때 한 번에 생성)
+        self.results_text = QPlainTextEdit()
         self.results_text.setReadOnly(True)
         self.results_text.setPlaceholderText("크롤링 결과가 여기에 표시됩니다...")
-        tab_widget.addTab(self.results_text, "📝 텍스트 뷰")
+        self.results_tabs.addTab(self.results_text, "📝 텍스트 뷰")
+        self.results_tabs.currentChanged.connect(self.refresh_text_view)
         
-        layout.addWidget(tab_widget)
+        layout.addWidget(self.results_tabs)
         
         # 통계 정보
         stats_layout = QHBoxLayout()
@@ -309,6 +371,15 @@ class NewsCrawlerGUI(QMainWindow):
         stats_layout.addStretch()
         layout.addLayout(stats_layout)
         
+        # 계측 요약 (소스별 연결/TTFB/다운로드/파싱)
+        metrics_group = QGroupBox("⏱️ 수집 계측")
+        metrics_layout = QVBoxLayout(metrics_group)
+        self.metrics_label = QLabel("크롤링을 실행하면 소스별 요청 계측이 표시됩니다.")
+        self.metrics_label.setWordWrap(True)
+        self.metrics_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        metrics_layout.addWidget(self.metrics_label)
+        layout.addWidget(metrics_group)
+        
         return results_group
     
     def apply_styles(self):
@@ -357,17 +428,17 @@ class NewsCrawlerGUI(QMainWindow):
         QLineEdit:focus {
             border-color: #3498db;
         }
-        QTextEdit {
+        QPlainTextEdit {
             border: 2px solid #bdc3c7;
             border-radius: 4px;
             font-family: Consolas, monospace;
         }
-        QTableWidget {
+        QTableView {
             gridline-color: #bdc3c7;
             border: 2px solid #bdc3c7;
             border-radius: 4px;
         }
-        QTableWidget::item {
+        QTableView::item {
             padding: 8px;
         }
         QProgressBar {
@@ -411,26 +482,34 @@ class NewsCrawlerGUI(QMainWindow):
         self.progress_bar.setValue(0)
         
         # 기존 결과 초기화
-        self.news_data.clear()
-        self.table_widget.setRowCount(0)
+        self.results_model.clear()
         self.results_text.clear()
-        
-        # 크롤링 스레드 시작
-        self.crawler_thread = CrawlerThread(keyword, sources)
-        self.crawler_thread.progress_updated.connect(self.update_progress)
-        self.crawler_thread.status_updated.connect(self.update_status)
-        self.crawler_thread.result_ready.connect(self.handle_results)
-        self.crawler_thread.error_occurred.connect(self.handle_error)
-        self.crawler_thread.start()
+        self.search_keyword = keyword
+        self.text_view_dirty = False
+        
+        self.crawl_started_at = time.time()
+        
+        # 소스별 작업을 스레드 풀에서 동시에 시작 (끝나는 소스부터 결과 표시)
+        similarity_threshold = (self.similarity_spinbox.value()
+                                if self.merge_similar_checkbox.isChecked() else None)
+        self.thread_pool.setMaxThreadCount(max(len(sources), 1))
+        # 이전 실행의 컨트롤러(중복 제거기, 유사 제목 색인 포함)는 끝났으므로 해제
+        if self.crawl_controller is not None:
+            self.crawl_controller.deleteLater()
+        self.crawl_controller = CrawlController(keyword, sources,
+                                                similarity_threshold=similarity_threshold,
+                                                thread_pool=self.thread_pool, parent=self)
+        self.crawl_controller.progress_updated.connect(self.update_progress)
+        self.crawl_controller.status_updated.connect(self.update_status)
+        self.crawl_controller.result_ready.connect(self.handle_results)
+        self.crawl_controller.finished.connect(self.handle_finished)
+        self.crawl_controller.start()
     
     def stop_crawling(self):
-        """크롤링 중지"""
-        if hasattr(self, 'crawler_thread') and self.crawler_thread.isRunning():
-            self.crawler_thread.terminate()
-            self.crawler_thread.wait()
-        
-        self.reset_ui_state()
-        self.update_status("크롤링이 중지되었습니다.")
+        """크롤링 중지 (각 작업이 다음 확인 지점에서 스스로 멈추고 연결을 반납)"""
+        if self.crawl_controller is not None and self.crawl_controller.is_running():
+            self.stop_button.setEnabled(False)
+            self.crawl_controller.cancel()
     
     def update_progress(self, value):
         """진행률 업데이트"""
@@ -440,43 +519,70 @@ class NewsCrawlerGUI(QMainWindow):
         """상태 메시지 업데이트"""
         self.status_label.setText(f"상태: {message}")
     
-    def handle_results(self, titles):
-        """크롤링 결과 처리"""
-        self.news_data = titles
+    def update_breaker_status(self):
+        """상태 표시줄의 소스별 회로 차단기 상태를 갱신합니다."""
+        status = get_default_breakers().format_status()
+        self.breaker_label.setText(f"🔌 {status}" if status else "")
+    
+    def handle_results(self, titles, cluster_ids):
+        """크롤링 결과 묶음 처리 (도착하는 대로 추가)"""
         current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
-        # 테이블 업데이트
-        self.table_widget.setRowCount(len(titles))
-        for idx, title in enumerate(titles):
-            self.table_widget.setItem(idx, 0, QTableWidgetItem(str(idx + 1)))
-            self.table_widget.setItem(idx, 1, QTableWidgetItem(title))
-            self.table_widget.setItem(idx, 2, QTableWidgetItem(current_time))
-        
-        # 텍스트 뷰 업데이트
-        text_content = f"🔍 검색 키워드: {self.keyword_input.text()}\n"
-        text_content += f"📅 수집 시간: {current_time}\n"
-        text_content += f"📊 총 {len(titles)}개의 뉴스 제목\n\n"
-        text_content += "=" * 60 + "\n"
+        # 테이블 업데이트 (새 행만 추가)
+        self.results_model.append_titles(titles, current_time, cluster_ids)
         
-        for idx, title in enumerate(titles, 1):
-            text_content += f"{idx:3d}. {title}\n"
-        
-        self.results_text.setPlainText(text_content)
+        # 텍스트 뷰는 묶음마다 다시 만들지 않고 탭을 열 때나 크롤링이 끝났을 때 생성
+        self.text_view_dirty = True
         
         # 통계 정보 업데이트
-        self.stats_label.setText(f"수집된 뉴스: {len(titles)}개")
-        
-        # UI 상태 복원
-        self.reset_ui_state()
-        self.save_csv_button.setEnabled(True)
-        self.save_excel_button.setEnabled(True)
-        
-        QMessageBox.information(self, "완료", f"총 {len(titles)}개의 뉴스 제목을 수집했습니다!")
+        total = self.results_model.rowCount()
+        cluster_count = self.crawl_controller.cluster_count() if self.crawl_controller else None
+        if cluster_count is None:
+            self.stats_label.setText(f"수집된 뉴스: {total}개")
+        else:
+            self.stats_label.setText(f"수집된 뉴스: {total}개 (유사 제목 클러스터 {cluster_count}개)")
+        self.save_csv_button.setEnabled(total > 0)
+        self.save_excel_button.setEnabled(total > 0)
     
-    def handle_error(self, error_message):
-        """에러 처리"""
+    def handle_finished(self, total, cancelled):
+        """모든 소스 작업이 끝났을 때 처리"""
         self.reset_ui_state()
-        QMessageBox.critical(self, "오류", error_message)
+        self.refresh_text_view()
+        self.metrics_label.setText(
+            get_default_metrics().format_summary(since=self.crawl_started_at) or "기록된 요청이 없습니다."
+        )
+        if cancelled:
+            self.update_status(f"크롤링이 중지되었습니다. ({total}개 수집)")
+            return
+        self.update_status(f"크롤링 완료! 총 {total}개의 뉴스 제목 수집")
+        QMessageBox.information(self, "완료", f"총 {total}개의 뉴스 제목을 수집했습니다!")
+    
+    def refresh_text_view(self, *args):
+        """텍스트 뷰 탭이 보이고 내용이 바뀌었을 때만 텍스트를 생성합니다."""
+        if not self.text_view_dirty or self.results_tabs.currentWidget() is not self.results_text:
+            return
+        store = self.results_model.store
+        collected_at = store.time_labels[0] if store.time_labels else ""
+        lines = [
+            f"🔍 검색 키워드: {self.search_keyword}",
+            f"📅 수집 시간: {collected_at}",
+            f"📊 총 {len(store)}개의 뉴스 제목",
+            "",
+            "=" * 60,
+        ]
+        lines.extend(
+            f"{idx:3d}. [{cluster}] {title}" if cluster else f"{idx:3d}. {title}"
+            for idx, cluster, title, _ in store.rows()
+        )
+        self.results_text.setPlainText("\n".join(lines) + "\n")
+        self.text_view_dirty = False
+    
+    def closeEvent(self, event):
+        """창을 닫을 때 진행 중인 작업을 중지하고 끝날 때까지 기다립니다."""
+        if self.crawl_controller is not None:
+            self.crawl_controller.cancel_token.cancel()
+        self.thread_pool.waitForDone()
+        super().closeEvent(event)
     
     def reset_ui_state(self):
         """UI 상태 초기화"""
@@ -487,7 +593,7 @@ class NewsCrawlerGUI(QMainWindow):
     
     def save_to_csv(self):
         """CSV 파일로 저장"""
-        if not self.news_data:
+        if not self.results_model.rowCount():
             QMessageBox.warning(self, "경고", "저장할 데이터가 없습니다!")
             return
         
@@ -499,11 +605,8 @@ class NewsCrawlerGUI(QMainWindow):
             try:
                 with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
                     writer = csv.writer(csvfile)
-                    writer.writerow(['번호', '뉴스 제목', '수집시간'])
-                    
-                    current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    for idx, title in enumerate(self.news_data, 1):
-                        writer.writerow([idx, title, current_time])
+                    writer.writerow(CLUSTER_HEADERS)
+                    writer.writerows(self.results_model.store.rows())
                 
                 QMessageBox.information(self, "저장 완료", f"CSV 파일이 저장되었습니다:\n{file_path}")
                 
@@ -512,7 +615,7 @@ class NewsCrawlerGUI(QMainWindow):
     
     def save_to_excel(self):
         """Excel 파일로 저장"""
-        if not self.news_data:
+        if not self.results_model.rowCount():
             QMessageBox.warning(self, "경고", "저장할 데이터가 없습니다!")
             return
         
@@ -522,60 +625,10 @@ class NewsCrawlerGUI(QMainWindow):
         
         if file_path:
             try:
-                # 새 워크북 생성
-                wb = Workbook()
-                ws = wb.active
-                ws.title = "뉴스 제목"
-                
-                # 헤더 스타일 설정
-                header_font = Font(bold=True, color="FFFFFF")
-                header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-                header_border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
-                center_alignment = Alignment(horizontal='center', vertical='center')
-                
-                # 헤더 작성
-                headers = ['번호', '뉴스 제목', '수집시간']
-                for col, header in enumerate(headers, 1):
-                    cell = ws.cell(row=1, column=col, value=header)
-                    cell.font = header_font
-                    cell.fill = header_fill
-                    cell.border = header_border
-                    cell.alignment = center_alignment
-                
-                # 데이터 입력
-                current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                for idx, title in enumerate(self.news_data, 1):
-                    ws.cell(row=idx+1, column=1, value=idx).alignment = center_alignment
-                    ws.cell(row=idx+1, column=2, value=title)
-                    ws.cell(row=idx+1, column=3, value=current_time).alignment = center_alignment
-                
-                # 컬럼 너비 자동 조정
-                ws.column_dimensions['A'].width = 8
-                ws.column_dimensions['B'].width = 80
-                ws.column_dimensions['C'].width = 20
-                
-                # 데이터 영역 테두리 추가
-                data_border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
-                
-                for row in range(2, len(self.news_data) + 2):
-                    for col in range(1, 4):
-                        ws.cell(row=row, column=col).border = data_border
-                
-                # 제목 행 고정
-                ws.freeze_panes = 'A2'
-                
-                # 파일 저장
-                wb.save(file_path)
+                # write-only 모드로 한 번에 한 행씩 기록 (대용량에서도 메모리 일정)
+                with StreamingExcelWriter(file_path, CLUSTER_HEADERS, CLUSTER_COLUMN_WIDTHS,
+                                          CLUSTER_CENTER_COLUMNS) as writer:
+                    writer.write_rows(self.results_model.store.rows())
                 
                 QMessageBox.information(self, "저장 완료", f"Excel 파일이 저장되었습니다:\n{file_path}")
                 
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+뉴스 소스별 지연(lazy) 제목 수집 API
+모든 소스가 같은 iter_titles(keyword, limit=...) 제너레이터를 제공하며,
+limit을 파싱 단계까지 내려보내 필요한 개수를 채우는 즉시 추출과 다운로드를 멈춥니다.
+"""
+
+from urllib.parse import quote, urljoin
+
+from fast_parse import iter_pull_links, iter_pull_texts
+from naver_news_crawler import NaverNewsCrawler
+from rss_stream import clean_google_title, iter_rss_items
+
+
+class NewsSource:
+    """
+    뉴스 소스 공통 인터페이스
+    하위 클래스는 검색 결과 한 페이지를 읽는 두 파서를 정의합니다.
+    - iter_parse(chunks, limit): 응답 바이트 조각에서 제목을 limit개까지 추출
+    - iter_parse_links(chunks, limit): 같은 방식으로 {'title', 'link'}를 추출
+    """
+
+    name = None
+    SEARCH_URL = None
+
+    def __init__(self, session, rate_limiter=None, cache=None):
+        """
+        Args:
+            session (requests.Session): 요청에 사용할 세션
+            rate_limiter (HostRateLimiter): 호스트별 속도 제한기
+            cache (ResponseCache): 응답 캐시
+        """
+        self.session = session
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+
+    def search_url(self, keyword):
+        """키워드 검색 URL을 만듭니다."""
+        return self.SEARCH_URL.format(query=quote(keyword))
+
+    def iter_titles(self, keyword, limit=None, cancel=None):
+        """
+        키워드 검색 결과의 제목을 하나씩 반환합니다.
+
+        Args:
+            keyword (str): 검색 키워드
+            limit (int): 최대 제목 수 (None이면 제한 없음)
+            cancel (CancelToken): 취소 토큰 (취소되면 CrawlCancelled 발생)
+
+        Yields:
+            str: 뉴스 제목
+        """
+        return self.cache.iter_titles(
+            self.session, self.search_url(keyword), self.iter_parse, limit, self.rate_limiter,
+            cancel=cancel
+        )
+
+    def crawl(self, keyword, limit=None, cancel=None):
+        """
+        iter_titles 결과를 리스트로 반환합니다.
+
+        Args:
+            keyword (str): 검색 키워드
+            limit (int): 최대 제목 수
+            cancel (CancelToken): 취소 토큰
+
+        Returns:
+            list: 뉴스 제목 리스트
+        """
+        return list(self.iter_titles(keyword, limit, cancel))
+
+    def iter_links(self, keyword, limit=None, cancel=None):
+        """
+        키워드 검색 결과의 기사 링크 레코드를 하나씩 반환합니다 (본문 수집용).
+
+        Args:
+            keyword (str): 검색 키워드
+            limit (int): 최대 개수 (None이면 제한 없음)
+            cancel (CancelToken): 취소 토큰
+
+        Yields:
+            dict: {'title', 'link', 'source', 'keyword'} (link는 절대 주소)
+        """
+        url = self.search_url(keyword)
+        # 제목 목록과 같은 URL이므로 캐시 항목 키를 따로 둠
+        items = self.cache.iter_titles(
+            self.session, url, self.iter_parse_links, limit, self.rate_limiter,
+            cancel=cancel, cache_key=url + '#links'
+        )
+        for item in items:
+            if item['link']:
+                yield {'title': item['title'], 'link': urljoin(url, item['link']),
+                       'source': self.name, 'keyword': keyword}
+
+
+class DaumNewsSource(NewsSource):
+    name = "다음 뉴스"
+    SEARCH_URL = "https://search.daum.net/search?w=news&q={query}&DA=PGD&spacing=0"
+
+    def iter_parse(self, chunks, limit):
+        # a.f_link_b
+        return iter_pull_texts(chunks, 'a', 'f_link_b', limit)
+
+    def iter_parse_links(self, chunks, limit):
+        return iter_pull_links(chunks, 'a', 'f_link_b', limit)
+
+
+class YnaNewsSource(NewsSource):
+    name = "연합뉴스"
+    SEARCH_URL = "https://www.yna.co.kr/search/index?query={query}"
+
+    def iter_parse(self, chunks, limit):
+        # strong.tit-news 안의 첫 번째 링크
+        return iter_pull_texts(chunks, 'strong', 'tit-news', limit, first_link=True)
+
+    def iter_parse_links(self, chunks, limit):
+        return iter_pull_links(chunks, 'strong', 'tit-news', limit, first_link=True)
+
+
+class GoogleNewsSource(NewsSource):
+    name = "구글 뉴스"
+    SEARCH_URL = "https://news.google.com/rss/search?q={query}&hl=ko&gl=KR&ceid=KR:ko"
+
+    def iter_parse(self, chunks, limit):
+        for item in self.iter_parse_links(chunks, limit):
+            yield item['title']
+
+    def iter_items(self, keyword, limit=None, cancel=None):
+        """
+        RSS 피드의 기사 항목을 가공하지 않고 하나씩 반환합니다 (캐시 사용).
+
+        Args:
+            keyword (str): 검색 키워드
+            limit (int): 최대 항목 수 (None이면 피드 끝까지)
+            cancel (CancelToken): 취소 토큰
+
+        Yields:
+            dict: {'title', 'link', 'source', 'pub_date'}
+        """
+        url = self.search_url(keyword)
+        # 제목 목록과 같은 URL이므로 캐시 항목 키를 따로 둠
+        return self.cache.iter_titles(
+            self.session, url, iter_rss_items, limit, self.rate_limiter,
+            cancel=cancel, cache_key=url + '#items'
+        )
+
+    def iter_parse_links(self, chunks, limit):
+        count = 0
+        for item in iter_rss_items(chunks):
+            # 구글 뉴스의 경우 "- 출처명" 형태로 끝나므로 이를 정리
+            title = clean_google_title(item['title'])
+            if title and len(title) > 5:
+                yield {'title': title, 'link': item['link'] or None}
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+
+class NaverNewsSource(NewsSource):
+    name = "네이버 뉴스"
+
+    def __init__(self, session, rate_limiter=None, cache=None):
+        super().__init__(session, rate_limiter, cache)
+        self._crawler = NaverNewsCrawler(rate_limiter, cache, session)
+
+    def search_url(self, keyword):
+        return self._crawler.NEWS_SEARCH_URL.format(query=quote(keyword), start=1)
+
+    def iter_parse(self, chunks, limit):
+        # 검색 결과 한 페이지 (페이지 넘김은 iter_titles에서)
+        for item in self.iter_parse_links(chunks, limit):
+            yield item['title']
+
+    def iter_parse_links(self, chunks, limit):
+        return self._crawler.iter_parse_news_items(chunks, limit)
+
+    def iter_titles(self, keyword, limit=None, cancel=None):
+        # 페이지 단위로 넘기다가 limit개를 채우면 다음 페이지는 요청하지 않음
+        # (취소 토큰은 속도 제한 대기와 페이지 응답 조각까지 전달)
+        return self._crawler.iter_news_titles(keyword, max_items=limit, cancel=cancel)
+
+    def iter_links(self, keyword, limit=None, cancel=None):
+        items = self._crawler.iter_news_items(keyword, max_items=limit, cancel=cancel)
+        url = self.search_url(keyword)
+        for item in items:
+            if item['link']:
+                yield {'title': item['title'], 'link': urljoin(url, item['link']),
+                       'source': self.name, 'keyword': keyword}
+
+
+SOURCE_CLASSES = {
+    cls.name: cls for cls in (GoogleNewsSource, DaumNewsSource, YnaNewsSource, NaverNewsSource)
+}
+
+
+def create_sources(session, rate_limiter=None, cache=None, names=None):
+    """
+    소스 이름별 NewsSource 인스턴스를 만듭니다.
+
+    Args:
+        session (requests.Session): 모든 소스가 공유할 세션
+        rate_limiter (HostRateLimiter): 호스트별 속도 제한기
+        cache (ResponseCache): 응답 캐시
+        names (iterable): 만들 소스 이름들 (None이면 전체)
+
+    Returns:
+        dict: {소스 이름: NewsSource}
+    """
+    names = SOURCE_CLASSES if names is None else names
+    return {name: SOURCE_CLASSES[name](session, rate_limiter, cache) for name in names}
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+상주형 뉴스 감시 모드
+cron으로 매번 스크립트를 처음부터 다시 실행하는 대신, 세션/캐시/저장소를 메모리에
+유지한 채 키워드×소스 조합마다 따로 주기를 두고 폴링합니다.
+새 기사가 자주 나오는 조합은 주기를 줄이고, 조용한 조합은 주기를 늘려
+불필요한 요청은 줄이면서 속보는 빨리 잡아냅니다. 처음 보는 기사만 내보냅니다.
+
+사용 예:
+    python news_watch.py -k "반도체 관련주" HBM -s daum google yna
+    python news_watch.py --keywords-file keywords.txt --min-interval 180 --csv new_articles.csv
+"""
+
+import argparse
+import csv
+import heapq
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+from article_store import ArticleStore, get_default_store
+from batch_crawl import DEFAULT_SOURCES, BatchCrawler, read_keywords, resolve_source
+from fetch_engine import ConcurrentFetcher
+from metrics import get_default_metrics
+
+
+class AdaptiveInterval:
+    def __init__(self, initial=300, min_interval=120, max_interval=1800, backoff=1.5, speedup=0.5):
+        """
+        Args:
+            initial (float): 처음 폴링 주기(초)
+            min_interval (float): 최소 주기. 응답 캐시 TTL(기본 120초)보다 짧으면 캐시만 다시 읽게 됨
+            max_interval (float): 최대 주기
+            backoff (float): 새 기사가 없을 때 주기에 곱할 값
+            speedup (float): 새 기사가 있을 때 주기에 곱할 값
+        """
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.speedup = speedup
+        self.value = min(max(initial, min_interval), max_interval)
+
+    def update(self, new_count):
+        """
+        이번 폴링에서 나온 새 기사 수로 다음 주기를 정합니다.
+
+        Args:
+            new_count (int): 새 기사 수
+
+        Returns:
+            float: 다음 폴링까지의 주기(초)
+        """
+        factor = self.speedup if new_count else self.backoff
+        self.value = min(max(self.value * factor, self.min_interval), self.max_interval)
+        return self.value
+
+
+class WatchTarget:
+    """키워드×소스 조합 하나의 폴링 상태"""
+
+    def __init__(self, keyword, source, interval):
+        self.keyword = keyword
+        self.source = source
+        self.interval = interval
+        self.next_due = 0.0
+        self.polls = 0
+        self.failures = 0
+        self.new_total = 0
+        self.last_new_at = None
+
+    def __lt__(self, other):
+        return self.next_due < other.next_due
+
+
+class NewsWatcher:
+    def __init__(self, keywords, sources=DEFAULT_SOURCES, crawler=None, store=None,
+                 max_workers=6, interval_options=None):
+        """
+        Args:
+            keywords (iterable): 감시할 키워드들
+            sources (iterable): 감시할 소스 이름들
+            crawler (BatchCrawler): 실제 수집에 사용할 크롤러 (세션/캐시/속도 제한 공유)
+            store (ArticleStore): 새 기사 판별용 저장소 (없으면 기본 저장소)
+            max_workers (int): 동시에 폴링할 최대 조합 수
+            interval_options (dict): AdaptiveInterval 인자
+        """
+        self.crawler = crawler or BatchCrawler(max_workers=max_workers)
+        self.store = store or get_default_store()
+        self.fetcher = ConcurrentFetcher(max_workers=max_workers)
+        self._stop = threading.Event()
+
+        interval_options = interval_options or {}
+        self.targets = []
+        for keyword in keywords:
+            for source in sources:
+                target = WatchTarget(keyword, source, AdaptiveInterval(**interval_options))
+                heapq.heappush(self.targets, target)
+
+    def stop(self):
+        """다른 스레드에서 감시 루프를 멈춥니다."""
+        self._stop.set()
+
+    def _pop_due(self, now):
+        due = []
+        while self.targets and self.targets[0].next_due <= now:
+            due.append(heapq.heappop(self.targets))
+        return due
+
+    def poll_due(self, now=None):
+        """
+        주기가 된 조합들을 동시에 폴링하고 새 기사를 반환합니다.
+
+        Args:
+            now (float): 기준 시각 (없으면 현재 시각)
+
+        Returns:
+            list: 새 기사 {'keyword', 'source', 'title', 'found_at'} 리스트
+        """
+        now = time.time() if now is None else now
+        pending = {(target.keyword, target.source): target for target in self._pop_due(now)}
+        jobs = {key: (lambda target=target: self._poll(target)) for key, target in pending.items()}
+
+        new_items = []
+        try:
+            for key, result in self.fetcher.iter_results(jobs):
+                target = pending[key]
+                if result['error'] is not None:
+                    # 실패는 조용한 폴링이 아니므로 주기를 바꾸지 않고 같은 주기 뒤에 다시 시도
+                    print(f"{target.source} '{target.keyword}' 폴링 실패: {result['error']}")
+                    target.failures += 1
+                    target.next_due = time.time() + target.interval.value
+                else:
+                    # 저장소에 없던 제목만 새 기사 (같은 키워드의 다른 소스에서 이미 본 제목 포함)
+                    new_titles = self.store.upsert_titles(result['titles'], target.source, target.keyword)
+                    found_at = time.time()
+                    for title in new_titles:
+                        new_items.append({'keyword': target.keyword, 'source': target.source,
+                                          'title': title, 'found_at': found_at})
+
+                    target.polls += 1
+                    target.new_total += len(new_titles)
+                    if new_titles:
+                        target.last_new_at = found_at
+                    target.next_due = found_at + target.interval.update(len(new_titles))
+                del pending[key]
+                heapq.heappush(self.targets, target)
+        finally:
+            # 중간에 예외(저장 오류, Ctrl+C)가 나도 꺼낸 조합을 잃지 않도록 그대로 다시 넣음
+            for target in pending.values():
+                heapq.heappush(self.targets, target)
+        return new_items
+
+    def _poll(self, target):
+        """조합 하나를 수집합니다. 실패와 결과 없음을 구분하려고 오류를 결과에 담아 반환합니다."""
+        try:
+            return {'titles': self.crawler.fetch_titles(target.keyword, target.source), 'error': None}
+        except Exception as e:
+            return {'titles': [], 'error': str(e)}
+
+    def seconds_until_next(self, now=None):
+        """다음 폴링까지 남은 시간(초)을 반환합니다."""
+        if not self.targets:
+            return None
+        now = time.time() if now is None else now
+        return max(0.0, self.targets[0].next_due - now)
+
+    def iter_new_items(self, max_rounds=None, after_round=None):
+        """
+        stop()이 호출될 때까지 폴링하면서 새 기사를 하나씩 반환합니다.
+
+        Args:
+            max_rounds (int): 최대 폴링 라운드 수 (None이면 무한)
+            after_round (callable): 라운드가 끝날 때마다 인자 없이 호출할 함수
+
+        Yields:
+            dict: {'keyword', 'source', 'title', 'found_at'}
+        """
+        rounds = 0
+        while not self._stop.is_set():
+            yield from self.poll_due()
+            if after_round is not None:
+                after_round()
+            rounds += 1
+            if max_rounds is not None and rounds >= max_rounds:
+                return
+            wait = self.seconds_until_next()
+            if wait is None:
+                return
+            # 주기가 될 때까지 대기 (stop()이 호출되면 바로 깨어남)
+            self._stop.wait(wait)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="키워드×소스 뉴스 감시 (적응형 폴링 주기)")
+    parser.add_argument('-k', '--keywords', nargs='+', default=[], help="감시할 키워드들")
+    parser.add_argument('--keywords-file', help="키워드 목록 파일 (한 줄에 하나)")
+    parser.add_argument('-s', '--sources', nargs='+', default=None,
+                        help="소스들 (naver, daum, google, yna). 기본값: daum google yna")
+    parser.add_argument('-w', '--workers', type=int, default=6, help="동시 폴링 수 (기본값: 6)")
+    parser.add_argument('--interval', type=float, default=300, help="처음 폴링 주기(초)")
+    parser.add_argument('--min-interval', type=float, default=120, help="최소 폴링 주기(초)")
+    parser.add_argument('--max-interval', type=float, default=1800, help="최대 폴링 주기(초)")
+    parser.add_argument('--store-path', help="새 기사 판별용 SQLite 파일 (기본값: 기사 저장소)")
+    parser.add_argument('--csv', help="새 기사를 이어서 기록할 CSV 파일")
+    parser.add_argument('--metrics', help="라운드마다 요청 계측 Prometheus 텍스트를 갱신할 파일")
+    args = parser.parse_args(argv)
+
+    keywords = list(args.keywords)
+    if args.keywords_file:
+        keywords.extend(read_keywords(args.keywords_file))
+    if not keywords:
+        parser.error("키워드를 -k 또는 --keywords-file로 지정하세요.")
+    args.keywords = list(dict.fromkeys(keywords))
+
+    try:
+        args.sources = [resolve_source(name) for name in args.sources] if args.sources else list(DEFAULT_SOURCES)
+    except ValueError as e:
+        parser.error(str(e))
+    return args
+
+
+def main(argv=None):
+    """감시 모드 실행 함수 (Ctrl+C로 종료)"""
+    args = parse_args(argv)
+    store = ArticleStore(args.store_path) if args.store_path else None
+    watcher = NewsWatcher(
+        args.keywords, args.sources, store=store, max_workers=args.workers,
+        interval_options={'initial': args.interval, 'min_interval': args.min_interval,
+                          'max_interval': args.max_interval},
+    )
+
+    print(f"뉴스 감시 시작: 키워드 {len(args.keywords)}개 × 소스 {len(args.sources)}개 (Ctrl+C로 종료)")
+
+    csv_file = None
+    csv_writer = None
+    if args.csv:
+        write_header = not os.path.exists(args.csv)
+        csv_file = open(args.csv, 'a', newline='', encoding='utf-8')
+        csv_writer = csv.writer(csv_file)
+        if write_header:
+            csv_writer.writerow(['발견시간', '키워드', '출처', '뉴스 제목'])
+
+    try:
+        after_round = (lambda: get_default_metrics().write_prometheus(args.metrics)) if args.metrics else None
+        for item in watcher.iter_new_items(after_round=after_round):
+            found_at = datetime.fromtimestamp(item['found_at']).strftime('%Y-%m-%d %H:%M:%S')
+            print(f"[{found_at}] [{item['keyword']} | {item['source']}] {item['title']}")
+            if csv_writer:
+                csv_writer.writerow([found_at, item['keyword'], item['source'], item['title']])
+                csv_file.flush()
+    except KeyboardInterrupt:
+        print("\n감시를 종료합니다.")
+    finally:
+        if csv_file:
+            csv_file.close()
+
+    for target in sorted(watcher.targets, key=lambda t: (t.keyword, t.source)):
+        failures = f", 실패 {target.failures}회" if target.failures else ""
+        print(f"- {target.keyword} | {target.source}: 폴링 {target.polls}회{failures}, "
+              f"새 기사 {target.new_total}개, 현재 주기 {target.interval.value:.0f}초")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
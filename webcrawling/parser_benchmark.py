@@ -0,0 +1,488 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+파서 처리량 벤치마크
+네이버 4단계 대체 추출, 다음 a.f_link_b, 연합뉴스 strong.tit-news, 구글 뉴스 RSS 추출기를
+파서 백엔드별로 저장된 페이지(카세트/HTML 파일)와 항목 수를 키운 합성 페이지에서 실행해
+초당 페이지/항목 수, 페이지당 지연 백분위수, 최대 메모리를 측정합니다.
+결과를 기준선 파일로 저장해 두고 다음 실행과 비교할 수 있습니다.
+
+사용 예:
+    python parser_benchmark.py                              # 합성 페이지 (10/100/1000/5000개)
+    python parser_benchmark.py --cassette run.cassette.gz   # 기록해 둔 실제 페이지 포함
+    python parser_benchmark.py --save-baseline              # 기준선 저장
+    python parser_benchmark.py --compare --fail-on-regression
+"""
+
+import argparse
+import base64
+import glob
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import xml.etree.ElementTree as ElementTree
+from html import escape
+from urllib.parse import urlparse
+
+from lxml import etree
+
+from cassette import Cassette
+from fast_parse import iter_pull_texts
+from naver_news_crawler import NaverNewsCrawler, NaverStrategySelector
+from news_crawler_alternative import AlternativeNewsCrawler
+from rss_stream import clean_google_title, iter_rss_items
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError:
+    BeautifulSoup = None
+
+
+DEFAULT_SIZES = (10, 100, 1000, 5000)
+SYNTHETIC_TOPIC = "반도체 관련주"
+DEFAULT_BASELINE_PATH = 'parser_benchmark_baseline.json'
+CHUNK_SIZE = 16 * 1024
+
+# 카세트 URL 호스트 → 추출기
+FIXTURE_HOSTS = {
+    'search.naver.com': 'naver',
+    'search.daum.net': 'daum',
+    'www.yna.co.kr': 'yna',
+    'news.google.com': 'google',
+}
+
+_AD_WORDS = ['광고', '이벤트', '혜택', '할인', '무료', '증정', '$']
+
+
+# ---------------------------------------------------------------------------
+# 합성 페이지
+# ---------------------------------------------------------------------------
+
+def synthetic_title(i, topic=SYNTHETIC_TOPIC):
+    return f"{escape(topic)} {i}번째 기사 제목, HBM 수요 증가로 실적 개선 기대 ({i % 97})"
+
+
+def _page(body, filler):
+    # 실제 검색 페이지처럼 제목과 무관한 마크업을 섞음
+    noise = ''.join(
+        f'<div class="ad_area"><span class="txt">광고 {i}</span><a href="/ad/{i}">이벤트 혜택</a></div>'
+        for i in range(filler)
+    )
+    return f'<html><head><title>검색</title></head><body>{noise}{body}{noise}</body></html>'
+
+
+def make_naver_page(count, strategy=1, first=0, topic=SYNTHETIC_TOPIC):
+    """
+    네이버 검색 결과 합성 페이지를 만듭니다.
+
+    Args:
+        count (int): 기사 수
+        strategy (int): 제목이 잡히는 추출 단계 (1~4, 앞 단계는 모두 실패하도록 구성)
+        first (int): 첫 기사 번호 (페이지 넘김용)
+        topic (str): 제목 앞에 붙일 주제 (검색 키워드)
+    """
+    rows = []
+    for i in range(first, first + count):
+        title = synthetic_title(i, topic)
+        href = f"https://n.news.naver.com/mnews/article/001/{i:010d}"
+        if strategy == 1:
+            rows.append(f'<li class="bx"><div class="news_wrap"><div class="news_area">'
+                        f'<div class="news_info"><span class="info">{i % 23 + 1}시간 전</span></div>'
+                        f'<a href="{href}" class="news_tit" title="{title}">{title}</a>'
+                        f'<div class="news_dsc">요약 {i}</div></div></div></li>')
+        elif strategy == 2:
+            rows.append(f'<li><a href="{href}">{title}</a></li>')
+        elif strategy == 3:
+            rows.append(f'<p><a href="{href}">{title}</a></p>')
+        else:
+            rows.append(f'<p><a href="/r/{i}">{title}</a></p>')
+    body = ''.join(rows)
+    if strategy == 2:
+        body = f'<div data-module="news"><ul>{body}</ul></div>'
+    return _page(body, max(5, count // 10))
+
+
+def make_daum_page(count, first=0, topic=SYNTHETIC_TOPIC):
+    body = ''.join(
+        f'<li><div class="wrap_cont"><a href="https://v.daum.net/v/{i}" class="f_link_b">'
+        f'{synthetic_title(i, topic)}</a><p class="desc">요약 {i}</p></div></li>'
+        for i in range(first, first + count)
+    )
+    return _page(f'<ul class="list_news">{body}</ul>', max(5, count // 10))
+
+
+def make_yna_page(count, first=0, topic=SYNTHETIC_TOPIC):
+    body = ''.join(
+        f'<li><div class="news-con"><strong class="tit-news">'
+        f'<a href="https://www.yna.co.kr/view/AKR{i}">{synthetic_title(i, topic)}</a></strong>'
+        f'<p class="lead">요약 {i}</p></div></li>'
+        for i in range(first, first + count)
+    )
+    return _page(f'<ul class="list">{body}</ul>', max(5, count // 10))
+
+
+def make_google_rss(count, first=0, topic=SYNTHETIC_TOPIC):
+    items = ''.join(
+        f'<item><title>{synthetic_title(i, topic)} - 언론사{i % 17}</title>'
+        f'<link>https://news.google.com/rss/articles/{i}</link>'
+        f'<pubDate>Mon, 01 Jan 2024 00:00:00 GMT</pubDate>'
+        f'<source url="https://example.com">언론사{i % 17}</source></item>'
+        for i in range(first, first + count)
+    )
+    return ('<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f'<title>Google News</title>{items}</channel></rss>')
+
+
+def make_article_page(article_id, paragraphs=8, topic=SYNTHETIC_TOPIC):
+    """
+    기사 본문 합성 페이지를 만듭니다 (메뉴, 관련 기사, 댓글, 푸터 같은 상용구 포함).
+
+    Args:
+        article_id (str): 기사 번호 (제목과 본문에 포함)
+        paragraphs (int): 본문 문단 수
+        topic (str): 제목 앞에 붙일 주제
+    """
+    title = f"{escape(topic)} {escape(str(article_id))}번 기사, HBM 수요 증가로 실적 개선 기대"
+    body = '<br><br>'.join(
+        f"{escape(topic)} 관련 {n + 1}번째 문단입니다. 업계에 따르면 올해 수출은 지난해보다 "
+        f"{n + 3}% 늘어날 것으로 보이며, 주요 기업들은 설비 투자를 확대하고 있다."
+        for n in range(paragraphs)
+    )
+    related = ''.join(f'<li><a href="/related/{n}">관련 기사 {n}번, 함께 많이 본 뉴스 제목</a></li>'
+                      for n in range(10))
+    return (
+        f'<html><head><meta charset="utf-8"><title>{title} - 합성일보</title>'
+        f'<meta property="og:title" content="{title}">'
+        f'<meta property="article:published_time" content="2024-01-01T09:00:00+09:00"></head>'
+        f'<body><div id="gnb"><a href="/">홈</a><a href="/economy">경제</a><a href="/it">IT</a></div>'
+        f'<div class="article_view"><h2>{title}</h2><div id="articleBody">{body}<br>'
+        f'<span class="reporter">김합성 기자</span></div>'
+        f'<div class="related_news"><ul>{related}</ul></div></div>'
+        f'<div class="comment_area"><p>댓글 영역입니다. 로그인 후 의견을 남겨 주세요, 감사합니다.</p></div>'
+        f'<footer>Copyright 합성일보. 무단 전재 및 재배포 금지.</footer></body></html>'
+    )
+
+
+def synthetic_fixtures(sizes):
+    """
+    (추출기, 픽스처 이름, 본문 bytes) 목록을 만듭니다.
+    """
+    fixtures = []
+    for size in sizes:
+        for strategy in (1, 2, 3, 4):
+            fixtures.append(('naver', f'synthetic-s{strategy}-{size}',
+                             make_naver_page(size, strategy).encode('utf-8')))
+        fixtures.append(('daum', f'synthetic-{size}', make_daum_page(size).encode('utf-8')))
+        fixtures.append(('yna', f'synthetic-{size}', make_yna_page(size).encode('utf-8')))
+        fixtures.append(('google', f'synthetic-{size}', make_google_rss(size).encode('utf-8')))
+    return fixtures
+
+
+def cassette_fixtures(path):
+    """카세트에 기록된 200 응답 중 추출기가 있는 호스트의 페이지를 픽스처로 씁니다."""
+    fixtures = []
+    for idx, interaction in enumerate(Cassette(path).load(), 1):
+        extractor = FIXTURE_HOSTS.get(urlparse(interaction['url']).hostname)
+        if extractor and interaction['status'] == 200:
+            name = f"{os.path.basename(path)}#{idx}"
+            fixtures.append((extractor, name, base64.b64decode(interaction['body'])))
+    return fixtures
+
+
+def directory_fixtures(directory):
+    """naver_*.html, daum_*.html, yna_*.html, google_*.xml 파일을 픽스처로 씁니다."""
+    fixtures = []
+    for extractor in ('naver', 'daum', 'yna', 'google'):
+        for path in sorted(glob.glob(os.path.join(directory, f'{extractor}_*'))):
+            with open(path, 'rb') as f:
+                fixtures.append((extractor, os.path.basename(path), f.read()))
+    return fixtures
+
+
+# ---------------------------------------------------------------------------
+# 추출기 백엔드 (모두 bytes 본문을 받아 제목 리스트를 반환)
+# ---------------------------------------------------------------------------
+
+def _chunks(data):
+    return (data[i:i + CHUNK_SIZE] for i in range(0, len(data), CHUNK_SIZE))
+
+
+NAVER_BENCH_URL = 'https://search.naver.com/search.naver?where=news&query=benchmark&sort=1&start=1'
+_NAVER_FULL_CHAIN = NaverStrategySelector(recheck_every=1)
+
+
+def _bs4_naver_titles(data, features):
+    """lxml 전환 이전의 BeautifulSoup 4단계 추출 (제목 재파싱 제외)"""
+    soup = BeautifulSoup(data.decode('utf-8'), features)
+    news_items = []
+    for area in soup.find_all('div', class_='news_area'):
+        news_items.extend(area.find_all('a', class_='news_tit'))
+    if not news_items:
+        for section in soup.find_all('div', {'data-module': 'news'}):
+            news_items.extend(link for link in section.find_all('a')
+                              if 'news.naver.com' in link.get('href', ''))
+    if not news_items:
+        news_items = [link for link in soup.find_all('a', href=True)
+                      if 'news.naver.com' in link['href'] and '/article/' in link['href']]
+    if not news_items:
+        for link in soup.find_all('a'):
+            text = link.get_text().strip()
+            if (text and 10 < len(text) < 100 and
+                    any(0xAC00 <= ord(char) <= 0xD7A3 for char in text) and
+                    not any(ad_word in text for ad_word in _AD_WORDS)):
+                news_items.append(link)
+    titles = []
+    for item in news_items:
+        title = item.get_text().strip()
+        if title and len(title) > 5 and title not in titles:
+            titles.append(title)
+    return titles
+
+
+def _bs4_select(data, selector, features):
+    soup = BeautifulSoup(data.decode('utf-8'), features)
+    titles = []
+    for element in soup.select(selector):
+        text = element.get_text().strip()
+        if text and len(text) >= 6:
+            titles.append(text)
+    return titles
+
+
+def _google_titles_from(elements):
+    titles = []
+    for element in elements:
+        title = clean_google_title(element.findtext('title') or '')
+        if title and len(title) > 5:
+            titles.append(title)
+    return titles
+
+
+EXTRACTORS = {
+    'naver': {
+        'lxml-xpath': lambda data: NaverNewsCrawler.parse_news_titles(data.decode('utf-8'), NAVER_BENCH_URL),
+        # 기억한 추출 방법 없이 매번 1번부터 시도 (선택기 효과 비교용)
+        'lxml-xpath-chain': lambda data: NaverNewsCrawler.parse_news_titles(
+            data.decode('utf-8'), NAVER_BENCH_URL, _NAVER_FULL_CHAIN),
+    },
+    'daum': {
+        'lxml-xpath': lambda data: AlternativeNewsCrawler.parse_daum_titles(data.decode('utf-8')),
+        'lxml-pull': lambda data: list(iter_pull_texts(_chunks(data), 'a', 'f_link_b')),
+    },
+    'yna': {
+        'lxml-xpath': lambda data: AlternativeNewsCrawler.parse_yna_titles(data.decode('utf-8')),
+        'lxml-pull': lambda data: list(iter_pull_texts(_chunks(data), 'strong', 'tit-news',
+                                                       first_link=True)),
+    },
+    'google': {
+        'lxml-pull': lambda data: [title for title in (clean_google_title(item['title'])
+                                                       for item in iter_rss_items(_chunks(data)))
+                                   if title and len(title) > 5],
+        'lxml-tree': lambda data: _google_titles_from(
+            etree.fromstring(data, etree.XMLParser(recover=True)).iter('item')),
+        'stdlib-etree': lambda data: _google_titles_from(ElementTree.fromstring(data).iter('item')),
+    },
+}
+
+if BeautifulSoup is not None:
+    EXTRACTORS['naver']['bs4-html.parser'] = lambda data: _bs4_naver_titles(data, 'html.parser')
+    EXTRACTORS['naver']['bs4-lxml'] = lambda data: _bs4_naver_titles(data, 'lxml')
+    EXTRACTORS['daum']['bs4-html.parser'] = lambda data: _bs4_select(data, 'a.f_link_b', 'html.parser')
+    EXTRACTORS['yna']['bs4-html.parser'] = lambda data: _bs4_select(
+        data, 'strong.tit-news a', 'html.parser')
+
+
+# ---------------------------------------------------------------------------
+# 측정
+# ---------------------------------------------------------------------------
+
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def measure(extract, data, min_time=0.3, min_runs=3, max_runs=1000):
+    """
+    추출기 하나를 반복 실행해 측정합니다.
+
+    Args:
+        extract (callable): bytes 본문을 받아 제목 리스트를 반환하는 함수
+        data (bytes): 페이지 본문
+        min_time (float): 최소 측정 시간(초)
+        min_runs (int): 최소 반복 횟수
+        max_runs (int): 최대 반복 횟수
+
+    Returns:
+        dict: items, runs, pages_per_sec, items_per_sec, p50_ms, p95_ms, p99_ms, peak_kb
+    """
+    items = len(extract(data))  # 워밍업
+
+    latencies = []
+    started = time.perf_counter()
+    while len(latencies) < max_runs and (len(latencies) < min_runs or
+                                         time.perf_counter() - started < min_time):
+        run_started = time.perf_counter()
+        extract(data)
+        latencies.append(time.perf_counter() - run_started)
+    total = sum(latencies)
+
+    # 메모리는 추적 오버헤드가 커서 한 번만 따로 측정
+    tracemalloc.start()
+    try:
+        extract(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'items': items,
+        'runs': len(latencies),
+        'pages_per_sec': len(latencies) / total if total else 0.0,
+        'items_per_sec': items * len(latencies) / total if total else 0.0,
+        'p50_ms': 1000 * _percentile(latencies, 0.50),
+        'p95_ms': 1000 * _percentile(latencies, 0.95),
+        'p99_ms': 1000 * _percentile(latencies, 0.99),
+        'peak_kb': peak / 1024,
+    }
+
+
+def run_benchmarks(fixtures, extractors=None, backends=None, min_time=0.3):
+    """
+    픽스처마다 해당 추출기의 모든 백엔드를 측정합니다.
+
+    Args:
+        fixtures (list): (추출기, 픽스처 이름, bytes) 리스트
+        extractors (iterable): 측정할 추출기 이름들 (None이면 전체)
+        backends (iterable): 측정할 백엔드 이름들 (None이면 전체)
+        min_time (float): 항목별 최소 측정 시간(초)
+
+    Yields:
+        dict: 측정 결과 한 행 (key, extractor, backend, fixture, bytes + measure() 결과)
+    """
+    for extractor, fixture, data in fixtures:
+        if extractors and extractor not in extractors:
+            continue
+        for backend, extract in EXTRACTORS[extractor].items():
+            if backends and backend not in backends:
+                continue
+            row = {
+                'key': f'{extractor}/{backend}/{fixture}',
+                'extractor': extractor,
+                'backend': backend,
+                'fixture': fixture,
+                'bytes': len(data),
+            }
+            row.update(measure(extract, data, min_time=min_time))
+            yield row
+
+
+def load_baseline(path):
+    with open(path, encoding='utf-8') as f:
+        return {row['key']: row for row in json.load(f)['results']}
+
+
+def save_baseline(path, results):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'created_at': time.time(),
+            'python': platform.python_version(),
+            'lxml': '.'.join(map(str, etree.LXML_VERSION)),
+            'machine': platform.machine(),
+            'results': results,
+        }, f, ensure_ascii=False, indent=2)
+
+
+def compare(results, baseline, threshold=0.2):
+    """
+    기준선과 비교해 처리량이 threshold 이상 떨어진 항목을 찾습니다.
+
+    Returns:
+        list: (key, 기준 pages/s, 현재 pages/s, 변화율) 중 회귀 항목
+    """
+    regressions = []
+    for row in results:
+        base = baseline.get(row['key'])
+        if not base or not base['pages_per_sec']:
+            continue
+        change = row['pages_per_sec'] / base['pages_per_sec'] - 1
+        row['baseline_pages_per_sec'] = base['pages_per_sec']
+        row['change'] = change
+        if change < -threshold:
+            regressions.append((row['key'], base['pages_per_sec'], row['pages_per_sec'], change))
+    return regressions
+
+
+def format_row(row):
+    line = (f"{row['extractor']:<7} {row['backend']:<16} {row['fixture']:<22} "
+            f"{row['items']:>6} {row['pages_per_sec']:>10.1f} {row['items_per_sec']:>12.0f} "
+            f"{row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f} {row['peak_kb']:>9.0f}")
+    if 'change' in row:
+        line += f" {row['change'] * 100:>+7.1f}%"
+    return line
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="뉴스 제목 추출기 처리량 벤치마크")
+    parser.add_argument('--sizes', type=int, nargs='*', default=list(DEFAULT_SIZES),
+                        help="합성 페이지 항목 수들 (빈 값이면 합성 페이지 제외)")
+    parser.add_argument('--cassette', nargs='+', default=[], help="기록된 페이지 카세트 파일들")
+    parser.add_argument('--fixtures', help="naver_*.html/daum_*.html/yna_*.html/google_*.xml 디렉터리")
+    parser.add_argument('--only', nargs='+', choices=sorted(EXTRACTORS), help="측정할 추출기")
+    parser.add_argument('--backends', nargs='+', help="측정할 백엔드 (예: lxml-xpath bs4-html.parser)")
+    parser.add_argument('--min-time', type=float, default=0.3, help="항목별 최소 측정 시간(초)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH, help="기준선 파일 경로")
+    parser.add_argument('--save-baseline', action='store_true', help="결과를 기준선으로 저장")
+    parser.add_argument('--compare', action='store_true', help="기준선과 비교")
+    parser.add_argument('--threshold', type=float, default=0.2, help="회귀로 볼 처리량 감소율 (기본 0.2)")
+    parser.add_argument('--fail-on-regression', action='store_true', help="회귀가 있으면 종료 코드 1")
+    parser.add_argument('--json', help="결과를 저장할 JSON 파일")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """벤치마크 실행 함수"""
+    args = parse_args(argv)
+
+    fixtures = synthetic_fixtures(args.sizes)
+    for path in args.cassette:
+        fixtures.extend(cassette_fixtures(path))
+    if args.fixtures:
+        fixtures.extend(directory_fixtures(args.fixtures))
+    if not fixtures:
+        print("측정할 픽스처가 없습니다.")
+        return 1
+
+    baseline = load_baseline(args.baseline) if args.compare and os.path.exists(args.baseline) else None
+    if args.compare and baseline is None:
+        print(f"기준선 파일이 없습니다: {args.baseline}")
+
+    print(f"{'추출기':<5} {'백엔드':<13} {'픽스처':<19} {'항목':>5} {'pages/s':>10} {'items/s':>12} "
+          f"{'p50ms':>8} {'p95ms':>8} {'p99ms':>8} {'peakKB':>9}")
+    results = []
+    for row in run_benchmarks(fixtures, args.only, args.backends, args.min_time):
+        if baseline is not None:
+            compare([row], baseline, args.threshold)
+        results.append(row)
+        print(format_row(row))
+
+    regressions = compare(results, baseline, args.threshold) if baseline is not None else []
+    if regressions:
+        print(f"\n⚠️ 처리량 회귀 {len(regressions)}건 (기준 대비 {args.threshold * 100:.0f}% 이상 감소):")
+        for key, before, after, change in regressions:
+            print(f"   - {key}: {before:.1f} → {after:.1f} pages/s ({change * 100:+.1f}%)")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+        print(f"\n기준선 저장: {args.baseline}")
+
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
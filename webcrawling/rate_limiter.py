@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+호스트별 토큰 버킷 요청 속도 제한기
+고정된 time.sleep() 대신 사이트마다 초당 요청 수와 버스트 한도를 두고,
+같은 호스트로 가는 요청만 서로 기다리도록 합니다.
+"""
+
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+# 호스트별 기본 한도: (초당 요청 수, 버스트)
+DEFAULT_HOST_LIMITS = {
+    'search.naver.com': (1.0, 2),
+    'search.daum.net': (1.0, 2),
+    'news.google.com': (2.0, 4),
+    'www.yna.co.kr': (1.0, 2),
+}
+
+
+class TokenBucket:
+    def __init__(self, rate, burst):
+        """
+        Args:
+            rate (float): 초당 채워지는 토큰 수 (초당 요청 수)
+            burst (int): 버킷에 쌓일 수 있는 최대 토큰 수
+        """
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self.updated
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def reserve(self):
+        """
+        토큰 하나를 예약하고 실제로 사용할 수 있을 때까지 기다려야 할 시간을 반환합니다.
+        토큰이 부족하면 잔량을 음수로 만들어 뒤따르는 요청이 순서대로 기다리게 합니다.
+
+        Returns:
+            float: 대기해야 할 시간(초)
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def try_acquire(self):
+        """
+        기다리지 않고 토큰을 얻을 수 있으면 사용합니다.
+
+        Returns:
+            bool: 토큰 획득 여부
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def acquire(self, cancel=None):
+        """
+        토큰을 얻을 때까지 대기합니다.
+
+        Args:
+            cancel (CancelToken): 주어지면 대기 중에도 취소를 확인 (취소되면 CrawlCancelled 발생)
+
+        Returns:
+            float: 실제로 대기한 시간(초)
+        """
+        delay = self.reserve()
+        if delay > 0:
+            if cancel is None:
+                time.sleep(delay)
+            elif cancel.wait(delay):
+                cancel.raise_if_cancelled()
+        return delay
+
+
+class HostRateLimiter:
+    def __init__(self, limits=None, default_rate=1.0, default_burst=1):
+        """
+        Args:
+            limits (dict): {호스트: (초당 요청 수, 버스트)}. 없으면 DEFAULT_HOST_LIMITS 사용
+            default_rate (float): 목록에 없는 호스트의 초당 요청 수
+            default_burst (int): 목록에 없는 호스트의 버스트
+        """
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self._limits = dict(DEFAULT_HOST_LIMITS if limits is None else limits)
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def configure(self, host, rate, burst=1):
+        """
+        특정 호스트의 한도를 설정합니다. 기존 버킷은 새 한도로 교체됩니다.
+
+        Args:
+            host (str): 호스트 이름 (예: search.daum.net)
+            rate (float): 초당 요청 수
+            burst (int): 버스트
+        """
+        with self._lock:
+            self._limits[host] = (rate, burst)
+            self._buckets.pop(host, None)
+
+    def bucket_for(self, host):
+        """
+        호스트에 해당하는 토큰 버킷을 반환합니다 (없으면 생성).
+
+        Args:
+            host (str): 호스트 이름
+
+        Returns:
+            TokenBucket: 호스트의 토큰 버킷
+        """
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                rate, burst = self._limits.get(host, (self.default_rate, self.default_burst))
+                bucket = TokenBucket(rate, burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def wait(self, url, cancel=None):
+        """
+        URL의 호스트 한도 안에서 요청할 수 있을 때까지 대기합니다.
+
+        Args:
+            url (str): 요청할 URL
+            cancel (CancelToken): 취소 토큰 (대기 중에 취소되면 CrawlCancelled 발생)
+
+        Returns:
+            float: 실제로 대기한 시간(초)
+        """
+        host = urlsplit(url).hostname or ''
+        return self.bucket_for(host).acquire(cancel)
+
+
+# 모든 크롤러 클래스가 함께 사용하는 기본 제한기
+default_limiter = HostRateLimiter()
@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+재시도와 소스별 회로 차단기
+일시적인 5xx/연결 오류는 지터를 섞은 지수 백오프로 다시 시도하고, 429/503의
+Retry-After를 지킵니다. 같은 소스에서 실패가 계속되면 회로를 열어 한동안 요청 자체를
+보내지 않으므로, 막힌 소스 때문에 매번 타임아웃을 기다리지 않습니다.
+모든 크롤러가 공유 세션을 쓰므로 세션 어댑터에 끼워 넣어 한 번에 적용합니다.
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import BaseAdapter
+
+from metrics import source_for_url
+
+
+# 다시 보내도 결과가 같은 메서드만 재시도
+IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+# 재시도할 응답 상태 코드
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Retry-After를 지켜야 하는 상태 코드
+RETRY_AFTER_STATUSES = frozenset({429, 503})
+# 회로 차단기가 소스 실패로 세는 상태 코드 (403: 차단된 소스)
+FAILURE_STATUSES = frozenset({403, 429, 500, 502, 503, 504})
+
+STATE_CLOSED = 'closed'
+STATE_OPEN = 'open'
+STATE_HALF_OPEN = 'half_open'
+
+STATE_LABELS = {
+    STATE_CLOSED: "정상",
+    STATE_OPEN: "차단",
+    STATE_HALF_OPEN: "확인 중",
+}
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """회로가 열린 소스로 요청하려 할 때 발생하는 예외 (네트워크 오류처럼 처리됨)"""
+
+
+# 현재 스레드의 요청에 적용할 취소 토큰 (requests의 send()로는 전달할 수 없으므로)
+_cancel_scope = threading.local()
+
+
+@contextmanager
+def cancel_scope(cancel):
+    """
+    이 블록 안에서 보내는 요청의 재시도 대기를 취소 토큰으로 중단할 수 있게 합니다.
+
+    Args:
+        cancel (CancelToken): 취소 토큰 (None이면 아무것도 하지 않음)
+    """
+    previous = getattr(_cancel_scope, 'token', None)
+    _cancel_scope.token = cancel
+    try:
+        yield
+    finally:
+        _cancel_scope.token = previous
+
+
+def _sleep(delay):
+    """재시도 대기. 현재 스레드에 취소 토큰이 있으면 취소되는 즉시 CrawlCancelled 발생"""
+    cancel = getattr(_cancel_scope, 'token', None)
+    if cancel is None:
+        time.sleep(delay)
+    elif cancel.wait(delay):
+        cancel.raise_if_cancelled()
+
+
+def parse_retry_after(value, now=None):
+    """
+    Retry-After 헤더 값을 대기 시간(초)으로 바꿉니다.
+
+    Args:
+        value (str): 초 단위 숫자 또는 HTTP 날짜
+        now (float): 기준 시각 (없으면 현재 시각)
+
+    Returns:
+        float: 대기 시간(초). 해석할 수 없으면 None
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    now = time.time() if now is None else now
+    return max(0.0, retry_at - now)
+
+
+class RetryPolicy:
+    def __init__(self, max_retries=2, backoff_base=0.5, backoff_max=8.0, max_retry_after=10.0):
+        """
+        Args:
+            max_retries (int): 첫 요청 뒤 최대 재시도 횟수
+            backoff_base (float): 첫 재시도 대기 상한(초). 재시도마다 두 배
+            backoff_max (float): 백오프 대기 상한(초)
+            max_retry_after (float): 이보다 긴 Retry-After는 기다리지 않고 포기
+                                     (대신 그 시간 동안 회로를 열어 둠)
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+
+    def backoff(self, attempt):
+        """
+        attempt번째 재시도 전 대기 시간 (0부터 상한 사이에서 무작위, full jitter)
+        여러 작업이 같은 순간에 실패해도 재시도가 한꺼번에 몰리지 않습니다.
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold=3, reset_timeout=60.0):
+        """
+        Args:
+            failure_threshold (int): 회로를 열 연속 실패 횟수
+            reset_timeout (float): 회로를 연 뒤 시험 요청을 허용할 때까지의 시간(초)
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_until = 0.0
+        self.last_error = None
+        self._lock = threading.Lock()
+
+    def allow(self, now=None):
+        """
+        지금 요청을 보내도 되는지 확인합니다.
+        열린 회로는 reset_timeout이 지나면 반열림 상태가 되어 시험 요청 하나만 허용합니다.
+        시험 요청의 결과가 reset_timeout 안에 기록되지 않으면(중간에 취소된 경우 등)
+        다음 시험 요청을 허용합니다.
+
+        Returns:
+            bool: 요청 허용 여부
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return True
+            if now >= self.opened_until:
+                self.state = STATE_HALF_OPEN
+                # 시험 요청의 결과를 기다릴 기한
+                self.opened_until = now + self.reset_timeout
+                return True
+            # 열린 회로이거나 반열림 상태에서 시험 요청이 진행 중이면 나머지는 막음
+            return False
+
+    def blocked(self, now=None):
+        """
+        상태를 바꾸지 않고 지금 요청이 거절될지 확인합니다 (요청 전 대기를 건너뛰는 용도).
+
+        Returns:
+            bool: 거절될 요청이면 True
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            return self.state != STATE_CLOSED and now < self.opened_until
+
+    def record_success(self):
+        with self._lock:
+            self.state = STATE_CLOSED
+            self.failures = 0
+            self.last_error = None
+
+    def record_failure(self, error, hold=None, now=None):
+        """
+        실패를 기록하고 필요하면 회로를 엽니다.
+
+        Args:
+            error (str): 실패 사유
+            hold (float): 최소한 이 시간(초) 동안 회로를 열어 둠 (긴 Retry-After 등)
+            now (float): 기준 시각 (time.monotonic)
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            self.failures += 1
+            self.last_error = error
+            if (self.state == STATE_HALF_OPEN or hold is not None or
+                    self.failures >= self.failure_threshold):
+                self.state = STATE_OPEN
+                self.opened_until = now + max(self.reset_timeout, hold or 0.0)
+
+    def remaining(self, now=None):
+        """회로가 열려 있으면 시험 요청까지 남은 시간(초), 아니면 0"""
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            if self.state != STATE_OPEN:
+                return 0.0
+            return max(0.0, self.opened_until - now)
+
+
+class CircuitBreakerBoard:
+    """소스 이름별 회로 차단기 모음"""
+
+    def __init__(self, failure_threshold=3, reset_timeout=60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def breaker_for(self, source):
+        with self._lock:
+            breaker = self._breakers.get(source)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                self._breakers[source] = breaker
+            return breaker
+
+    def reset(self, source=None):
+        """소스 하나(또는 전체)의 회로를 닫습니다."""
+        with self._lock:
+            if source is None:
+                breakers = list(self._breakers.values())
+            else:
+                breakers = [self._breakers[source]] if source in self._breakers else []
+        for breaker in breakers:
+            breaker.record_success()
+
+    def snapshot(self):
+        """
+        소스별 회로 상태를 반환합니다.
+
+        Returns:
+            dict: {소스: {'state', 'failures', 'remaining', 'last_error'}}
+        """
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {
+            source: {
+                'state': breaker.state,
+                'failures': breaker.failures,
+                'remaining': breaker.remaining(),
+                'last_error': breaker.last_error,
+            }
+            for source, breaker in sorted(breakers.items())
+        }
+
+    def format_status(self):
+        """
+        상태 표시줄용 한 줄 요약을 만듭니다.
+
+        Returns:
+            str: 예) "네이버 뉴스: 차단 (42초 후 재시도) | 다음 뉴스: 정상"
+        """
+        parts = []
+        for source, info in self.snapshot().items():
+            text = f"{source}: {STATE_LABELS[info['state']]}"
+            if info['state'] == STATE_OPEN:
+                text += f" ({info['remaining']:.0f}초 후 재시도)"
+            elif info['failures']:
+                text += f" (연속 실패 {info['failures']})"
+            parts.append(text)
+        return ' | '.join(parts)
+
+
+class ResilientAdapter(BaseAdapter):
+    """재시도/회로 차단을 적용해 실제 어댑터로 요청을 보내는 어댑터"""
+
+    def __init__(self, inner, policy=None, breakers=None):
+        """
+        Args:
+            inner (HTTPAdapter): 실제 요청을 보낼 어댑터
+            policy (RetryPolicy): 재시도 정책 (없으면 기본값)
+            breakers (CircuitBreakerBoard): 소스별 회로 차단기 (없으면 기본 차단기)
+        """
+        super().__init__()
+        self.inner = inner
+        self.policy = policy or RetryPolicy()
+        self.breakers = breakers or get_default_breakers()
+
+    def send(self, request, **kwargs):
+        source = source_for_url(request.url)
+        breaker = self.breakers.breaker_for(source)
+        if not breaker.allow():
+            raise CircuitOpenError(
+                f"{source} 회로 차단 중 ({breaker.remaining():.0f}초 후 재시도): {breaker.last_error}",
+                request=request,
+            )
+
+        retries = self.policy.max_retries if request.method in IDEMPOTENT_METHODS else 0
+        attempt = 0
+        while True:
+            try:
+                response = self.inner.send(request, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if attempt >= retries:
+                    breaker.record_failure(type(e).__name__)
+                    raise
+                _sleep(self.policy.backoff(attempt))
+                attempt += 1
+                continue
+            except Exception as e:
+                # 재시도하지 않는 오류도 실패로 기록 (반열림 회로가 결과 없이 남지 않도록)
+                breaker.record_failure(type(e).__name__)
+                raise
+
+            status = response.status_code
+            if status not in RETRY_STATUSES:
+                if status in FAILURE_STATUSES:
+                    breaker.record_failure(f"HTTP {status}")
+                else:
+                    breaker.record_success()
+                return response
+
+            delay = self.policy.backoff(attempt)
+            hold = None
+            if status in RETRY_AFTER_STATUSES:
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                if retry_after is not None:
+                    if retry_after > self.policy.max_retry_after:
+                        # 너무 오래 기다려야 하면 포기하고 그동안 회로를 열어 둠
+                        hold = retry_after
+                    delay = max(delay, retry_after)
+
+            if attempt >= retries or hold is not None:
+                breaker.record_failure(f"HTTP {status}", hold)
+                return response
+
+            # 오류 본문을 끝까지 읽어야 연결을 끊지 않고 풀에 돌려줄 수 있음
+            try:
+                response.content
+            except requests.exceptions.RequestException:
+                pass
+            response.close()
+            _sleep(delay)
+            attempt += 1
+
+    def check(self, url):
+        """
+        URL의 소스 회로가 요청을 거절할 상태이면 바로 CircuitOpenError를 발생시킵니다.
+        속도 제한 대기 전에 호출하면 어차피 거절될 요청이 토큰을 쓰지 않습니다.
+
+        Args:
+            url (str): 요청할 URL
+        """
+        source = source_for_url(url)
+        breaker = self.breakers.breaker_for(source)
+        if breaker.blocked():
+            raise CircuitOpenError(
+                f"{source} 회로 차단 중 ({breaker.remaining():.0f}초 후 재시도): {breaker.last_error}"
+            )
+
+    def close(self):
+        self.inner.close()
+
+
+def raise_if_circuit_open(session, url):
+    """
+    세션이 URL로 보낼 요청을 회로 차단기가 거절할 상태이면 CircuitOpenError를 발생시킵니다.
+    세션 어댑터(기록 카세트 등으로 감싼 경우 포함)에서 ResilientAdapter를 찾아 확인합니다.
+
+    Args:
+        session (requests.Session): 요청을 보낼 세션
+        url (str): 요청할 URL
+    """
+    try:
+        adapter = session.get_adapter(url)
+    except requests.exceptions.InvalidSchema:
+        return
+    while adapter is not None and not isinstance(adapter, ResilientAdapter):
+        adapter = getattr(adapter, 'inner', None)
+    if adapter is not None:
+        adapter.check(url)
+
+
+_default_breakers = None
+_default_breakers_lock = threading.Lock()
+
+
+def get_default_breakers():
+    """모든 크롤러가 공유하는 기본 회로 차단기 모음을 반환합니다."""
+    global _default_breakers
+    with _default_breakers_lock:
+        if _default_breakers is None:
+            _default_breakers = CircuitBreakerBoard()
+        return _default_breakers
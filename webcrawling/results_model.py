@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GUI 결과 테이블용 모델
+QTableWidget처럼 행마다 QTableWidgetItem을 만들어 두는 대신,
+제목 리스트와 클러스터/수집시간 번호 배열만 들고 있다가 화면에 보이는 셀을 그릴 때만
+값을 만들어 줍니다. 결과 추가는 새 행 수에 비례하는 비용만 듭니다.
+"""
+
+from array import array
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class ResultStore:
+    """번호/클러스터/제목/수집시간 결과를 압축해서 담는 저장소"""
+
+    def __init__(self):
+        self.titles = []
+        # 유사 제목 클러스터 번호 (0이면 묶지 않음)
+        self._cluster_ids = array('I')
+        # 행마다 수집시간 문자열 대신 time_labels의 번호만 저장
+        self._time_ids = array('I')
+        self.time_labels = []
+
+    def __len__(self):
+        return len(self.titles)
+
+    def append(self, titles, collected_at, cluster_ids=None):
+        """
+        같은 시각에 수집한 제목들을 뒤에 추가합니다.
+
+        Args:
+            titles (iterable): 뉴스 제목들
+            collected_at (str): 수집시간 표기
+            cluster_ids (iterable): 제목마다의 유사 제목 클러스터 번호 (없으면 묶지 않음)
+
+        Returns:
+            int: 추가된 행 수
+        """
+        if not self.time_labels or self.time_labels[-1] != collected_at:
+            self.time_labels.append(collected_at)
+        time_id = len(self.time_labels) - 1
+        before = len(self.titles)
+        self.titles.extend(titles)
+        added = len(self.titles) - before
+        self._time_ids.extend([time_id] * added)
+        if cluster_ids is None:
+            self._cluster_ids.extend([0] * added)
+        else:
+            self._cluster_ids.extend(cluster_ids)
+        return added
+
+    def collected_at(self, row):
+        return self.time_labels[self._time_ids[row]]
+
+    def cluster_label(self, row):
+        cluster_id = self._cluster_ids[row]
+        return str(cluster_id) if cluster_id else ""
+
+    def rows(self):
+        """
+        (번호, 클러스터, 제목, 수집시간) 행을 순서대로 반환합니다.
+
+        Yields:
+            tuple: (번호, 클러스터, 제목, 수집시간). 묶지 않은 행의 클러스터는 빈 문자열
+        """
+        labels = self.time_labels
+        for idx, (title, cluster_id, time_id) in enumerate(
+                zip(self.titles, self._cluster_ids, self._time_ids), 1):
+            yield idx, cluster_id or "", title, labels[time_id]
+
+    def clear(self):
+        self.titles = []
+        self._cluster_ids = array('I')
+        self._time_ids = array('I')
+        self.time_labels = []
+
+
+class NewsTableModel(QAbstractTableModel):
+    """ResultStore를 보여 주는 가상화 테이블 모델 (보이는 행만 값 생성)"""
+
+    HEADERS = ("번호", "클러스터", "뉴스 제목", "수집 시간")
+    # 제목 컬럼 번호
+    TITLE_COLUMN = 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = ResultStore()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.store)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return str(row + 1)
+            if column == 1:
+                return self.store.cluster_label(row)
+            if column == self.TITLE_COLUMN:
+                return self.store.titles[row]
+            return self.store.collected_at(row)
+        if role == Qt.TextAlignmentRole and column != self.TITLE_COLUMN:
+            return Qt.AlignCenter
+        if role == Qt.ToolTipRole and column == self.TITLE_COLUMN:
+            return self.store.titles[row]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def append_titles(self, titles, collected_at, cluster_ids=None):
+        """
+        결과를 뒤에 추가합니다 (새 행만 뷰에 알림).
+
+        Args:
+            titles (list): 뉴스 제목 리스트
+            collected_at (str): 수집시간 표기
+            cluster_ids (list): 제목마다의 유사 제목 클러스터 번호 (없으면 묶지 않음)
+
+        Returns:
+            int: 추가된 행 수
+        """
+        titles = list(titles)
+        if not titles:
+            return 0
+        first = len(self.store)
+        self.beginInsertRows(QModelIndex(), first, first + len(titles) - 1)
+        added = self.store.append(titles, collected_at, cluster_ids)
+        self.endInsertRows()
+        return added
+
+    def clear(self):
+        """모든 결과를 지웁니다."""
+        self.beginResetModel()
+        self.store.clear()
+        self.endResetModel()
+
+    def titles(self):
+        """저장된 제목 리스트를 반환합니다."""
+        return self.store.titles
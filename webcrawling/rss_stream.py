@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+스트리밍 RSS 파서
+피드 전체를 받아 XML 트리를 만든 뒤 자르는 대신, 응답 바이트 스트림을 조금씩
+파서에 넣으면서 <item>이 끝날 때마다 바로 반환하고 처리한 요소는 지웁니다.
+필요한 개수를 채우면 더 이상 네트워크에서 읽지 않습니다.
+"""
+
+from lxml import etree
+
+
+def _child_text(element, tag):
+    child = element.find(tag)
+    if child is None or child.text is None:
+        return ''
+    return child.text.strip()
+
+
+def clean_google_title(title):
+    """
+    구글 뉴스 제목 끝의 "- 출처명"을 제거합니다.
+
+    Args:
+        title (str): RSS 제목
+
+    Returns:
+        str: 정리된 제목
+    """
+    if ' - ' in title:
+        title = title.split(' - ')[0]
+    return title.strip()
+
+
+def iter_rss_items(chunks, limit=None):
+    """
+    RSS 바이트 조각들을 순서대로 파싱해 <item>을 하나씩 반환합니다.
+
+    Args:
+        chunks (iterable): bytes 조각들 (예: response.iter_content())
+        limit (int): 최대 항목 수 (None이면 끝까지)
+
+    Yields:
+        dict: {'title', 'link', 'source', 'pub_date'}
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    parser = etree.XMLPullParser(events=('end',), tag='item', recover=True)
+    count = 0
+
+    def drain():
+        nonlocal count
+        for _, element in parser.read_events():
+            item = {
+                'title': _child_text(element, 'title'),
+                'link': _child_text(element, 'link'),
+                'source': _child_text(element, 'source'),
+                'pub_date': _child_text(element, 'pubDate'),
+            }
+            # 처리한 항목과 앞선 형제 노드를 지워 메모리를 일정하게 유지
+            element.clear()
+            parent = element.getparent()
+            if parent is not None:
+                while element.getprevious() is not None:
+                    del parent[0]
+            count += 1
+            yield item
+            if limit is not None and count >= limit:
+                return
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        parser.feed(chunk)
+        yield from drain()
+        if limit is not None and count >= limit:
+            return
+
+    parser.close()
+    yield from drain()
+
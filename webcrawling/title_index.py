@@ -0,0 +1,564 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+수집한 뉴스 제목 검색용 문자 바이그램 역색인
+형태소 분석기 없이도 한글 부분 문자열 검색이 되도록 제목을 두 글자씩 잘라 색인하고,
+기사 저장소(articles 테이블)와 같은 SQLite 파일에 저장합니다.
+
+- 바이그램마다 기사 ID 목록(포스팅)을 오름차순 차이값으로 바꿔 zlib으로 압축해 저장합니다.
+- 새 기사는 마지막으로 색인한 ID 이후만 읽어 작은 조각(세그먼트)으로 덧붙이고,
+  조각이 쌓인 바이그램만 골라 합치므로 크롤링이 끝날 때마다 전체를 다시 만들 필요가 없습니다.
+- 검색은 가장 드문 바이그램의 포스팅을 최근 ID부터 구간 단위로 잘라 나머지 포스팅과
+  교집합하고, 남은 후보만 저장소에서 읽어 실제로 검색어가 들어 있는지 확인합니다
+  (최근 저장순, limit개를 채우면 중단).
+
+검색어 문법:
+    반도체 HBM            두 단어가 모두 들어간 제목 (AND)
+    반도체 OR HBM         둘 중 하나라도 들어간 제목 (| 도 가능)
+    "반도체 관련주"       붙어 있는 구절 (띄어쓰기/문장부호 차이는 무시)
+
+사용 예:
+    python title_index.py "반도체 관련주" OR HBM --hours 24 -s daum yna
+    python title_index.py --import-csv news_result.csv --keyword "반도체 관련주"
+    python title_index.py --rebuild --stats
+"""
+
+import argparse
+import csv
+import heapq
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime
+from itertools import accumulate, islice
+
+from article_store import get_default_store
+from batch_crawl import SOURCE_ALIASES
+from dedup import normalize_title
+
+
+_NON_WORD_RE = re.compile(r'[\W_]+')
+_QUERY_TOKEN_RE = re.compile(r'"([^"]*)"|(\S+)')
+_OR_TOKENS = frozenset({'OR', '|'})
+
+# 한 바이그램의 조각이 이보다 많아지면 하나로 합침
+MAX_SEGMENTS = 8
+# 색인할 때 한 번에 읽을 기사 수
+UPDATE_BATCH = 20000
+# 후보를 확인할 때 한 번에 읽을 기사 수 (SQLite 변수 개수 제한 이하)
+VERIFY_BATCH = 500
+# 교집합을 계산할 ID 구간 크기 (처음 크기, 최대 크기)
+INTERSECT_WINDOW = 1024
+MAX_INTERSECT_WINDOW = 65536
+# 메모리에 풀어 둘 포스팅 ID 총 개수 (4바이트씩, 약 16MB)
+CACHE_POSTINGS = 4_000_000
+
+
+def index_text(title):
+    """
+    색인/비교용 제목 텍스트 (소문자, 공백/문장부호 제거).
+
+    Args:
+        title (str): 뉴스 제목 또는 검색어
+
+    Returns:
+        str: 정규화한 텍스트
+    """
+    return _NON_WORD_RE.sub('', normalize_title(title).lower())
+
+
+def bigrams(text):
+    """정규화한 텍스트의 문자 바이그램 집합"""
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def encode_postings(ids):
+    """
+    오름차순 ID 목록을 차이값 배열로 바꿔 압축합니다.
+
+    Args:
+        ids (sequence): 오름차순 기사 ID들
+
+    Returns:
+        bytes: 압축된 포스팅
+    """
+    deltas = array('I', ids[:1])
+    deltas.extend(b - a for a, b in zip(ids, ids[1:]))
+    return zlib.compress(deltas.tobytes())
+
+
+def decode_postings(data):
+    """encode_postings로 압축한 포스팅을 ID 배열로 되돌립니다."""
+    deltas = array('I')
+    deltas.frombytes(zlib.decompress(data))
+    return array('I', accumulate(deltas))
+
+
+def _unique(ids):
+    """정렬된 ID 흐름에서 연속된 중복을 건너뜁니다."""
+    previous = None
+    for article_id in ids:
+        if article_id != previous:
+            previous = article_id
+            yield article_id
+
+
+def parse_query(query):
+    """
+    검색어를 OR로 묶인 절 목록으로 바꿉니다. 절 안의 검색어는 모두 들어 있어야 합니다.
+
+    Args:
+        query (str): 검색어 (예: '"반도체 관련주" OR HBM 수출')
+
+    Returns:
+        list: [[정규화한 검색어, ...], ...] (빈 검색어는 빈 리스트)
+    """
+    clauses = [[]]
+    for match in _QUERY_TOKEN_RE.finditer(query):
+        phrase, word = match.groups()
+        if phrase is None and word in _OR_TOKENS:
+            clauses.append([])
+            continue
+        term = index_text(phrase if phrase is not None else word)
+        if term and term not in clauses[-1]:
+            clauses[-1].append(term)
+    return [clause for clause in clauses if clause]
+
+
+class TitleIndex:
+    def __init__(self, store=None):
+        """
+        Args:
+            store (ArticleStore): 색인할 기사 저장소 (없으면 기본 저장소). 색인도 같은 파일에 저장
+        """
+        self.store = store or get_default_store()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.store.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS title_postings (
+                gram TEXT NOT NULL,
+                first_id INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (gram, first_id)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS title_index_state (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+        """)
+        self._conn.commit()
+        # 바이그램 → 풀어 둔 ID 배열 (최근 사용 순)
+        self._cache = OrderedDict()
+        self._cached_postings = 0
+
+    def _last_id(self):
+        row = self._conn.execute("SELECT value FROM title_index_state WHERE key = 'last_id'").fetchone()
+        return row[0] if row else 0
+
+    def update(self):
+        """
+        마지막으로 색인한 뒤 저장소에 추가된 기사를 색인합니다.
+
+        Returns:
+            int: 새로 색인한 기사 수
+        """
+        indexed = 0
+        with self._lock:
+            last_id = self._last_id()
+            while True:
+                rows = self._conn.execute(
+                    "SELECT id, title FROM articles WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, UPDATE_BATCH)
+                ).fetchall()
+                if not rows:
+                    break
+                postings = {}
+                for article_id, title in rows:
+                    for gram in bigrams(index_text(title)):
+                        postings.setdefault(gram, []).append(article_id)
+                last_id = rows[-1][0]
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT INTO title_postings (gram, first_id, count, data) VALUES (?, ?, ?, ?)",
+                        ((gram, ids[0], len(ids), encode_postings(ids)) for gram, ids in postings.items())
+                    )
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO title_index_state (key, value) VALUES ('last_id', ?)",
+                        (last_id,)
+                    )
+                    self._merge_segments(postings)
+                for gram in postings:
+                    self._evict(gram)
+                indexed += len(rows)
+        return indexed
+
+    def _merge_segments(self, grams):
+        """조각이 MAX_SEGMENTS개를 넘은 바이그램의 조각을 하나로 합칩니다 (트랜잭션 안에서 호출)."""
+        grams = list(grams)
+        crowded = []
+        for start in range(0, len(grams), VERIFY_BATCH):
+            batch = grams[start:start + VERIFY_BATCH]
+            crowded.extend(row[0] for row in self._conn.execute(
+                f"SELECT gram FROM title_postings WHERE gram IN ({','.join('?' * len(batch))}) "
+                f"GROUP BY gram HAVING COUNT(*) > ?", (*batch, MAX_SEGMENTS)
+            ))
+        for gram in crowded:
+            ids = self._read_postings(gram)
+            self._conn.execute("DELETE FROM title_postings WHERE gram = ?", (gram,))
+            self._conn.execute(
+                "INSERT INTO title_postings (gram, first_id, count, data) VALUES (?, ?, ?, ?)",
+                (gram, ids[0], len(ids), encode_postings(ids))
+            )
+
+    def _read_postings(self, gram):
+        ids = array('I')
+        # 조각은 ID 구간이 겹치지 않으므로 first_id 순으로 이어 붙이면 정렬된 목록
+        for row in self._conn.execute(
+                "SELECT data FROM title_postings WHERE gram = ? ORDER BY first_id", (gram,)):
+            ids.extend(decode_postings(row[0]))
+        return ids
+
+    def _evict(self, gram):
+        ids = self._cache.pop(gram, None)
+        if ids is not None:
+            self._cached_postings -= len(ids)
+
+    def _postings(self, gram):
+        """바이그램의 ID 배열 (최근 사용한 것은 메모리에서 반환)"""
+        ids = self._cache.get(gram)
+        if ids is not None:
+            self._cache.move_to_end(gram)
+            return ids
+        ids = self._read_postings(gram)
+        self._cache[gram] = ids
+        self._cached_postings += len(ids)
+        while self._cached_postings > CACHE_POSTINGS and len(self._cache) > 1:
+            _, old = self._cache.popitem(last=False)
+            self._cached_postings -= len(old)
+        return ids
+
+    def _counts(self, grams):
+        placeholders = ','.join('?' * len(grams))
+        rows = self._conn.execute(
+            f"SELECT gram, SUM(count) FROM title_postings WHERE gram IN ({placeholders}) GROUP BY gram",
+            list(grams)
+        )
+        counts = dict.fromkeys(grams, 0)
+        counts.update(rows)
+        return counts
+
+    @staticmethod
+    def _descending(ids, low, high):
+        """ID 배열에서 low 이상 high 이하인 ID를 큰 것부터 반환"""
+        for i in range(bisect_right(ids, high) - 1, bisect_left(ids, low) - 1, -1):
+            yield ids[i]
+
+    @staticmethod
+    def _intersect_descending(lead, others, low, high):
+        """
+        가장 짧은 포스팅(lead)을 큰 ID부터 구간 단위로 잘라 나머지 포스팅과 교집합합니다.
+        구간을 점점 키우며 필요한 만큼만 계산하므로 흔한 바이그램끼리의 교집합도
+        결과 limit개를 채우면 멈춥니다.
+        """
+        begin, end = bisect_left(lead, low), bisect_right(lead, high)
+        window = INTERSECT_WINDOW
+        while end > begin:
+            start = max(begin, end - window)
+            candidates = set(lead[start:end])
+            first, last = lead[start], lead[end - 1]
+            for ids in others:
+                candidates.intersection_update(ids[bisect_left(ids, first):bisect_right(ids, last)])
+                if not candidates:
+                    break
+            yield from sorted(candidates, reverse=True)
+            end = start
+            window = min(window * 2, MAX_INTERSECT_WINDOW)
+
+    def _clause_candidates(self, clause, low, high):
+        """절의 검색어를 모두 가졌을 수 있는 기사 ID를 큰 것부터 반환합니다."""
+        grams = set()
+        for term in clause:
+            grams |= bigrams(term)
+        if not grams:
+            # 한 글자 검색어만 있는 절: 그 글자가 들어간 바이그램들의 합집합
+            grams = [row[0] for row in self._conn.execute(
+                "SELECT DISTINCT gram FROM title_postings WHERE instr(gram, ?) > 0", (clause[0],)
+            )]
+            merged = heapq.merge(*(self._descending(self._postings(gram), low, high) for gram in grams),
+                                 reverse=True)
+            return _unique(merged)
+
+        counts = self._counts(grams)
+        ordered = sorted(grams, key=counts.get)
+        if not counts[ordered[0]]:
+            return iter(())
+        return self._intersect_descending(self._postings(ordered[0]),
+                                          [self._postings(gram) for gram in ordered[1:]], low, high)
+
+    def _id_range(self, since, until):
+        """
+        수집 시각 조건을 만족하는 기사의 ID 범위 (색인한 기사 안에서).
+        범위를 구하는 비용이 기간 안의 기사 수에 비례하므로, 전체 기간의 절반 이상을 덮는
+        조건이면 범위를 좁히지 않고 확인 단계의 SQL 조건에 맡깁니다.
+        """
+        low, high = 1, self._last_id()
+        if since is None and until is None:
+            return low, high
+        # MIN과 MAX를 따로 조회해야 둘 다 수집 시각 인덱스의 끝만 읽음
+        first = self._conn.execute("SELECT MIN(collected_at) FROM articles").fetchone()[0]
+        last = self._conn.execute("SELECT MAX(collected_at) FROM articles").fetchone()[0]
+        if first is None:
+            return low, 0
+        span = max(last - first, 1.0)
+        if since is not None and (last - since) / span < 0.5:
+            row = self._conn.execute(
+                "SELECT MIN(id) FROM articles INDEXED BY idx_articles_collected WHERE collected_at >= ?",
+                (since,)
+            ).fetchone()
+            low = row[0] if row[0] is not None else high + 1
+        if until is not None and (until - first) / span < 0.5:
+            row = self._conn.execute(
+                "SELECT MAX(id) FROM articles INDEXED BY idx_articles_collected WHERE collected_at < ?",
+                (until,)
+            ).fetchone()
+            high = min(high, row[0]) if row[0] is not None else 0
+        return low, high
+
+    def search(self, query, since=None, until=None, sources=None, limit=50):
+        """
+        제목을 검색합니다. 검색 전에 새로 저장된 기사를 먼저 색인합니다.
+
+        Args:
+            query (str): 검색어 (AND: 공백, OR: OR 또는 |, 구절: "...")
+            since (float): 이 시각(epoch 초) 이후에 수집된 기사만
+            until (float): 이 시각(epoch 초) 이전에 수집된 기사만
+            sources (iterable): 이 출처들의 기사만 (None이면 전체)
+            limit (int): 최대 개수 (None이면 전체)
+
+        Returns:
+            list: {'id', 'title', 'source', 'keyword', 'link', 'collected_at'} 리스트
+                  (최근 저장순, 같은 제목은 한 번만)
+        """
+        self.update()
+        clauses = parse_query(query)
+        if not clauses:
+            return []
+
+        filters, params = [], []
+        if since is not None:
+            filters.append(" AND collected_at >= ?")
+            params.append(since)
+        if until is not None:
+            filters.append(" AND collected_at < ?")
+            params.append(until)
+        if sources:
+            sources = list(sources)
+            filters.append(f" AND source IN ({','.join('?' * len(sources))})")
+            params.extend(sources)
+
+        results = []
+        seen = set()
+        with self._lock:
+            low, high = self._id_range(since, until)
+            if low > high:
+                return results
+            candidates = [self._clause_candidates(clause, low, high) for clause in clauses]
+            candidates = candidates[0] if len(candidates) == 1 else _unique(
+                heapq.merge(*candidates, reverse=True))
+            while True:
+                batch = list(islice(candidates, VERIFY_BATCH))
+                if not batch:
+                    break
+                rows = self._conn.execute(
+                    "SELECT id, title, source, keyword, link, collected_at FROM articles "
+                    f"WHERE id IN ({','.join('?' * len(batch))}){''.join(filters)} ORDER BY id DESC",
+                    (*batch, *params)
+                )
+                for row in rows:
+                    # 바이그램이 모두 있어도 붙어 있지 않을 수 있으므로 실제 제목으로 확인
+                    text = index_text(row['title'])
+                    if text in seen or not any(all(term in text for term in clause) for clause in clauses):
+                        continue
+                    seen.add(text)
+                    results.append(dict(row))
+                    if limit is not None and len(results) >= limit:
+                        return results
+        return results
+
+    def rebuild(self):
+        """
+        색인을 지우고 저장소 전체를 다시 색인합니다.
+
+        Returns:
+            int: 색인한 기사 수
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM title_postings")
+                self._conn.execute("DELETE FROM title_index_state")
+            self._cache.clear()
+            self._cached_postings = 0
+        return self.update()
+
+    def optimize(self):
+        """모든 바이그램의 조각을 하나로 합치고 파일 크기를 줄입니다."""
+        with self._lock:
+            grams = [row[0] for row in self._conn.execute(
+                "SELECT gram FROM title_postings GROUP BY gram HAVING COUNT(*) > 1"
+            )]
+            with self._conn:
+                for gram in grams:
+                    ids = self._read_postings(gram)
+                    self._conn.execute("DELETE FROM title_postings WHERE gram = ?", (gram,))
+                    self._conn.execute(
+                        "INSERT INTO title_postings (gram, first_id, count, data) VALUES (?, ?, ?, ?)",
+                        (gram, ids[0], len(ids), encode_postings(ids))
+                    )
+            self._conn.execute("VACUUM")
+
+    def stats(self):
+        """
+        색인 통계를 반환합니다.
+
+        Returns:
+            dict: articles(색인한 기사 수), grams, segments, postings, bytes(압축된 포스팅 크기)
+        """
+        with self._lock:
+            last_id = self._last_id()
+            articles = self._conn.execute(
+                "SELECT COUNT(*) FROM articles WHERE id <= ?", (last_id,)
+            ).fetchone()[0]
+            row = self._conn.execute(
+                "SELECT COUNT(DISTINCT gram), COUNT(*), COALESCE(SUM(count), 0), "
+                "COALESCE(SUM(LENGTH(data)), 0) FROM title_postings"
+            ).fetchone()
+        return {'articles': articles, 'grams': row[0], 'segments': row[1],
+                'postings': row[2], 'bytes': row[3]}
+
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def get_default_index():
+    """기본 저장소를 색인하는 공유 제목 색인을 반환합니다."""
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = TitleIndex()
+        return _default_index
+
+
+def import_csv(store, path, source="CSV", keyword=None):
+    """
+    이전에 저장한 결과 CSV(번호, [키워드, 출처, 클러스터,] 뉴스 제목[, 수집시간])를 기사 저장소로 가져옵니다.
+
+    Args:
+        store (ArticleStore): 기사 저장소
+        path (str): CSV 파일 경로
+        source (str): '출처' 열이 없을 때 쓸 출처
+        keyword (str): '키워드' 열이 없을 때 쓸 키워드 (없으면 파일 이름)
+
+    Returns:
+        int: 새로 저장된 기사 수
+    """
+    keyword = keyword or os.path.splitext(os.path.basename(path))[0]
+    records = []
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            title = (row.get('뉴스 제목') or '').strip()
+            if not title:
+                continue
+            collected_at = None
+            if row.get('수집시간'):
+                try:
+                    collected_at = datetime.strptime(row['수집시간'], '%Y-%m-%d %H:%M:%S').timestamp()
+                except ValueError:
+                    pass
+            records.append({'title': title, 'source': row.get('출처') or source,
+                            'keyword': row.get('키워드') or keyword, 'collected_at': collected_at})
+    return len(store.upsert(records))
+
+
+def _parse_time(value):
+    return datetime.strptime(value, '%Y-%m-%d').timestamp() if value else None
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="수집한 뉴스 제목 검색 (문자 바이그램 색인)")
+    parser.add_argument('query', nargs='*', help='검색어 (AND: 공백, OR: OR, 구절: "...")')
+    parser.add_argument('-s', '--sources', nargs='+', default=None,
+                        help=f"출처들 ({', '.join(SOURCE_ALIASES)} 또는 출처 이름)")
+    parser.add_argument('--hours', type=float, help="최근 몇 시간 이내에 수집된 기사만")
+    parser.add_argument('--since', help="이 날짜(YYYY-MM-DD) 이후에 수집된 기사만")
+    parser.add_argument('--until', help="이 날짜(YYYY-MM-DD) 이전에 수집된 기사만")
+    parser.add_argument('-n', '--limit', type=int, default=50, help="최대 결과 수 (기본값: 50)")
+    parser.add_argument('--import-csv', nargs='+', default=[], metavar='CSV',
+                        help="이전 결과 CSV 파일을 저장소로 가져온 뒤 색인")
+    parser.add_argument('--keyword', help="--import-csv에서 '키워드' 열이 없을 때 쓸 키워드")
+    parser.add_argument('--rebuild', action='store_true', help="색인을 처음부터 다시 만듦")
+    parser.add_argument('--optimize', action='store_true', help="색인 조각을 합치고 파일 크기를 줄임")
+    parser.add_argument('--stats', action='store_true', help="색인 통계 출력")
+    args = parser.parse_args(argv)
+
+    if args.sources:
+        args.sources = [SOURCE_ALIASES.get(name.lower(), name) for name in args.sources]
+    try:
+        args.since = _parse_time(args.since)
+        args.until = _parse_time(args.until)
+    except ValueError as e:
+        parser.error(f"날짜 형식 오류 (YYYY-MM-DD): {e}")
+    if args.hours is not None:
+        args.since = max(args.since or 0.0, time.time() - args.hours * 3600)
+    if not (args.query or args.import_csv or args.rebuild or args.optimize or args.stats):
+        parser.error("검색어를 지정하세요.")
+    return args
+
+
+def main(argv=None):
+    """제목 검색 실행 함수"""
+    args = parse_args(argv)
+    index = get_default_index()
+
+    for path in args.import_csv:
+        print(f"📥 {path}: 새 기사 {import_csv(index.store, path, keyword=args.keyword)}개")
+    if args.rebuild:
+        started = time.perf_counter()
+        count = index.rebuild()
+        print(f"색인 재생성: 기사 {count}개 ({time.perf_counter() - started:.1f}초)")
+    if args.optimize:
+        index.optimize()
+    if args.stats:
+        index.update()
+        stats = index.stats()
+        print(f"색인: 기사 {stats['articles']}개, 바이그램 {stats['grams']}개, 조각 {stats['segments']}개, "
+              f"포스팅 {stats['postings']}개 ({stats['bytes'] / 1024:.0f}KB)")
+
+    if args.query:
+        query = ' '.join(args.query)
+        started = time.perf_counter()
+        results = index.search(query, args.since, args.until, args.sources, args.limit)
+        elapsed = time.perf_counter() - started
+        for count, item in enumerate(results, 1):
+            collected = datetime.fromtimestamp(item['collected_at']).strftime('%Y-%m-%d %H:%M')
+            print(f"{count:4d}. [{collected} | {item['source']}] {item['title']}")
+        print(f"\n🔎 '{query}': {len(results)}개 ({elapsed * 1000:.1f}ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
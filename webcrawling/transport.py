@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+모든 크롤러가 공유하는 HTTP 전송 계층
+크롤러 인스턴스마다 requests.Session을 새로 만들면 실행할 때마다 연결 풀과
+TLS 세션을 처음부터 다시 맺어야 합니다. 프로세스 전체에서 세션 하나를 공유해
+keep-alive 연결을 재사용하고, 모든 요청에 연결/읽기 타임아웃을 기본 적용합니다.
+요청마다 연결 시간과 첫 바이트까지의 시간을 response.timings에 남깁니다.
+일시적인 오류는 재시도하고, 계속 실패하는 소스는 회로 차단기로 잠시 건너뜁니다 (resilience.py).
+"""
+
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+import urllib3
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from cassette import cassette_from_env
+from resilience import ResilientAdapter
+
+
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+
+# (연결, 읽기) 타임아웃(초). 응답이 멈춘 호스트 하나가 전체 수집을 붙잡지 않도록 함
+DEFAULT_TIMEOUT = (5, 15)
+
+# 연결 풀을 유지할 호스트 수 / 호스트당 유지할 최대 연결 수 (host_pool_maxsize로 호스트마다 조정)
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 8
+
+
+class CrawlCancelled(Exception):
+    """취소 토큰으로 수집이 중단되었을 때 발생하는 예외"""
+
+
+class CancelToken:
+    """
+    여러 스레드가 함께 확인하는 협조적 취소 토큰
+    QThread.terminate()처럼 소켓 읽기 도중 스레드를 강제로 죽이지 않고,
+    요청 직전과 응답 조각을 읽을 때마다 확인해서 스스로 멈추게 합니다.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def wait(self, timeout):
+        """
+        최대 timeout초 동안 기다리다가 그 사이에 취소되면 바로 돌아옵니다 (time.sleep 대신 사용).
+
+        Returns:
+            bool: 취소되었으면 True
+        """
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self):
+        """취소되었으면 CrawlCancelled를 발생시킵니다."""
+        if self._event.is_set():
+            raise CrawlCancelled()
+
+
+def iter_chunks(response, chunk_size, cancel=None, stats=None):
+    """
+    스트리밍 응답을 조각 단위로 반환하면서 조각마다 취소 여부를 확인합니다.
+
+    Args:
+        response (requests.Response): stream=True 응답
+        chunk_size (int): 한 번에 읽을 바이트 수
+        cancel (CancelToken): 취소 토큰
+        stats (dict): 주어지면 'bytes'와 'download'(조각을 기다린 시간, 초)를 누적
+
+    Yields:
+        bytes: 응답 본문 조각
+    """
+    chunks = response.iter_content(chunk_size)
+    while True:
+        started = time.perf_counter()
+        chunk = next(chunks, None)
+        if stats is not None:
+            stats['download'] = stats.get('download', 0.0) + time.perf_counter() - started
+        if chunk is None:
+            return
+        if stats is not None:
+            stats['bytes'] = stats.get('bytes', 0) + len(chunk)
+        if cancel is not None:
+            cancel.raise_if_cancelled()
+        yield chunk
+
+
+def _accept_encoding():
+    """설치된 디코더에 맞춰 Accept-Encoding 값을 만듭니다 (brotli는 선택 사항)."""
+    encodings = ['gzip', 'deflate']
+    try:
+        import brotli  # noqa: F401
+        encodings.append('br')
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+            encodings.append('br')
+        except ImportError:
+            pass
+    return ', '.join(encodings)
+
+
+# 현재 스레드의 요청이 새 연결을 맺는 데 쓴 시간 (DNS+TCP+TLS)
+_connect_timing = threading.local()
+
+
+class _TimedConnectionMixin:
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect_timing.seconds = (getattr(_connect_timing, 'seconds', 0.0)
+                                       + time.perf_counter() - started)
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    timeout을 지정하지 않은 요청에 기본 타임아웃을 적용하는 어댑터
+    응답에 timings = {'connect', 'reused', 'ttfb'}(초)를 붙입니다.
+    """
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        _connect_timing.seconds = 0.0
+        started = time.perf_counter()
+        response = super().send(request, **kwargs)
+        connect = _connect_timing.seconds
+        response.timings = {
+            'connect': connect,
+            'reused': connect == 0.0,
+            # 요청 시작부터 응답 헤더 수신까지 (새 연결이면 연결 시간 포함)
+            'ttfb': time.perf_counter() - started,
+        }
+        return response
+
+
+def create_session(pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                   timeout=DEFAULT_TIMEOUT, verify=False, retry_policy=None, breakers=None,
+                   host_pool_maxsize=None):
+    """
+    연결 풀과 기본 타임아웃, 재시도/회로 차단이 설정된 세션을 만듭니다.
+
+    Args:
+        pool_connections (int): 연결 풀을 유지할 호스트 수 (넘으면 가장 오래 쓰지 않은 호스트의 풀을 닫음)
+        pool_maxsize (int): 호스트당 유지할 최대 연결 수 (동시 작업 수 이상 권장)
+        timeout (tuple): (연결, 읽기) 타임아웃(초)
+        verify (bool): SSL 인증서 검증 여부
+        retry_policy (RetryPolicy): 재시도 정책 (없으면 기본값)
+        breakers (CircuitBreakerBoard): 소스별 회로 차단기 (없으면 기본 차단기)
+        host_pool_maxsize (dict): {호스트: 최대 연결 수}. 지정한 호스트는 전용 어댑터(연결 풀)를
+                                  따로 붙여 pool_maxsize 대신 이 값을 씀 (예: {'search.naver.com': 16})
+
+    Returns:
+        requests.Session: 설정된 세션
+    """
+    session = requests.Session()
+
+    def make_adapter(maxsize, connections=pool_connections):
+        return ResilientAdapter(
+            TimeoutHTTPAdapter(timeout=timeout, pool_connections=connections, pool_maxsize=maxsize),
+            retry_policy, breakers,
+        )
+
+    adapter = make_adapter(pool_maxsize)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    # requests는 가장 긴 접두사의 어댑터를 고르므로 호스트 접두사가 기본 어댑터보다 우선
+    for host, maxsize in (host_pool_maxsize or {}).items():
+        host_adapter = make_adapter(maxsize, connections=1)
+        session.mount(f'https://{host}/', host_adapter)
+        session.mount(f'http://{host}/', host_adapter)
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept-Encoding': _accept_encoding(),
+        'Connection': 'keep-alive',
+    })
+    # SSL 인증서 검증 비활성화 (개발/테스트 목적)
+    session.verify = verify
+    if not verify:
+        # SSL 경고 메시지 숨기기
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    return session
+
+
+class BaseURLAdapter(BaseAdapter):
+    """요청 URL의 스킴/호스트를 기준 URL로 바꿔 보내는 어댑터 (원래 호스트는 경로 앞에 붙임)"""
+
+    def __init__(self, inner, base_url):
+        """
+        Args:
+            inner (HTTPAdapter): 실제 요청을 보낼 어댑터 (연결 풀/타임아웃 설정 유지)
+            base_url (str): 요청을 보낼 서버 주소 (예: http://127.0.0.1:8765)
+        """
+        super().__init__()
+        self.inner = inner
+        self.base_url = base_url.rstrip('/')
+
+    def rewrite(self, url):
+        if url.startswith(self.base_url + '/'):
+            return url
+        parts = urlsplit(url)
+        rewritten = f"{self.base_url}/{parts.netloc}{parts.path or '/'}"
+        return f"{rewritten}?{parts.query}" if parts.query else rewritten
+
+    def send(self, request, **kwargs):
+        request = request.copy()
+        request.url = self.rewrite(request.url)
+        return self.inner.send(request, **kwargs)
+
+    def close(self):
+        self.inner.close()
+
+
+def use_base_url(session, base_url):
+    """
+    세션의 모든 요청을 base_url 서버로 보냅니다. 크롤러가 만드는 URL, 캐시 키,
+    속도 제한, 계측 소스 이름은 원래 호스트 기준 그대로 유지됩니다.
+
+    Args:
+        session (requests.Session): 대상 세션
+        base_url (str): 요청을 보낼 서버 주소
+    """
+    # 호스트별 연결 풀 어댑터(create_session의 host_pool_maxsize)도 함께 바꿈
+    wrapped = set()
+    for prefix, adapter in list(session.adapters.items()):
+        if not prefix.startswith(('https://', 'http://')):
+            continue
+        if isinstance(adapter, ResilientAdapter):
+            # 재시도/회로 차단은 원래 URL(소스) 기준으로 판단하도록 그 아래에서 주소를 바꿈
+            # (http/https가 같은 어댑터를 공유하므로 한 번만)
+            if id(adapter) not in wrapped:
+                wrapped.add(id(adapter))
+                adapter.inner = BaseURLAdapter(adapter.inner, base_url)
+        else:
+            session.mount(prefix, BaseURLAdapter(adapter, base_url))
+
+
+def base_url_from_env(session):
+    """
+    NEWS_BASE_URL 환경 변수가 있으면 세션의 요청을 그 서버로 보냅니다.
+
+    Returns:
+        str: 적용한 기준 URL. 환경 변수가 없으면 None
+    """
+    base_url = os.environ.get('NEWS_BASE_URL')
+    if base_url:
+        use_base_url(session, base_url)
+    return base_url or None
+
+
+_default_session = None
+_default_session_lock = threading.Lock()
+
+
+def get_default_session():
+    """
+    모든 크롤러 클래스가 함께 사용하는 기본 세션을 반환합니다 (연결 재사용).
+    NEWS_BASE_URL 환경 변수가 있으면 모든 요청을 그 서버(mock_news_server.py 등)로 보내고,
+    NEWS_CASSETTE 환경 변수가 있으면 기록/재생 카세트를 연결합니다 (cassette.py 참고).
+    """
+    global _default_session
+    with _default_session_lock:
+        if _default_session is None:
+            _default_session = create_session()
+            base_url_from_env(_default_session)
+            cassette_from_env(_default_session)
+        return _default_session
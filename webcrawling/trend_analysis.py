@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+키워드 언급 추이 집계
+기사 저장소에 누적된 제목에서 삼성전자, SK하이닉스, HBM 같은 키워드가 시간/일별로
+소스마다 몇 번 언급되었는지 셉니다.
+
+- 제목/출처/수집 시각을 열(column) 단위 NumPy 배열로 읽어 키워드마다 한 번의 벡터 연산으로
+  포함 여부를 구하고, (소스, 시간 구간) 칸별 개수를 bincount로 한꺼번에 더합니다.
+- 집계는 시간 단위 (키워드 × 소스 × 시간) 배열 하나로 보관하고 일 단위는 여기서 합쳐 만듭니다.
+- 같은 제목이 여러 검색 키워드로 저장되어 있어도 소스마다 한 번만 셉니다.
+- 마지막으로 집계한 기사 ID와 배열을 .npz 파일에 저장해 두고, 다음 실행에서는 새로 저장된
+  기사만 더합니다.
+
+사용 예:
+    python trend_analysis.py                                    # 삼성전자, SK하이닉스, HBM 일별 추이
+    python trend_analysis.py -t 삼성전자 HBM 파운드리 --bucket hour --hours 48
+    python trend_analysis.py --by-source --csv trend.csv --xlsx trend.xlsx
+"""
+
+import argparse
+import csv
+import os
+import sqlite3
+import sys
+import time
+from contextlib import closing
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from article_store import get_default_store
+from batch_crawl import SOURCE_ALIASES
+from excel_export import StreamingExcelWriter
+
+
+DEFAULT_TERMS = ("삼성전자", "SK하이닉스", "HBM")
+DEFAULT_STATE_PATH = 'news_trends.npz'
+BUCKETS = ('hour', 'day')
+# 저장한 집계 상태 형식 (집계 방식이 바뀌면 올려서 이전 상태를 버림)
+STATE_VERSION = 2
+TOTAL_LABEL = "전체"
+
+# 한 번에 읽어 배열로 만들 기사 수 (제목 배열 크기: 기사 수 × MAX_TITLE_CHARS × 4바이트)
+UPDATE_BATCH = 50000
+# 비교에 쓸 제목 앞부분 길이 (고정 길이 문자열 배열이 긴 제목 하나 때문에 커지지 않도록)
+MAX_TITLE_CHARS = 200
+
+
+def normalize_term(term):
+    """
+    비교용 문자열 (소문자, 공백 문자 제거). 키워드와 제목에 똑같이 적용합니다.
+    """
+    return ''.join(term.lower().split())
+
+
+def _local_offset():
+    """현재 시스템 시간대의 UTC 오프셋(초)"""
+    return int(datetime.now().astimezone().utcoffset().total_seconds())
+
+
+def _hour_label(hour):
+    # hour는 현지 시각 기준 1970-01-01 00시부터의 시간 수
+    return datetime(1970, 1, 1) + timedelta(hours=int(hour))
+
+
+class TrendAnalyzer:
+    def __init__(self, terms=DEFAULT_TERMS, store=None, tz_offset=None):
+        """
+        Args:
+            terms (iterable): 집계할 키워드들 (대소문자/띄어쓰기 차이 무시)
+            store (ArticleStore): 기사 저장소 (없으면 기본 저장소)
+            tz_offset (int): 시간/일 구간을 나눌 시간대의 UTC 오프셋(초). 없으면 시스템 시간대
+        """
+        self.terms = tuple(terms)
+        self.store = store or get_default_store()
+        self.tz_offset = _local_offset() if tz_offset is None else int(tz_offset)
+        self._patterns = np.array([normalize_term(term) for term in self.terms])
+        self.reset()
+
+    def reset(self):
+        """집계를 비웁니다 (다음 update에서 저장소 전체를 다시 집계)."""
+        self.last_id = 0
+        self.sources = []
+        self._source_codes = {}
+        self.first_hour = 0
+        # (키워드, 소스, 시간) 칸별 언급 수
+        self.counts = np.zeros((len(self.terms), 0, 0), dtype=np.int64)
+
+    def _source_code(self, source):
+        code = self._source_codes.get(source)
+        if code is None:
+            code = self._source_codes[source] = len(self.sources)
+            self.sources.append(source)
+        return code
+
+    def _grow(self, sources, first_hour, last_hour):
+        """새 소스나 새 시간 구간이 들어갈 수 있도록 집계 배열을 넓힙니다."""
+        terms, old_sources, old_hours = self.counts.shape
+        if old_hours:
+            first_hour = min(first_hour, self.first_hour)
+            last_hour = max(last_hour, self.first_hour + old_hours - 1)
+        hours = last_hour - first_hour + 1
+        if (sources, hours) == (old_sources, old_hours):
+            return
+        counts = np.zeros((terms, sources, hours), dtype=np.int64)
+        if old_hours:
+            start = self.first_hour - first_hour
+            counts[:, :old_sources, start:start + old_hours] = self.counts
+        self.counts = counts
+        self.first_hour = first_hour
+
+    def _add(self, hours, source_codes, titles):
+        """
+        기사 묶음 하나를 집계에 더합니다.
+
+        Args:
+            hours (ndarray): 기사별 시간 구간 (현지 시각 기준 시간 수)
+            source_codes (ndarray): 기사별 소스 번호
+            titles (ndarray): 기사별 정규화한 제목
+        """
+        self._grow(len(self.sources), int(hours.min()), int(hours.max()))
+        sources, span = self.counts.shape[1:]
+        # (소스, 시간) 칸을 한 줄로 편 번호
+        cells = source_codes * span + (hours - self.first_hour)
+        for i, pattern in enumerate(self._patterns):
+            mentioned = np.char.find(titles, pattern) >= 0
+            self.counts[i] += np.bincount(cells[mentioned], minlength=sources * span).reshape(sources, span)
+
+    def update(self):
+        """
+        마지막 집계 이후 저장소에 추가된 기사를 집계에 더합니다.
+
+        Returns:
+            int: 새로 집계한 기사 수
+        """
+        added = 0
+        with closing(sqlite3.connect(self.store.path)) as conn:
+            while True:
+                # 같은 제목이 다른 키워드로 다시 저장된 행은 건너뜀 (소스별 첫 행만 집계)
+                rows = conn.execute(
+                    "SELECT id, CAST((collected_at + ?) / 3600 AS INTEGER), source, title "
+                    "FROM articles AS a WHERE id > ? AND NOT EXISTS ("
+                    "SELECT 1 FROM articles AS b WHERE b.title_hash = a.title_hash "
+                    "AND b.source = a.source AND b.id < a.id) ORDER BY id LIMIT ?",
+                    (self.tz_offset, self.last_id, UPDATE_BATCH)
+                ).fetchall()
+                if not rows:
+                    break
+                hours = np.fromiter((row[1] for row in rows), dtype=np.int64, count=len(rows))
+                names, inverse = np.unique([row[2] for row in rows], return_inverse=True)
+                codes = np.array([self._source_code(str(name)) for name in names], dtype=np.int64)
+                titles = [normalize_term(row[3])[:MAX_TITLE_CHARS] for row in rows]
+                width = max(map(len, titles)) or 1
+                titles = np.array(titles, dtype=f'U{width}')
+                self._add(hours, codes[inverse.ravel()], titles)
+                self.last_id = rows[-1][0]
+                added += len(rows)
+        return added
+
+    def series(self, bucket='day', by_source=False, since=None, until=None, sources=None):
+        """
+        구간별 언급 수를 반환합니다.
+
+        Args:
+            bucket (str): 'hour' 또는 'day'
+            by_source (bool): 소스별로 나눌지 여부 (False면 전체 합계 하나)
+            since (float): 이 시각(epoch 초) 이후 구간만
+            until (float): 이 시각(epoch 초) 이전 구간만
+            sources (iterable): 이 소스들만 (None이면 전체)
+
+        Returns:
+            tuple: (구간 시작 datetime 리스트, 소스 이름 리스트, 언급 수 배열 [소스, 구간, 키워드])
+        """
+        if bucket not in BUCKETS:
+            raise ValueError(f"알 수 없는 구간 단위: {bucket}")
+        counts = self.counts
+        first_hour = self.first_hour
+        labels = list(self.sources)
+        if sources is not None:
+            picked = [self._source_codes[name] for name in sources if name in self._source_codes]
+            counts = counts[:, picked]
+            labels = [self.sources[code] for code in picked]
+
+        # 시각 조건을 시간 구간 번호로 바꿔 자름
+        start, end = 0, counts.shape[2]
+        if since is not None:
+            start = max(start, int((since + self.tz_offset) // 3600) - first_hour)
+        if until is not None:
+            end = min(end, int(-(-(until + self.tz_offset) // 3600)) - first_hour)
+        if start >= end:
+            labels = labels if by_source else [TOTAL_LABEL]
+            return [], labels, np.zeros((len(labels), 0, len(self.terms)), dtype=np.int64)
+        counts = counts[:, :, start:end]
+        first_hour += start
+
+        if bucket == 'day':
+            # 앞뒤를 0으로 채워 하루(24칸) 단위로 접은 뒤 합산
+            lead = first_hour % 24
+            tail = -(lead + counts.shape[2]) % 24
+            counts = np.pad(counts, ((0, 0), (0, 0), (lead, tail)))
+            counts = counts.reshape(counts.shape[0], counts.shape[1], -1, 24).sum(axis=3)
+            first_hour -= lead
+            step = 24
+        else:
+            step = 1
+
+        if not by_source:
+            counts = counts.sum(axis=1, keepdims=True)
+            labels = [TOTAL_LABEL]
+        starts = [_hour_label(first_hour + i * step) for i in range(counts.shape[2])]
+        return starts, labels, counts.transpose(1, 2, 0)
+
+    def rows(self, bucket='day', by_source=False, since=None, until=None, sources=None):
+        """
+        보고서용 표를 만듭니다 (구간 순, 소스별이면 구간 안에서 소스 순).
+
+        Returns:
+            tuple: (헤더 튜플, 행 리스트) — 헤더는 ('구간', ['출처',] 키워드..., '합계')
+        """
+        starts, labels, counts = self.series(bucket, by_source, since, until, sources)
+        fmt = '%Y-%m-%d' if bucket == 'day' else '%Y-%m-%d %H:00'
+        headers = ('구간',) + (('출처',) if by_source else ()) + self.terms + ('합계',)
+        rows = []
+        for b, start in enumerate(starts):
+            for s, label in enumerate(labels):
+                values = [int(value) for value in counts[s, b]]
+                rows.append((start.strftime(fmt),) + ((label,) if by_source else ()) +
+                            tuple(values) + (sum(values),))
+        return headers, rows
+
+    def export_csv(self, filename, **options):
+        """
+        추이 표를 CSV로 저장합니다.
+
+        Args:
+            filename (str): 저장할 파일명
+            **options: rows()에 넘길 조건 (bucket, by_source, since, until, sources)
+
+        Returns:
+            int: 기록한 행 수
+        """
+        headers, rows = self.rows(**options)
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            writer.writerows(rows)
+        return len(rows)
+
+    def export_xlsx(self, filename, **options):
+        """
+        추이 표를 Excel 파일로 저장합니다.
+
+        Args:
+            filename (str): 저장할 파일명
+            **options: rows()에 넘길 조건 (bucket, by_source, since, until, sources)
+
+        Returns:
+            int: 기록한 행 수
+        """
+        headers, rows = self.rows(**options)
+        labels = 2 if options.get('by_source') else 1
+        widths = (18, 12)[:labels] + (14,) * (len(headers) - labels)
+        with StreamingExcelWriter(filename, headers=headers, column_widths=widths,
+                                  center_columns=tuple(range(labels)), sheet_title='키워드 추이') as writer:
+            writer.write_rows(rows)
+        return len(rows)
+
+    def save(self, path=DEFAULT_STATE_PATH):
+        """집계 상태를 .npz 파일로 저장합니다 (다음 실행에서 새 기사만 더하기 위해)."""
+        np.savez_compressed(
+            path, terms=np.array(self.terms), sources=np.array(self.sources, dtype=str),
+            counts=self.counts, meta=np.array([self.last_id, self.first_hour, self.tz_offset, STATE_VERSION],
+                                      dtype=np.int64)
+        )
+
+    def load(self, path=DEFAULT_STATE_PATH):
+        """
+        저장해 둔 집계 상태를 불러옵니다. 키워드, 시간대, 형식이 다르면 불러오지 않습니다.
+
+        Returns:
+            bool: 불러왔는지 여부
+        """
+        if not os.path.exists(path):
+            return False
+        with np.load(path) as state:
+            meta = [int(value) for value in state['meta']]
+            if len(meta) != 4 or meta[3] != STATE_VERSION:
+                return False
+            last_id, first_hour, tz_offset = meta[:3]
+            if tuple(state['terms'].tolist()) != self.terms or tz_offset != self.tz_offset:
+                return False
+            self.reset()
+            for source in state['sources'].tolist():
+                self._source_code(source)
+            self.counts = state['counts'].astype(np.int64)
+            self.first_hour = first_hour
+            self.last_id = last_id
+        return True
+
+
+def _parse_time(value):
+    return datetime.strptime(value, '%Y-%m-%d').timestamp() if value else None
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="수집한 뉴스 제목의 키워드 언급 추이 집계")
+    parser.add_argument('-t', '--terms', nargs='+', default=list(DEFAULT_TERMS),
+                        help=f"집계할 키워드들 (기본값: {' '.join(DEFAULT_TERMS)})")
+    parser.add_argument('--bucket', choices=BUCKETS, default='day', help="구간 단위 (기본값: day)")
+    parser.add_argument('--by-source', action='store_true', help="소스별로 나눠 집계")
+    parser.add_argument('-s', '--sources', nargs='+', default=None,
+                        help=f"소스들 ({', '.join(SOURCE_ALIASES)} 또는 출처 이름)")
+    parser.add_argument('--hours', type=float, help="최근 몇 시간만")
+    parser.add_argument('--since', help="이 날짜(YYYY-MM-DD)부터")
+    parser.add_argument('--until', help="이 날짜(YYYY-MM-DD) 전까지")
+    parser.add_argument('--tail', type=int, default=14, help="화면에 출력할 마지막 행 수 (기본값: 14)")
+    parser.add_argument('--csv', help="추이 표를 저장할 CSV 파일")
+    parser.add_argument('--xlsx', help="추이 표를 저장할 Excel 파일")
+    parser.add_argument('--state', default=DEFAULT_STATE_PATH,
+                        help=f"집계 상태 파일 (기본값: {DEFAULT_STATE_PATH})")
+    parser.add_argument('--rebuild', action='store_true', help="저장된 집계를 무시하고 처음부터 다시 집계")
+    args = parser.parse_args(argv)
+
+    if args.sources:
+        args.sources = [SOURCE_ALIASES.get(name.lower(), name) for name in args.sources]
+    try:
+        args.since = _parse_time(args.since)
+        args.until = _parse_time(args.until)
+    except ValueError as e:
+        parser.error(f"날짜 형식 오류 (YYYY-MM-DD): {e}")
+    if args.hours is not None:
+        args.since = max(args.since or 0.0, time.time() - args.hours * 3600)
+    return args
+
+
+def main(argv=None):
+    """키워드 추이 집계 실행 함수"""
+    args = parse_args(argv)
+    analyzer = TrendAnalyzer(args.terms)
+    if not args.rebuild:
+        analyzer.load(args.state)
+
+    started = time.perf_counter()
+    added = analyzer.update()
+    elapsed = time.perf_counter() - started
+    analyzer.save(args.state)
+    print(f"집계: 새 기사 {added}개 ({elapsed:.2f}초), 소스 {len(analyzer.sources)}개")
+
+    options = {'bucket': args.bucket, 'by_source': args.by_source, 'since': args.since,
+               'until': args.until, 'sources': args.sources}
+    headers, rows = analyzer.rows(**options)
+    print('\n' + ' | '.join(headers))
+    for row in rows[-args.tail:] if args.tail else rows:
+        print(' | '.join(str(value) for value in row))
+    if len(rows) > args.tail > 0:
+        print(f"... (전체 {len(rows)}행)")
+
+    if args.csv:
+        analyzer.export_csv(args.csv, **options)
+    if args.xlsx:
+        analyzer.export_xlsx(args.xlsx, **options)
+    for filename in (args.csv, args.xlsx):
+        if filename:
+            print(f"📁 저장된 파일: {filename}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())